@@ -3,7 +3,11 @@
 # Con WebSocket integrado para notificaciones en tiempo real
 # ============================================================
 
-from flask import Flask, session
+# eventlet/gevent exigen parchear antes de cualquier otro import
+import config
+config.parchear_async()
+
+from flask import Flask, session, request
 from flask_session import Session
 from datetime import datetime
 import threading
@@ -38,10 +42,13 @@ Session(app)
 try:
     from flask_socketio import SocketIO, emit, join_room, leave_room
     
+    # Modo y cola por entorno (ver config.py): con cola, varios workers web
+    # y el scraper suelto emiten a todos los clientes
     socketio = SocketIO(
         app,
         cors_allowed_origins="*",
-        async_mode='threading',
+        async_mode=config.SOCKETIO_ASYNC_MODE,
+        message_queue=config.SOCKETIO_MESSAGE_QUEUE,
         ping_interval=25,
         ping_timeout=60,
         logger=True,
@@ -49,7 +56,10 @@ try:
     )
     
     SOCKETIO_DISPONIBLE = True
-    logging.info("✅ SocketIO inicializado correctamente")
+    logging.info(
+        f"✅ SocketIO inicializado correctamente ({config.SOCKETIO_ASYNC_MODE}, "
+        f"cola: {config.SOCKETIO_MESSAGE_QUEUE or 'ninguna'})"
+    )
     
 except ImportError:
     SOCKETIO_DISPONIBLE = False
@@ -92,6 +102,10 @@ try:
     from backend.routes.auth_routes import auth_bp
     from backend.routes.admin_ia_routes import ia_bp
     from backend.services.auth_service import crear_usuario
+    from backend.services.clientes_service import (
+        registro_clientes, sala_categoria, SALA_TODAS
+    )
+    from backend.services.emisor_service import configurar_emisor, publicar_estadisticas
     
     # Registrar Blueprints
     app.register_blueprint(dashboard_bp)
@@ -113,21 +127,18 @@ except ImportError as e:
 
 if SOCKETIO_DISPONIBLE:
     
-    clientes_conectados = []
-    
     @socketio.on('connect')
     def handle_connect():
-        """Cuando un cliente se conecta"""
+        """Cuando un cliente se conecta (una entrada por pestaña: request.sid)"""
         cliente_id = session.get('user_id', 'anonimo')
-        clientes_conectados.append({
-            'id': cliente_id,
-            'timestamp': datetime.now()
-        })
+        registro_clientes.conectar(request.sid, cliente_id)
+        for sala in registro_clientes.salas_de(request.sid):
+            join_room(sala)
         
-        msg = f"✅ Cliente conectado: {cliente_id}"
+        msg = f"✅ Cliente conectado: {cliente_id} ({request.sid})"
         logging.info(msg)
         print(msg)
-        print(f"📊 Clientes activos: {len(clientes_conectados)}")
+        print(f"📊 Clientes activos: {registro_clientes.total()}")
         
         emit('conexion_exitosa', {
             'mensaje': 'Conectado al servidor de notificaciones',
@@ -137,19 +148,44 @@ if SOCKETIO_DISPONIBLE:
     @socketio.on('disconnect')
     def handle_disconnect():
         """Cuando un cliente se desconecta"""
-        cliente_id = session.get('user_id', 'anonimo')
-        clientes_conectados[:] = [c for c in clientes_conectados if c['id'] != cliente_id]
+        cliente = registro_clientes.desconectar(request.sid)
+        cliente_id = cliente['usuario'] if cliente else 'anonimo'
         
-        msg = f"❌ Cliente desconectado: {cliente_id}"
+        msg = f"❌ Cliente desconectado: {cliente_id} ({request.sid})"
         logging.info(msg)
         print(msg)
-        print(f"📊 Clientes activos: {len(clientes_conectados)}")
+        print(f"📊 Clientes activos: {registro_clientes.total()}")
     
     @socketio.on('mensaje')
     def handle_mensaje(data):
         """Recibir mensaje de cliente"""
         print(f"📨 Mensaje recibido: {data}")
         emit('respuesta', {'status': 'recibido'}, broadcast=False)
+
+    # ============================================================
+    # 📰 NOTICIAS NUEVAS DEL SCRAPER (salas por categoría)
+    # ============================================================
+
+    @socketio.on('suscribir')
+    def handle_suscribir(data):
+        """
+        El cliente elige qué noticias nuevas recibir.
+        data: {'categoria': 'Deportes'}; sin categoría → todas
+        """
+        categoria = ((data or {}).get('categoria') or '').strip()
+        sala = sala_categoria(categoria) if categoria else SALA_TODAS
+
+        # Una sala de noticias por pestaña: cambiar de categoría deja la anterior
+        for anterior in registro_clientes.salas_de(request.sid):
+            if anterior != sala and (anterior == SALA_TODAS or anterior.startswith('categoria:')):
+                leave_room(anterior)
+                registro_clientes.salir(request.sid, anterior)
+
+        join_room(sala)
+        registro_clientes.unirse(request.sid, sala)
+
+    # Noticias nuevas y estadísticas salen por emisor_service
+    configurar_emisor(socketio)
     
     # ============================================================
     # 🔔 FUNCIONES DE NOTIFICACIONES
@@ -245,13 +281,14 @@ if SOCKETIO_DISPONIBLE:
     
     def obtener_clientes_conectados():
         """Retorna la cantidad de clientes conectados."""
-        return len(clientes_conectados)
+        return registro_clientes.total()
     
     # Exportar funciones para ser usadas en api_routes.py
     app.notificar_noticia_nueva = notificar_noticia_nueva
     app.notificar_alerta_riesgo = notificar_alerta_riesgo
     app.enviar_notificacion_personalizada = enviar_notificacion_personalizada
     app.obtener_clientes_conectados = obtener_clientes_conectados
+    app.estado_clientes = registro_clientes.estado
 
 # ============================================================
 # 👤 CREAR USUARIO ADMIN AUTOMÁTICO (SOLO 1 VEZ)
@@ -267,9 +304,24 @@ except Exception as e:
 # 🤖 SCRAPER AUTOMÁTICO CADA 10 MINUTOS
 # ============================================================
 
+def ciclo_scraper():
+    """Un ciclo del scraper y, al terminar, el trabajo derivado que depende de él"""
+    run_scraper()
+
+    # Nubes de palabras listas antes de que las pidan (hilo aparte)
+    try:
+        from backend.services.wordcloud_service import cache_wordclouds
+        cache_wordclouds.prerenderizar_en_segundo_plano()
+    except Exception as e:
+        logging.error(f"❌ Error lanzando pre-render de wordclouds: {e}")
+
+    # Estadísticas de los paneles: una consulta por ciclo, sin importar cuántos estén abiertos
+    publicar_estadisticas()
+
+
 def ejecutar_scraper_periodico():
     """Ejecutar scraper cada 10 minutos en background"""
-    schedule.every(10).minutes.do(run_scraper)
+    schedule.every(10).minutes.do(ciclo_scraper)
     logging.info("⏱️ Scraper programado cada 10 minutos")
     
     while True:
@@ -322,7 +374,10 @@ def health_check():
         "status": "ok",
         "timestamp": datetime.now().isoformat(),
         "socketio": "activado" if SOCKETIO_DISPONIBLE else "desactivado",
-        "clientes_conectados": obtener_clientes_conectados() if SOCKETIO_DISPONIBLE else 0
+        "async_mode": config.SOCKETIO_ASYNC_MODE,
+        "cola_mensajes": bool(config.SOCKETIO_MESSAGE_QUEUE),
+        "clientes_conectados": obtener_clientes_conectados() if SOCKETIO_DISPONIBLE else 0,
+        "salas": registro_clientes.estado()["salas"] if SOCKETIO_DISPONIBLE else {}
     }
 
 @app.route('/logs/hoy')
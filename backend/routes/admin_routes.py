@@ -2,7 +2,8 @@ from flask import (
     Blueprint, render_template, session, redirect,
     request, flash, url_for
 )
-from db import execute_query
+from db import execute_query, escribir_noticia, listar_fuentes, notificar_cambio_noticias
+from backend.services.busqueda_service import filtro_texto
 from datetime import datetime
 import os
 
@@ -26,7 +27,7 @@ def admin_dashboard():
     # Totales generales
     stats = execute_query("""
         SELECT
-            (SELECT COUNT(*) FROM noticias)  AS total_noticias,
+            (SELECT COALESCE(SUM(total), 0) FROM resumen_noticias) AS total_noticias,
             (SELECT COUNT(*) FROM fuentes)   AS total_fuentes,
             (SELECT COUNT(*) FROM usuarios)  AS total_usuarios
     """, fetch=True)
@@ -105,11 +106,13 @@ def admin_noticias():
     params = []
 
     if q:
-        filtros.append("n.titulo LIKE %s")
-        params.append(f"%{q}%")
+        condicion, params_texto = filtro_texto(q)
+        if condicion:
+            filtros.append(condicion)
+            params.extend(params_texto)
 
     if fuente:
-        filtros.append("f.id = %s")
+        filtros.append("n.fuente_id = %s")
         params.append(fuente)
 
     if categoria:
@@ -123,21 +126,18 @@ def admin_noticias():
     sql = f"""
         SELECT
             n.id, n.titulo, n.categoria,
-            COALESCE(n.fecha_publicacion, n.fecha_registro) AS fecha,
+            n.fecha_efectiva AS fecha,
             f.nombre AS fuente
         FROM noticias n
         JOIN fuentes f ON n.fuente_id = f.id
         {where}
-        ORDER BY fecha DESC
+        ORDER BY n.fecha_efectiva DESC
         LIMIT 100;
     """
 
     noticias = execute_query(sql, tuple(params), fetch=True) or []
 
-    fuentes = execute_query(
-        "SELECT id, nombre FROM fuentes ORDER BY nombre;",
-        fetch=True
-    ) or []
+    fuentes = listar_fuentes()
 
     categorias_rows = execute_query("""
         SELECT DISTINCT categoria
@@ -164,10 +164,7 @@ def admin_noticias():
 # =========================================
 @admin_bp.route("/noticia/nueva", methods=["GET", "POST"])
 def admin_noticia_nueva():
-    fuentes = execute_query(
-        "SELECT id, nombre FROM fuentes ORDER BY nombre;",
-        fetch=True
-    ) or []
+    fuentes = listar_fuentes()
 
     if request.method == "POST":
         fuente_id = request.form.get("fuente_id")
@@ -202,15 +199,24 @@ def admin_noticia_nueva():
             VALUES (%s,%s,%s,%s,%s,%s,%s,%s,NOW());
         """
 
-        execute_query(
+        guardada = escribir_noticia(
             sql,
             (
                 int(fuente_id), titulo[:255], categoria, subtitulo,
                 descripcion, url_noticia, url_imagen, fecha_value
             ),
-            commit=True
+            "url_noticia = %s", (url_noticia,)
         )
 
+        if not guardada:
+            flash("No se pudo crear la noticia. Revisa que la URL no esté registrada.", "danger")
+            return render_template(
+                "admin/admin_noticia_form.html",
+                fuentes=fuentes,
+                noticia=None
+            )
+
+        notificar_cambio_noticias()
         flash("Noticia creada correctamente ✅", "success")
         return redirect(url_for("admin.admin_noticias"))
 
@@ -237,10 +243,7 @@ def admin_noticia_editar(noticia_id):
 
     noticia = res[0]
 
-    fuentes = execute_query(
-        "SELECT id, nombre FROM fuentes ORDER BY nombre;",
-        fetch=True
-    ) or []
+    fuentes = listar_fuentes()
 
     if request.method == "POST":
         fuente_id = request.form.get("fuente_id")
@@ -271,21 +274,31 @@ def admin_noticia_editar(noticia_id):
             UPDATE noticias SET
                 fuente_id=%s, titulo=%s, categoria=%s,
                 subtitulo=%s, descripcion=%s,
+                imagen_valida=IF(url_imagen <=> %s, imagen_valida, NULL),
                 url_noticia=%s, url_imagen=%s,
                 fecha_publicacion=%s
             WHERE id=%s;
         """
 
-        execute_query(
+        guardada = escribir_noticia(
             sql,
             (
                 int(fuente_id), titulo[:255], categoria, subtitulo,
-                descripcion, url_noticia, url_imagen,
+                descripcion, url_imagen, url_noticia, url_imagen,
                 fecha_value, noticia_id
             ),
-            commit=True
+            "id = %s", (noticia_id,)
         )
 
+        if not guardada:
+            flash("No se pudo actualizar la noticia. Revisa que la URL no esté registrada.", "danger")
+            return render_template(
+                "admin/admin_noticia_form.html",
+                fuentes=fuentes,
+                noticia=noticia
+            )
+
+        notificar_cambio_noticias()
         flash("Noticia actualizada correctamente ✅", "success")
         return redirect(url_for("admin.admin_noticias"))
 
@@ -306,9 +319,14 @@ def admin_noticia_editar(noticia_id):
 # =========================================
 @admin_bp.route("/noticia/eliminar/<int:noticia_id>", methods=["POST"])
 def admin_noticia_eliminar(noticia_id):
-    execute_query(
-        "DELETE FROM noticias WHERE id = %s",
-        (noticia_id,), commit=True
+    eliminada = escribir_noticia(
+        "DELETE FROM noticias WHERE id = %s", (noticia_id,),
+        "id = %s", (noticia_id,)
     )
+    if not eliminada:
+        flash("No se pudo eliminar la noticia.", "danger")
+        return redirect(url_for("admin.admin_noticias"))
+
+    notificar_cambio_noticias()
     flash("Noticia eliminada correctamente 🗑️", "info")
     return redirect(url_for("admin.admin_noticias"))
@@ -4,11 +4,35 @@
 
 from flask import Blueprint, request, jsonify, Response, session, current_app
 from db import execute_query
-from collections import Counter
-from backend.services.wordcloud_service import generar_wordcloud, limpiar_texto
+from backend.services.wordcloud_service import cache_wordclouds, clave_wordcloud, FORMATOS as FORMATOS_WORDCLOUD
+from backend.services.terminos_service import frecuencias as frecuencias_terminos
+from backend.services.cache_service import cache_respuesta
+from backend.services import resumen_service
+from backend.services.noticia_service import obtener_pagina_noticias, CursorInvalido
+from backend.services.busqueda_service import buscar_noticias
+from backend.services.estadisticas_service import sentimiento_panel, noticias_por_dia
+from backend.services.alertas_service import monitor_alertas, obtener_alertas, DIAS_ALERTAS
 
 api_bp = Blueprint("api", __name__, url_prefix="/api")
 
+TTL_NAVEGADOR_WORDCLOUD = 300   # segundos que el navegador reutiliza la imagen
+MAX_POR_PAGINA = 50
+MAX_PAGINAS = 50                # /api/noticias sin cursor pagina con OFFSET
+
+
+def _dias_param(defecto=None):
+    """?dias=N entre 1 y 365; `defecto` si falta o no es válido."""
+    try:
+        dias = int(request.args.get("dias", ""))
+        return dias if 0 < dias <= 365 else defecto
+    except ValueError:
+        return defecto
+
+
+def _entero_param(nombre, defecto, maximo):
+    """?nombre=N acotado a [1, maximo]; `defecto` si falta o no es numérico."""
+    return min(max(request.args.get(nombre, defecto, type=int), 1), maximo)
+
 # ============================================================
 # 🔹 1. NOTICIAS (PAGINACIÓN + FILTROS)
 # ============================================================
@@ -17,41 +41,61 @@ api_bp = Blueprint("api", __name__, url_prefix="/api")
 def api_noticias():
     fuente = request.args.get("fuente", "").strip()
     categoria = request.args.get("categoria", "").strip()
-    page = int(request.args.get("page", 1))
-    per_page = int(request.args.get("per_page", 12))
-
-    offset = (page - 1) * per_page
-
-    sql = """
-        SELECT 
-            n.id, n.titulo, n.url_imagen, n.url_noticia,
-            n.categoria, n.fecha_publicacion,
-            f.nombre AS fuente
-        FROM noticias n
-        JOIN fuentes f ON n.fuente_id = f.id
-        WHERE (%s = '' OR f.nombre = %s)
-        AND (%s = '' OR n.categoria = %s)
-        ORDER BY COALESCE(n.fecha_publicacion, n.fecha_registro) DESC
-        LIMIT %s OFFSET %s;
-    """
-    params = (fuente, fuente, categoria, categoria, per_page, offset)
-    data = execute_query(sql, params, fetch=True)
+    cursor = request.args.get("cursor", "").strip() or None
+    page = _entero_param("page", 1, MAX_PAGINAS)
+    per_page = _entero_param("per_page", 12, MAX_POR_PAGINA)
+
+    try:
+        data, next_cursor = obtener_pagina_noticias(
+            fuente, categoria, per_page, cursor, page,
+            columnas="n.titulo, "
+                     "IF(n.imagen_valida = 0, '', n.url_imagen) AS url_imagen, "
+                     "n.url_noticia, n.categoria, n.fecha_publicacion"
+        )
+    except CursorInvalido as e:
+        return jsonify({"error": str(e)}), 400
 
     return jsonify({
         "page": page,
         "per_page": per_page,
         "total": len(data),
+        "next_cursor": next_cursor,
         "data": data
     })
 
 
+# ============================================================
+# 🔹 1.1 BÚSQUEDA DE TEXTO COMPLETO (RELEVANCIA)
+# ============================================================
+
+# Sin cache_respuesta: cada consulta es distinta y solo desplazaría del
+# caché compartido a las respuestas de /api/stats.
+@api_bp.get("/buscar")
+def api_buscar():
+    q = request.args.get("q", "").strip()
+    if not q:
+        return jsonify({"error": "Falta el parámetro q"}), 400
+
+    resultado = buscar_noticias(
+        q,
+        page=request.args.get("page", 1, type=int),           # buscar_noticias acota ambos
+        per_page=request.args.get("per_page", 20, type=int),
+        categoria=request.args.get("categoria", "").strip(),
+        fuente=request.args.get("fuente", "").strip()
+    )
+    resultado["q"] = q
+    resultado["total"] = len(resultado["data"])
+
+    return jsonify(resultado)
+
+
 # ============================================================
 # 🔹 2. NOTICIAS SOLO FACEBOOK
 # ============================================================
 
 @api_bp.get("/facebook")
 def api_facebook():
-    limit = int(request.args.get("limit", 6))
+    limit = _entero_param("limit", 6, MAX_POR_PAGINA)
 
     sql = """
         SELECT 
@@ -60,7 +104,7 @@ def api_facebook():
         FROM noticias n
         JOIN fuentes f ON n.fuente_id = f.id
         WHERE f.nombre = 'Facebook'
-        ORDER BY COALESCE(n.fecha_publicacion, n.fecha_registro) DESC
+        ORDER BY n.fecha_efectiva DESC
         LIMIT %s;
     """
     data = execute_query(sql, (limit,), fetch=True)
@@ -72,16 +116,9 @@ def api_facebook():
 # ============================================================
 
 @api_bp.get("/stats/general")
+@cache_respuesta()
 def api_stats_general():
-    sql = """
-        SELECT 
-            COUNT(*) AS total_noticias,
-            COUNT(DISTINCT fuente_id) AS total_fuentes,
-            COUNT(DISTINCT categoria) AS total_categorias
-        FROM noticias;
-    """
-    data = execute_query(sql, fetch=True)[0]
-    return jsonify(data)
+    return jsonify(resumen_service.totales_generales())
 
 
 # ============================================================
@@ -89,15 +126,9 @@ def api_stats_general():
 # ============================================================
 
 @api_bp.get("/stats/categorias")
+@cache_respuesta()
 def api_stats_categorias():
-    rows = execute_query("""
-        SELECT COALESCE(categoria, 'Sin categoría') AS categoria,
-               COUNT(*) AS total
-        FROM noticias
-        GROUP BY categoria
-        ORDER BY total DESC;
-    """, fetch=True) or []
-    return jsonify(rows)
+    return jsonify(resumen_service.conteo_por_categoria())
 
 
 # ============================================================
@@ -105,16 +136,9 @@ def api_stats_categorias():
 # ============================================================
 
 @api_bp.get("/stats/fuentes")
+@cache_respuesta()
 def api_stats_fuentes():
-    rows = execute_query("""
-        SELECT f.nombre AS fuente,
-               COUNT(*) AS total
-        FROM noticias n
-        JOIN fuentes f ON n.fuente_id = f.id
-        GROUP BY f.nombre
-        ORDER BY total DESC;
-    """, fetch=True) or []
-    return jsonify(rows)
+    return jsonify(resumen_service.conteo_por_fuente())
 
 
 # ============================================================
@@ -122,37 +146,13 @@ def api_stats_fuentes():
 # ============================================================
 
 @api_bp.get("/stats/sentimiento")
+@cache_respuesta()
 def api_stats_sentimiento():
-
-    sql = """
-        SELECT titulo, descripcion
-        FROM noticias
-        ORDER BY COALESCE(fecha_publicacion, fecha_registro) DESC
-        LIMIT 300;
     """
-    rows = execute_query(sql, fetch=True) or []
-
-    positivos_palabras = ["bueno", "mejora", "éxito", "logra", "ganó", "positivo", "avance", "crece", "récord", "beneficio"]
-    negativos_palabras = ["malo", "crisis", "muere", "caída", "pérdida", "negativo", "accidente", "corrupción", "protesta", "denuncia"]
-
-    def score(texto):
-        text = texto.lower()
-        return sum(p in text for p in positivos_palabras) - sum(n in text for n in negativos_palabras)
-
-    pos = neg = neu = 0
-
-    for r in rows:
-        text = f"{r.get('titulo','')} {r.get('descripcion','')}"
-        s = score(text)
-
-        if s > 0:
-            pos += 1
-        elif s < 0:
-            neg += 1
-        else:
-            neu += 1
-
-    return jsonify({"positivos": pos, "negativos": neg, "neutros": neu})
+    Sentimiento guardado de las noticias.
+    Query: ?dias=N (1–365) → todo ese rango; sin dias → últimas 300
+    """
+    return jsonify(sentimiento_panel(_dias_param()))
 
 
 # ============================================================
@@ -160,67 +160,17 @@ def api_stats_sentimiento():
 # ============================================================
 
 @api_bp.get("/stats/wordcloud")
+@cache_respuesta()
 def api_stats_wordcloud():
 
-    categoria = request.args.get("categoria", "").strip()
-    fuente = request.args.get("fuente", "").strip()
-    dias = request.args.get("dias", "").strip()
-    query = (request.args.get("q", "") or request.args.get("query", "")).strip()
-
-    sql = """
-        SELECT n.titulo, n.descripcion
-        FROM noticias n
-        JOIN fuentes f ON n.fuente_id = f.id
-    """
-
-    filtros = []
-    params = []
-
-    if categoria:
-        filtros.append("n.categoria = %s")
-        params.append(categoria)
-
-    if fuente:
-        filtros.append("f.nombre = %s")
-        params.append(fuente)
-
-    if dias:
-        try:
-            num = int(dias)
-            if 0 < num <= 365:
-                filtros.append(
-                    f"COALESCE(n.fecha_publicacion, n.fecha_registro) >= NOW() - INTERVAL {num} DAY"
-                )
-        except:
-            pass
-
-    if query:
-        filtros.append("(n.titulo LIKE %s OR n.descripcion LIKE %s)")
-        like = f"%{query}%"
-        params.extend([like, like])
-
-    if filtros:
-        sql += " WHERE " + " AND ".join(filtros)
-
-    sql += """
-        ORDER BY COALESCE(n.fecha_publicacion, n.fecha_registro) DESC
-        LIMIT 500;
-    """
-
-    rows = execute_query(sql, tuple(params), fetch=True) or []
-
-    texto_bruto = " ".join(
-        f"{r.get('titulo', '')} {r.get('descripcion', '')}"
-        for r in rows
+    conteo = frecuencias_terminos(
+        categoria=request.args.get("categoria", "").strip(),
+        fuente=request.args.get("fuente", "").strip(),
+        dias=request.args.get("dias", "").strip(),
+        query=(request.args.get("q", "") or request.args.get("query", "")).strip(),
+        limite=80
     )
 
-    texto_limpio = limpiar_texto(texto_bruto)
-    if not texto_limpio.strip():
-        return jsonify([])
-
-    palabras = texto_limpio.split()
-    conteo = Counter(palabras).most_common(80)
-
     return jsonify([
         {"text": palabra, "value": int(freq)}
         for palabra, freq in conteo
@@ -234,66 +184,23 @@ def api_stats_wordcloud():
 @api_bp.get("/stats/wordcloud_image")
 def api_wordcloud_image():
 
-    categoria = request.args.get("categoria", "").strip()
-    fuente = request.args.get("fuente", "").strip()
-    dias = request.args.get("dias", "").strip()
-    query = (request.args.get("q", "") or request.args.get("query", "")).strip()
-
-    sql = """
-        SELECT n.titulo, n.descripcion
-        FROM noticias n
-        JOIN fuentes f ON n.fuente_id = f.id
-    """
-
-    filtros = []
-    params = []
-
-    if categoria:
-        filtros.append("n.categoria = %s")
-        params.append(categoria)
-
-    if fuente:
-        filtros.append("f.nombre = %s")
-        params.append(fuente)
-
-    if dias:
-        try:
-            num = int(dias)
-            if 0 < num <= 365:
-                filtros.append(
-                    f"COALESCE(n.fecha_publicacion, n.fecha_registro) >= NOW() - INTERVAL {num} DAY"
-                )
-        except:
-            pass
-
-    if query:
-        filtros.append("(n.titulo LIKE %s OR n.descripcion LIKE %s)")
-        like = f"%{query}%"
-        params.extend([like, like])
-
-    if filtros:
-        sql += " WHERE " + " AND ".join(filtros)
-
-    sql += """
-        ORDER BY COALESCE(n.fecha_publicacion, n.fecha_registro) DESC
-        LIMIT 500;
-    """
-
-    rows = execute_query(sql, tuple(params), fetch=True) or []
-
-    texto = " ".join(
-        f"{r.get('titulo','')} {r.get('descripcion','')}"
-        for r in rows
+    clave = clave_wordcloud(
+        request.args.get("categoria", ""),
+        request.args.get("fuente", ""),
+        request.args.get("dias", ""),
+        request.args.get("q", "") or request.args.get("query", ""),
+        formato=request.args.get("formato", ""),
+        ancho=request.args.get("ancho", "")
     )
 
-    if not texto.strip():
-        return "", 204
-
-    img = generar_wordcloud(texto)
-    if not img:
+    imagen, etag = cache_wordclouds.obtener(clave)
+    if not imagen:
         return "", 204
 
-    return Response(img.getvalue(), mimetype="image/png")
+    resp = Response(imagen, mimetype=FORMATOS_WORDCLOUD[clave[4]][1])
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = f"private, max-age={TTL_NAVEGADOR_WORDCLOUD}"
+    return resp.make_conditional(request)
 
 
 # ============================================================
@@ -301,51 +208,16 @@ def api_wordcloud_image():
 # ============================================================
 
 @api_bp.get("/stats/alertas")
+@cache_respuesta()
 def api_stats_alertas():
-
-    palabras_riesgo = [
-        "muerte", "asesinato", "homicidio", "violación", "abuso",
-        "tragedia", "accidente", "choque", "heridos", "incendio",
-        "corrupción", "robo", "asalto", "crimen", "secuestro",
-        "desastre", "protesta", "enfrentamiento"
-    ]
-
-    rows = execute_query("""
-        SELECT 
-            n.id, n.titulo, n.descripcion, n.categoria,
-            COALESCE(n.fecha_publicacion, n.fecha_registro) AS fecha,
-            f.nombre AS fuente
-        FROM noticias n
-        JOIN fuentes f ON n.fuente_id = f.id
-        ORDER BY fecha DESC
-        LIMIT 200;
-    """, fetch=True) or []
-
-    alertas = []
-
-    for r in rows:
-        text = f"{r.get('titulo','')} {r.get('descripcion','')}".lower()
-        count = sum(1 for p in palabras_riesgo if p in text)
-
-        if count == 0:
-            continue
-
-        nivel = "alto" if count >= 4 else "medio" if count >= 2 else "bajo"
-
-        alertas.append({
-            "id": r["id"],
-            "titulo": r["titulo"],
-            "categoria": r["categoria"],
-            "fuente": r["fuente"],
-            "fecha": r["fecha"].strftime("%Y-%m-%d %H:%M") if r.get("fecha") else "",
-            "nivel": nivel,
-            "conteo": count
-        })
-
-    level_sort = {"alto": 0, "medio": 1, "bajo": 2}
-    alertas.sort(key=lambda x: (level_sort[x["nivel"]], -x["conteo"]))
-
-    return jsonify(alertas[:30])
+    """
+    Noticias con riesgo, de mayor a menor nivel.
+    Query: ?dias=N (1–365). Sin dias (o 7) se sirve el ranking en memoria.
+    """
+    dias = _dias_param(DIAS_ALERTAS)
+    if dias == DIAS_ALERTAS:
+        return jsonify(monitor_alertas.obtener())
+    return jsonify(obtener_alertas(dias=dias))
 
 
 # ============================================================
@@ -353,31 +225,13 @@ def api_stats_alertas():
 # ============================================================
 
 @api_bp.get("/stats/noticias_dia")
+@cache_respuesta()
 def api_stats_noticias_dia():
     """
     Devuelve la cantidad de noticias publicadas por día
     en los últimos 30 días (según fecha_publicacion o fecha_registro).
     """
-    sql = """
-        SELECT 
-            DATE(COALESCE(fecha_publicacion, fecha_registro)) AS fecha,
-            COUNT(*) AS total
-        FROM noticias
-        WHERE COALESCE(fecha_publicacion, fecha_registro) >= CURDATE() - INTERVAL 30 DAY
-        GROUP BY DATE(COALESCE(fecha_publicacion, fecha_registro))
-        ORDER BY fecha ASC;
-    """
-    rows = execute_query(sql, fetch=True) or []
-
-    data = [
-        {
-            "fecha": r["fecha"].strftime("%Y-%m-%d") if r.get("fecha") else "",
-            "total": int(r["total"])
-        }
-        for r in rows
-    ]
-
-    return jsonify(data)
+    return jsonify(noticias_por_dia(30))
 
 
 # ============================================================
@@ -524,12 +378,14 @@ def api_estado_notificaciones():
     if session.get("rol") != "admin":
         return jsonify({"error": "No autorizado"}), 403
 
-    clientes = 0
-    if hasattr(current_app, 'obtener_clientes_conectados'):
-        clientes = current_app.obtener_clientes_conectados()
+    estado = {"clientes": 0, "usuarios": 0, "salas": {}}
+    if hasattr(current_app, 'estado_clientes'):
+        estado = current_app.estado_clientes()
 
     return jsonify({
-        "clientes_conectados": clientes,
+        "clientes_conectados": estado["clientes"],
+        "usuarios_conectados": estado["usuarios"],
+        "salas": estado["salas"],
         "servidor": "activo",
         "notificaciones": "habilitadas"
     })
\ No newline at end of file
@@ -1,7 +1,9 @@
 # backend/routes/home_routes.py
 
 from flask import Blueprint, render_template, request
-from db import execute_query
+from db import execute_query, listar_fuentes
+from backend.services import resumen_service
+from backend.services.noticia_service import obtener_pagina_noticias, CursorInvalido
 from datetime import datetime
 
 home_bp = Blueprint("home", __name__)
@@ -10,8 +12,7 @@ home_bp = Blueprint("home", __name__)
 # 📌 Funciones internas del controlador
 # ----------------------------------------------------
 def obtener_fuentes():
-    sql = "SELECT id, nombre FROM fuentes ORDER BY nombre;"
-    return execute_query(sql, fetch=True) or []
+    return listar_fuentes()
 
 def obtener_categorias():
     sql = """
@@ -30,47 +31,26 @@ def obtener_publicaciones_fb(limit=6):
         FROM noticias n
         JOIN fuentes f ON n.fuente_id = f.id
         WHERE f.nombre = 'Facebook'
-        ORDER BY COALESCE(n.fecha_publicacion, n.fecha_registro) DESC
+        ORDER BY n.fecha_efectiva DESC
         LIMIT %s;
     """
     return execute_query(sql, (limit,), fetch=True) or []
 
 def obtener_estadisticas():
-    sql = """
-        SELECT COUNT(*) AS total_noticias,
-               COUNT(DISTINCT fuente_id) AS total_fuentes,
-               COUNT(DISTINCT categoria) AS total_categorias
-        FROM noticias;
-    """
-    res = execute_query(sql, fetch=True)
-    return res[0] if res else {}
-
-def obtener_noticias(categoria="", page=1, per_page=12):
-    offset = (page - 1) * per_page
+    return resumen_service.totales_generales()
 
-    sql = """
-        SELECT 
-            n.titulo, n.descripcion, n.url_imagen, n.url_noticia,
-            n.fecha_publicacion, n.categoria,
-            f.nombre AS fuente
-        FROM noticias n
-        JOIN fuentes f ON n.fuente_id = f.id
-        WHERE (%s = '' OR n.categoria = %s)
-        ORDER BY COALESCE(n.fecha_publicacion, n.fecha_registro) DESC
-        LIMIT %s OFFSET %s;
-    """
-    params = (categoria, categoria, per_page, offset)
-    data = execute_query(sql, params, fetch=True) or []
+def obtener_noticias(categoria="", page=1, per_page=12, cursor=None):
+    data, next_cursor = obtener_pagina_noticias(
+        categoria=categoria, per_page=per_page, cursor=cursor, page=page,
+        columnas="n.titulo, n.descripcion, "
+                 "IF(n.imagen_valida = 0, '', n.url_imagen) AS url_imagen, "
+                 "n.url_noticia, n.fecha_publicacion, n.categoria"
+    )
 
-    sql_count = """
-        SELECT COUNT(*) AS total
-        FROM noticias
-        WHERE (%s = '' OR categoria = %s)
-    """
-    total = execute_query(sql_count, (categoria, categoria), fetch=True)[0]["total"]
+    total = resumen_service.total_noticias(categoria)
     total_pages = (total // per_page) + (1 if total % per_page else 0)
 
-    return data, total, total_pages
+    return data, total, total_pages, next_cursor
 
 
 # ----------------------------------------------------
@@ -80,11 +60,17 @@ def obtener_noticias(categoria="", page=1, per_page=12):
 def home():
     categoria = request.args.get("categoria", "").strip()
     page = int(request.args.get("page", 1))
+    cursor = request.args.get("cursor", "").strip() or None
 
-    noticias, total, total_paginas = obtener_noticias(
-        categoria=categoria,
-        page=page
-    )
+    try:
+        noticias, total, total_paginas, next_cursor = obtener_noticias(
+            categoria=categoria,
+            page=page,
+            cursor=cursor
+        )
+    except CursorInvalido:
+        # Cursor viejo o manipulado: volver a la primera página
+        noticias, total, total_paginas, next_cursor = obtener_noticias(categoria=categoria)
 
     return render_template(
         "index.html",
@@ -94,5 +80,6 @@ def home():
         publicaciones_fb=obtener_publicaciones_fb(),
         stats=obtener_estadisticas(),
         total_noticias_filtradas=total,
-        total_paginas=total_paginas
+        total_paginas=total_paginas,
+        next_cursor=next_cursor
     )
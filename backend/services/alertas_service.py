@@ -0,0 +1,231 @@
+# ============================================================
+# 🚨 alertas_service.py — Motor de alertas de riesgo
+# ============================================================
+#
+# - evaluar_riesgo: una sola expresión compilada con palabra completa
+#   ("robo" no coincide con "robot") y tildes opcionales en el texto
+#   ("corrupcion" = "corrupción"). Se evalúa al guardar cada noticia
+#   (db._indexar) y queda en noticias.riesgo_nivel / riesgo_conteo.
+# - monitor_alertas: ranking en memoria de las alertas más graves,
+#   alimentado por cada escritura; /api/stats/alertas lo sirve sin
+#   volver a consultar ni ordenar.
+# ============================================================
+
+from db import execute_query, listar_fuentes
+from backend.services.sentimiento_service import compilar_lexico
+from datetime import datetime, timedelta
+import heapq
+import logging
+import threading
+import time
+
+# Palabra de riesgo → formas que cuentan como ella (palabra completa)
+PALABRAS_RIESGO = {
+    "muerte": ["muerte", "muertes"],
+    "asesinato": ["asesinato", "asesinatos", "asesinada", "asesinado", "asesinadas", "asesinados"],
+    "homicidio": ["homicidio", "homicidios"],
+    "violación": ["violación", "violaciones"],
+    "abuso": ["abuso", "abusos"],
+    "tragedia": ["tragedia", "tragedias"],
+    "accidente": ["accidente", "accidentes"],
+    "choque": ["choque", "choques"],
+    "heridos": ["herido", "herida", "heridos", "heridas"],
+    "incendio": ["incendio", "incendios"],
+    "corrupción": ["corrupción"],
+    "robo": ["robo", "robos"],
+    "asalto": ["asalto", "asaltos"],
+    "crimen": ["crimen", "crímenes"],
+    "secuestro": ["secuestro", "secuestros", "secuestrada", "secuestrado", "secuestradas", "secuestrados"],
+    "desastre": ["desastre", "desastres"],
+    "protesta": ["protesta", "protestas"],
+    "enfrentamiento": ["enfrentamiento", "enfrentamientos"],
+}
+
+# Un grupo por palabra: así se cuentan palabras distintas en una pasada
+RE_RIESGO = compilar_lexico(
+    {f"p{i}": formas for i, formas in enumerate(PALABRAS_RIESGO.values())}
+)
+
+NIVELES = {1: "bajo", 2: "medio", 3: "alto"}
+
+
+def nivel_riesgo(conteo):
+    """0 sin riesgo, 1 bajo, 2 medio (2-3 palabras), 3 alto (4 o más)."""
+    if conteo >= 4:
+        return 3
+    if conteo >= 2:
+        return 2
+    return 1 if conteo else 0
+
+
+def evaluar_riesgo(texto):
+    """Retorna (riesgo_nivel, riesgo_conteo) de un texto."""
+    encontradas = {m.lastgroup for m in RE_RIESGO.finditer((texto or "").lower())}
+    return nivel_riesgo(len(encontradas)), len(encontradas)
+
+
+# ============================================================
+# 📋 Alertas guardadas
+# ============================================================
+def _formatear(fila, fuente):
+    fecha = fila.get("fecha_efectiva")
+    return {
+        "id": fila["id"],
+        "titulo": fila["titulo"],
+        "categoria": fila["categoria"],
+        "fuente": fuente,
+        "fecha": fecha.strftime("%Y-%m-%d %H:%M") if fecha else "",
+        "nivel": NIVELES[fila["riesgo_nivel"]],
+        "conteo": fila["riesgo_conteo"]
+    }
+
+
+def _filas_alertas(dias, limite):
+    return execute_query("""
+        SELECT
+            n.id, n.titulo, n.categoria, n.fecha_efectiva,
+            n.riesgo_nivel, n.riesgo_conteo,
+            f.nombre AS fuente
+        FROM noticias n
+        JOIN fuentes f ON n.fuente_id = f.id
+        WHERE n.riesgo_nivel > 0
+          AND n.fecha_efectiva >= NOW() - INTERVAL %s DAY
+        ORDER BY n.riesgo_nivel DESC, n.riesgo_conteo DESC, n.fecha_efectiva DESC
+        LIMIT %s;
+    """, (dias, limite), fetch=True) or []
+
+
+def obtener_alertas(dias=7, limite=30):
+    """
+    Noticias con riesgo de los últimos `dias`, de mayor a menor nivel
+    (y por conteo y fecha dentro del mismo nivel). Consulta la BD.
+    """
+    return [_formatear(r, r["fuente"]) for r in _filas_alertas(dias, limite)]
+
+
+# ============================================================
+# 🏆 Ranking en memoria (top-N)
+# ============================================================
+TOP_ALERTAS = 30        # alertas servidas por /api/stats/alertas
+DIAS_ALERTAS = 7        # antigüedad máxima de una alerta
+TTL_ALERTAS = 5 * 60    # segundos; recarga desde la BD (escrituras de otros procesos)
+
+
+class MonitorAlertas:
+    """
+    Las `limite` alertas más graves de los últimos `dias`.
+
+    - actualizar() recibe las noticias recién evaluadas y las mete en un
+      min-heap acotado: la más leve del ranking sale primero.
+    - obtener() devuelve el ranking ya ordenado, O(1).
+    - Si una noticia del ranking se elimina, baja de puntaje o caduca, el
+      heap ya no sabe cuál era la siguiente: se recarga desde la BD
+      (índice idx_riesgo).
+    """
+
+    def __init__(self, limite=TOP_ALERTAS, dias=DIAS_ALERTAS, ttl=TTL_ALERTAS):
+        self.limite = limite
+        self.dias = dias
+        self.ttl = ttl
+        self._heap = []             # [(clave, id)] min-heap; clave = (nivel, conteo, fecha, id)
+        self._claves = {}           # {id: clave} de las noticias en el ranking
+        self._alertas = {}          # {id: alerta formateada}
+        self._ranking = []
+        self._caduca = None         # fecha en que la alerta más antigua sale de la ventana
+        self._cargado_en = None
+        self._lock = threading.Lock()
+
+    def _vigente(self):
+        return (
+            self._cargado_en is not None
+            and time.monotonic() - self._cargado_en < self.ttl
+            and (self._caduca is None or datetime.now() < self._caduca)
+        )
+
+    def _poner(self, clave, alerta):
+        self._claves[alerta["id"]] = clave
+        self._alertas[alerta["id"]] = alerta
+
+    def _cargar(self):
+        self._claves, self._alertas = {}, {}
+        for r in _filas_alertas(self.dias, self.limite):
+            self._poner(self._clave(r), _formatear(r, r["fuente"]))
+        self._publicar()
+        self._cargado_en = time.monotonic()
+
+    @staticmethod
+    def _clave(fila):
+        return (fila["riesgo_nivel"], fila["riesgo_conteo"], fila["fecha_efectiva"], fila["id"])
+
+    def _publicar(self):
+        """Rehace el heap y deja listo el ranking que sirve obtener()."""
+        self._heap = [(clave, i) for i, clave in self._claves.items()]
+        heapq.heapify(self._heap)
+        orden = sorted(self._claves, key=self._claves.get, reverse=True)
+        self._ranking = [self._alertas[i] for i in orden]
+        self._caduca = min(
+            (c[2] for c in self._claves.values()), default=None
+        )
+        if self._caduca:
+            self._caduca += timedelta(days=self.dias)
+
+    def actualizar(self, noticias, eliminadas=()):
+        """
+        noticias:   filas evaluadas por db._indexar ({id, titulo, categoria,
+                    fuente_id, fecha_efectiva, riesgo_nivel, riesgo_conteo})
+        eliminadas: ids borrados
+        """
+        with self._lock:
+            if self._cargado_en is None:
+                return      # se cargará completo en el primer obtener()
+
+            desde = datetime.now() - timedelta(days=self.dias)
+            recargar = any(i in self._claves for i in eliminadas)
+            nombres = None
+
+            for n in noticias:
+                previa = self._claves.get(n["id"])
+                if not n.get("riesgo_nivel") or not n.get("fecha_efectiva") or n["fecha_efectiva"] < desde:
+                    # Sale del ranking: la siguiente puede no estar en el heap
+                    recargar = recargar or previa is not None
+                    continue
+
+                clave = self._clave(n)
+                if previa is not None and clave < previa:
+                    recargar = True
+                    continue
+                if previa is None and len(self._heap) >= self.limite and clave <= self._heap[0][0]:
+                    continue    # no entra al top
+
+                if nombres is None:
+                    nombres = {f["id"]: f["nombre"] for f in listar_fuentes()}
+                self._poner(clave, _formatear(n, nombres.get(n["fuente_id"], "")))
+
+                if previa is None:
+                    heapq.heappush(self._heap, (clave, n["id"]))
+                    if len(self._heap) > self.limite:
+                        _, saliente = heapq.heappop(self._heap)
+                        self._claves.pop(saliente, None)
+                        self._alertas.pop(saliente, None)
+                else:
+                    # Subió de puntaje: su entrada del heap quedó vieja
+                    self._heap = [(c, i) for i, c in self._claves.items()]
+                    heapq.heapify(self._heap)
+
+            if recargar:
+                self._cargado_en = None
+            else:
+                self._publicar()
+
+    def obtener(self):
+        """Ranking [{id, titulo, categoria, fuente, fecha, nivel, conteo}] de mayor a menor."""
+        with self._lock:
+            if not self._vigente():
+                try:
+                    self._cargar()
+                except Exception as e:
+                    logging.error(f"[ALERTAS] No se pudo cargar el ranking: {e}")
+            return self._ranking
+
+
+monitor_alertas = MonitorAlertas()
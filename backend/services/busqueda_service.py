@@ -0,0 +1,105 @@
+# ============================================================
+# 🔍 busqueda_service.py — Búsqueda de texto completo
+# ============================================================
+#
+# Usa el índice FULLTEXT ft_noticias_texto (titulo, descripcion)
+# de migraciones/007_fulltext_noticias.sql en modo BOOLEAN:
+# todas las palabras son obligatorias y se buscan por prefijo.
+# ============================================================
+
+from db import execute_query
+import re
+
+MIN_LARGO_TERMINO = 3      # innodb_ft_min_token_size
+MAX_TERMINOS = 8
+MAX_POR_PAGINA = 50
+MAX_PAGINAS = 50           # el ranking por relevancia no admite cursor
+
+# Todo lo que no sea letra o dígito separa términos (incluye + - * " ~ < > ( ) @)
+SEPARADORES = re.compile(r"[\W_]+", re.UNICODE)
+
+MATCH_TEXTO = "MATCH(n.titulo, n.descripcion) AGAINST (%s IN BOOLEAN MODE)"
+
+
+# ============================================================
+# 1️⃣ CONSULTA BOOLEAN MODE
+# ============================================================
+def preparar_consulta(q):
+    """
+    Convierte lo que escribe el usuario en una consulta BOOLEAN MODE:
+    "crisis  económica!" → "+crisis* +económica*"
+
+    Retorna "" si no queda ningún término indexable.
+    """
+
+    terminos = [
+        t for t in SEPARADORES.split((q or "").lower())
+        if len(t) >= MIN_LARGO_TERMINO
+    ]
+    return " ".join(f"+{t}*" for t in terminos[:MAX_TERMINOS])
+
+
+def filtro_texto(q):
+    """
+    Retorna (condición_sql, params) para filtrar noticias n por texto,
+    o (None, ()) si q no tiene términos indexables.
+    """
+
+    consulta = preparar_consulta(q)
+    if not consulta:
+        return None, ()
+    return MATCH_TEXTO, (consulta,)
+
+
+# ============================================================
+# 2️⃣ BÚSQUEDA CON RANKING
+# ============================================================
+def buscar_noticias(q, page=1, per_page=20, categoria="", fuente=""):
+    """
+    Busca noticias por relevancia (y por fecha a igual relevancia).
+
+    Retorna {"data", "page", "per_page", "hay_mas"}.
+    """
+
+    page = min(max(page, 1), MAX_PAGINAS)
+    per_page = min(max(per_page, 1), MAX_POR_PAGINA)
+    resultado = {"data": [], "page": page, "per_page": per_page, "hay_mas": False}
+
+    consulta = preparar_consulta(q)
+    if not consulta:
+        return resultado
+
+    filtros = [MATCH_TEXTO]
+    params = [consulta, consulta]
+
+    if categoria:
+        filtros.append("n.categoria = %s")
+        params.append(categoria)
+
+    if fuente:
+        filtros.append("n.fuente_id = (SELECT id FROM fuentes WHERE nombre = %s)")
+        params.append(fuente)
+
+    sql = f"""
+        SELECT
+            n.id, n.titulo, n.descripcion,
+            IF(n.imagen_valida = 0, '', n.url_imagen) AS url_imagen,
+            n.url_noticia, n.categoria, n.fecha_publicacion,
+            f.nombre AS fuente,
+            {MATCH_TEXTO} AS relevancia
+        FROM noticias n
+        JOIN fuentes f ON n.fuente_id = f.id
+        WHERE {" AND ".join(filtros)}
+        ORDER BY relevancia DESC, n.fecha_efectiva DESC
+        LIMIT %s OFFSET %s;
+    """
+    params += [per_page + 1, (page - 1) * per_page]
+
+    rows = execute_query(sql, tuple(params), fetch=True) or []
+
+    resultado["hay_mas"] = len(rows) > per_page
+    resultado["data"] = rows[:per_page]
+    for r in resultado["data"]:
+        r["relevancia"] = round(float(r["relevancia"]), 4)
+
+    return resultado
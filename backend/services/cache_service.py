@@ -0,0 +1,85 @@
+# ============================================================
+# 🗄️ cache_service.py — Caché de respuestas de la API
+# ============================================================
+
+from flask import request, make_response
+from functools import wraps
+import hashlib
+import threading
+import time
+
+from db import al_cambiar_noticias
+
+TTL_RESPUESTAS = 120   # segundos; la invalidación real llega con cada guardado
+MAX_RESPUESTAS = 500
+
+_respuestas = {}       # {clave: (expira, cuerpo, mimetype, etag)}
+_generacion = 0        # sube en cada invalidación
+_lock = threading.Lock()
+
+
+def invalidar_cache(*_):
+    """Descarta todas las respuestas cacheadas."""
+    global _generacion
+    with _lock:
+        _respuestas.clear()
+        _generacion += 1
+
+
+# Cada lote del scraper o cambio del admin invalida la caché
+al_cambiar_noticias(invalidar_cache)
+
+
+def _clave():
+    return request.path + "?" + "&".join(
+        f"{k}={v}" for k, v in sorted(request.args.items(multi=True))
+    )
+
+
+def _responder(cuerpo, mimetype, etag):
+    resp = make_response(cuerpo)
+    resp.mimetype = mimetype
+    resp.set_etag(etag)
+    # El navegador siempre revalida: si no cambió, recibe un 304 sin cuerpo
+    resp.headers["Cache-Control"] = "no-cache"
+    return resp.make_conditional(request)
+
+
+def cache_respuesta(ttl=TTL_RESPUESTAS):
+    """
+    Decorador para endpoints GET de solo lectura.
+
+    - Guarda el cuerpo de las respuestas 200 por ruta + query string.
+    - Responde con ETag y devuelve 304 si el cliente ya tiene esa versión.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            clave = _clave()
+            ahora = time.monotonic()
+
+            with _lock:
+                guardada = _respuestas.get(clave)
+                generacion = _generacion
+
+            if guardada and guardada[0] > ahora:
+                _, cuerpo, mimetype, etag = guardada
+                return _responder(cuerpo, mimetype, etag)
+
+            resp = make_response(fn(*args, **kwargs))
+            if resp.status_code != 200:
+                return resp
+
+            cuerpo = resp.get_data()
+            etag = hashlib.md5(cuerpo).hexdigest()
+
+            with _lock:
+                # Si se invalidó mientras se calculaba, no guardar datos viejos
+                if generacion == _generacion:
+                    if len(_respuestas) >= MAX_RESPUESTAS:
+                        _respuestas.pop(next(iter(_respuestas)))
+                    _respuestas[clave] = (ahora + ttl, cuerpo, resp.mimetype, etag)
+
+            return _responder(cuerpo, resp.mimetype, etag)
+        return wrapper
+    return decorator
@@ -0,0 +1,104 @@
+# ============================================================
+# 👥 clientes_service.py — Registro de clientes SocketIO
+# ============================================================
+#
+# Un registro por conexión (request.sid), no por usuario: un mismo
+# usuario con varias pestañas cuenta una vez por pestaña y cerrar una no
+# borra las demás. Conectar, desconectar y contar son O(1); los
+# handlers de SocketIO corren en varios hilos, todo va bajo un lock.
+# ============================================================
+
+from datetime import datetime
+import threading
+
+
+def sala_usuario(usuario):
+    return f"usuario:{usuario}"
+
+
+def sala_categoria(categoria):
+    return f"categoria:{categoria}"
+
+
+SALA_TODAS = "noticias"       # portada sin filtro: todas las categorías
+
+
+class RegistroClientes:
+    """
+    Conexiones activas y su pertenencia a salas.
+
+    - _clientes:  {sid: {"usuario", "conectado", "salas": set}}
+    - _usuarios:  {usuario: conexiones abiertas}
+    - _salas:     {sala: conexiones en la sala}
+    """
+
+    def __init__(self):
+        self._clientes = {}
+        self._usuarios = {}
+        self._salas = {}
+        self._lock = threading.Lock()
+
+    def _sumar(self, conteos, clave, delta):
+        total = conteos.get(clave, 0) + delta
+        if total > 0:
+            conteos[clave] = total
+        else:
+            conteos.pop(clave, None)
+
+    def conectar(self, sid, usuario="anonimo"):
+        """Registra la conexión; los usuarios con sesión entran a su sala propia."""
+        with self._lock:
+            if sid in self._clientes:
+                return
+            self._clientes[sid] = {"usuario": usuario, "conectado": datetime.now(), "salas": set()}
+            self._sumar(self._usuarios, usuario, 1)
+        if usuario != "anonimo":
+            self.unirse(sid, sala_usuario(usuario))
+
+    def desconectar(self, sid):
+        """Quita la conexión y sus salas. Retorna el cliente o None."""
+        with self._lock:
+            cliente = self._clientes.pop(sid, None)
+            if not cliente:
+                return None
+            self._sumar(self._usuarios, cliente["usuario"], -1)
+            for sala in cliente["salas"]:
+                self._sumar(self._salas, sala, -1)
+            return cliente
+
+    def unirse(self, sid, sala):
+        with self._lock:
+            cliente = self._clientes.get(sid)
+            if cliente is None or sala in cliente["salas"]:
+                return
+            cliente["salas"].add(sala)
+            self._sumar(self._salas, sala, 1)
+
+    def salir(self, sid, sala):
+        with self._lock:
+            cliente = self._clientes.get(sid)
+            if cliente is None or sala not in cliente["salas"]:
+                return
+            cliente["salas"].discard(sala)
+            self._sumar(self._salas, sala, -1)
+
+    def salas_de(self, sid):
+        with self._lock:
+            cliente = self._clientes.get(sid)
+            return set(cliente["salas"]) if cliente else set()
+
+    def total(self):
+        """Conexiones abiertas."""
+        return len(self._clientes)
+
+    def estado(self):
+        """{"clientes", "usuarios" (con sesión), "salas": {sala: conexiones}}"""
+        with self._lock:
+            return {
+                "clientes": len(self._clientes),
+                "usuarios": len(self._usuarios) - ("anonimo" in self._usuarios),
+                "salas": dict(self._salas)
+            }
+
+
+registro_clientes = RegistroClientes()
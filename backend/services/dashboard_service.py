@@ -3,6 +3,8 @@
 # ============================================================
 
 from db import execute_query
+from backend.services import resumen_service
+from backend.services.sentimiento_service import sentimiento_noticias
 from datetime import datetime, timedelta
 
 
@@ -17,20 +19,7 @@ def obtener_estadisticas_generales():
     - Total de categorías
     """
 
-    sql = """
-        SELECT 
-            COUNT(*) AS total_noticias,
-            COUNT(DISTINCT fuente_id) AS total_fuentes,
-            COUNT(DISTINCT categoria) AS total_categorias
-        FROM noticias;
-    """
-
-    result = execute_query(sql, fetch=True)
-    return result[0] if result else {
-        "total_noticias": 0,
-        "total_fuentes": 0,
-        "total_categorias": 0
-    }
+    return resumen_service.totales_generales()
 
 
 # ============================================================
@@ -54,7 +43,7 @@ def obtener_ultimas_noticias(limit=20):
         FROM noticias n
         JOIN fuentes f ON n.fuente_id = f.id
         WHERE n.url_noticia IS NOT NULL
-        ORDER BY COALESCE(n.fecha_publicacion, n.fecha_registro) DESC
+        ORDER BY n.fecha_efectiva DESC
         LIMIT %s;
     """
 
@@ -67,52 +56,17 @@ def obtener_ultimas_noticias(limit=20):
 # ============================================================
 def obtener_sentimiento_general():
     """
-    Análisis simple de sentimiento basado en palabras clave.
+    Análisis simple de sentimiento basado en palabras clave
+    (motor de sentimiento_service) sobre las últimas 300 noticias.
     Retorna: {"positivos": X, "negativos": Y, "neutros": Z}
     """
 
-    positivos = [
-        "bueno", "mejora", "éxito", "logra", "ganó", "positivo",
-        "avance", "crece", "récord", "beneficio", "ganancia", "progreso",
-        "victoria", "éxito", "potencial", "crecimiento"
-    ]
-
-    negativos = [
-        "malo", "crisis", "muere", "caída", "pérdida", "negativo",
-        "accidente", "corrupción", "protesta", "denuncia", "fracaso",
-        "problema", "riesgo", "amenaza", "desastre", "tragedia"
-    ]
-
-    sql = """
-        SELECT titulo, descripcion
-        FROM noticias
-        ORDER BY COALESCE(fecha_publicacion, fecha_registro) DESC
-        LIMIT 300;
-    """
-
-    rows = execute_query(sql, fetch=True) or []
-
-    def score(texto):
-        text = texto.lower()
-        return sum(p in text for p in positivos) - sum(n in text for n in negativos)
-
-    pos = neg = neu = 0
-
-    for row in rows:
-        text = f"{row.get('titulo', '')} {row.get('descripcion', '')}"
-        s = score(text)
-
-        if s > 0:
-            pos += 1
-        elif s < 0:
-            neg += 1
-        else:
-            neu += 1
+    conteo = sentimiento_noticias(300)
 
     return {
-        "positivos": pos,
-        "negativos": neg,
-        "neutros": neu
+        "positivos": conteo["pos"],
+        "negativos": conteo["neg"],
+        "neutros": conteo["neu"]
     }
 
 
@@ -124,14 +78,7 @@ def obtener_noticias_hoy():
     Retorna la cantidad de noticias publicadas hoy.
     """
 
-    sql = """
-        SELECT COUNT(*) AS total
-        FROM noticias
-        WHERE DATE(COALESCE(fecha_publicacion, fecha_registro)) = CURDATE();
-    """
-
-    result = execute_query(sql, fetch=True)
-    return result[0]["total"] if result else 0
+    return resumen_service.total_hoy()
 
 
 # ============================================================
@@ -142,18 +89,7 @@ def obtener_categorias_activas(limit=5):
     Retorna las categorías con más noticias.
     """
 
-    sql = """
-        SELECT 
-            COALESCE(categoria, 'Sin categoría') AS categoria,
-            COUNT(*) AS total
-        FROM noticias
-        GROUP BY categoria
-        ORDER BY total DESC
-        LIMIT %s;
-    """
-
-    data = execute_query(sql, (limit,), fetch=True)
-    return data or []
+    return resumen_service.conteo_por_categoria(limit=limit)
 
 
 # ============================================================
@@ -164,19 +100,7 @@ def obtener_fuentes_activas(limit=5):
     Retorna las fuentes con más noticias.
     """
 
-    sql = """
-        SELECT 
-            f.nombre AS fuente,
-            COUNT(*) AS total
-        FROM noticias n
-        JOIN fuentes f ON n.fuente_id = f.id
-        GROUP BY f.nombre
-        ORDER BY total DESC
-        LIMIT %s;
-    """
-
-    data = execute_query(sql, (limit,), fetch=True)
-    return data or []
+    return resumen_service.conteo_por_fuente(limit=limit)
 
 
 # ============================================================
@@ -188,18 +112,7 @@ def obtener_noticias_por_categoria_recientes():
     en los últimos 7 días.
     """
 
-    sql = """
-        SELECT 
-            COALESCE(categoria, 'Sin categoría') AS categoria,
-            COUNT(*) AS total
-        FROM noticias
-        WHERE COALESCE(fecha_publicacion, fecha_registro) >= CURDATE() - INTERVAL 7 DAY
-        GROUP BY categoria
-        ORDER BY total DESC;
-    """
-
-    data = execute_query(sql, fetch=True)
-    return data or []
+    return resumen_service.conteo_por_categoria(dias=7)
 
 
 # ============================================================
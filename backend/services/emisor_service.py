@@ -0,0 +1,110 @@
+# ============================================================
+# 📡 emisor_service.py — Eventos SocketIO desde cualquier proceso
+# ============================================================
+#
+# - En la web, app.py registra su instancia con configurar_emisor().
+# - En un proceso sin servidor (python scraper.py), iniciar_emisor_externo()
+#   crea un SocketIO de solo escritura sobre SOCKETIO_MESSAGE_QUEUE:
+#   lo que emite llega a los clientes de todos los workers web.
+# Sin emisor configurado, emitir() no hace nada.
+# ============================================================
+
+from db import al_cambiar_noticias
+from backend.services.clientes_service import sala_categoria, SALA_TODAS
+from datetime import datetime
+import logging
+import config
+
+MAX_NOTICIAS_EVENTO = 20       # noticias por evento; "total" trae el conteo completo
+
+_emisor = None
+
+
+def configurar_emisor(socketio):
+    global _emisor
+    _emisor = socketio
+
+
+def iniciar_emisor_externo():
+    """
+    Emisor de solo escritura para procesos sin servidor SocketIO.
+    Retorna False si no hay cola configurada o falta flask-socketio.
+    """
+    if not config.SOCKETIO_MESSAGE_QUEUE:
+        logging.info("[EMISOR] Sin SOCKETIO_MESSAGE_QUEUE: este proceso no emite eventos")
+        return False
+    try:
+        from flask_socketio import SocketIO
+    except ImportError:
+        logging.warning("[EMISOR] flask-socketio no instalado: este proceso no emite eventos")
+        return False
+
+    configurar_emisor(SocketIO(message_queue=config.SOCKETIO_MESSAGE_QUEUE))
+    logging.info(f"[EMISOR] Emitiendo por la cola {config.SOCKETIO_MESSAGE_QUEUE}")
+    return True
+
+
+def emitir(evento, datos, to=None):
+    """Emite a todos los clientes (o a la sala `to`); False si no hay emisor."""
+    if _emisor is None:
+        return False
+    _emisor.emit(evento, datos, to=to)
+    return True
+
+
+# ============================================================
+# 📰 NOTICIAS NUEVAS (un evento por lote y sala)
+# ============================================================
+def _evento_noticias_nuevas(categoria, noticias, timestamp):
+    return {
+        "type": "noticias_nuevas",
+        "categoria": categoria,
+        "total": len(noticias),
+        "noticias": [
+            {k: n[k] for k in ("id", "titulo", "categoria", "fuente", "url_noticia")}
+            for n in noticias[:MAX_NOTICIAS_EVENTO]
+        ],
+        "timestamp": timestamp
+    }
+
+
+@al_cambiar_noticias
+def emitir_noticias_nuevas(noticias):
+    """
+    Un evento 'noticias_nuevas' por lote guardado (flush del scraper) y
+    por sala, solo con las inserciones reales del lote.
+    """
+    nuevas = [n for n in noticias if n.get("nueva")]
+    if not nuevas or _emisor is None:
+        return
+
+    por_categoria = {}
+    for n in nuevas:
+        por_categoria.setdefault(n["categoria"], []).append(n)
+
+    timestamp = datetime.now().isoformat()
+    for categoria, lista in por_categoria.items():
+        emitir("noticias_nuevas", _evento_noticias_nuevas(categoria, lista, timestamp),
+               to=sala_categoria(categoria))
+    emitir("noticias_nuevas", _evento_noticias_nuevas("", nuevas, timestamp), to=SALA_TODAS)
+
+    logging.info(f"🔔 {len(nuevas)} noticias nuevas notificadas en {len(por_categoria)} categorías")
+
+
+# ============================================================
+# 📊 ESTADÍSTICAS DE LOS PANELES (una vez por ciclo)
+# ============================================================
+def publicar_estadisticas():
+    """Envía las secciones que cambiaron desde el último ciclo (evento 'estadisticas')."""
+    if _emisor is None:
+        return False
+    try:
+        from backend.services.estadisticas_service import estadisticas_vivas
+        cambios = estadisticas_vivas.actualizar()
+        if cambios:
+            emitir("estadisticas", cambios)
+            logging.info(f"📡 Estadísticas enviadas: {', '.join(cambios['cambios'])}")
+        return True
+    except Exception as e:
+        logging.error(f"❌ Error enviando estadísticas en vivo: {e}")
+        return False
@@ -1,6 +1,18 @@
 # backend/services/estadisticas_service.py
+#
+# Estadísticas de los paneles (Dashboard admin y Panel IA).
+# Los paneles las cargan una vez por HTTP y después solo escuchan el
+# evento SocketIO "estadisticas": app.ciclo_scraper llama a
+# estadisticas_vivas.actualizar() al final de cada ciclo, cada sección se
+# consulta una sola vez y se envían solo las que cambiaron, sin importar
+# cuántos paneles haya abiertos.
 
 from db import execute_query
+from backend.services import resumen_service
+from backend.services.sentimiento_service import sentimiento_noticias
+from backend.services.alertas_service import monitor_alertas
+from datetime import datetime
+import threading
 
 
 # ======================================================
@@ -14,14 +26,83 @@ def top_noticias(limit=10):
     sql = f"""
         SELECT 
             n.id, n.titulo, n.categoria,
-            COALESCE(n.fecha_publicacion, n.fecha_registro) AS fecha_publicacion,
+            n.fecha_efectiva AS fecha_publicacion,
             f.nombre AS fuente
         FROM noticias n
         JOIN fuentes f ON n.fuente_id = f.id
-        ORDER BY fecha_publicacion DESC
+        ORDER BY n.fecha_efectiva DESC
         LIMIT %s;
     """
 
     data = execute_query(sql, (limit,), fetch=True)
 
     return data or []
+
+
+# ============================================================
+# 1️⃣ SECCIONES (mismo formato que /api/stats/*)
+# ============================================================
+def sentimiento_panel(dias=None):
+    """{"positivos", "negativos", "neutros"}; sin dias, las últimas 300 noticias."""
+    conteo = sentimiento_noticias(dias=dias) if dias else sentimiento_noticias(300)
+    return {"positivos": conteo["pos"], "negativos": conteo["neg"], "neutros": conteo["neu"]}
+
+
+def noticias_por_dia(dias=30):
+    """[{"fecha": "YYYY-MM-DD", "total"}] de los últimos N días."""
+    return [
+        {
+            "fecha": r["fecha"].strftime("%Y-%m-%d") if r.get("fecha") else "",
+            "total": int(r["total"])
+        }
+        for r in resumen_service.conteo_por_dia(dias)
+    ]
+
+
+SECCIONES = {
+    "categorias": resumen_service.conteo_por_categoria,
+    "fuentes": resumen_service.conteo_por_fuente,
+    "sentimiento": sentimiento_panel,
+    "noticias_dia": noticias_por_dia,
+    "alertas": monitor_alertas.obtener,
+}
+
+
+# ============================================================
+# 2️⃣ CAMBIOS POR CICLO
+# ============================================================
+class EstadisticasVivas:
+    """
+    Última versión enviada de cada sección.
+
+    actualizar() recalcula todas las secciones y devuelve
+    {"version", "timestamp", "cambios": {seccion: datos}} con las que
+    cambiaron desde el envío anterior, o None si no cambió ninguna.
+    """
+
+    def __init__(self, secciones=SECCIONES):
+        self.secciones = secciones
+        self._ultimas = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def actualizar(self):
+        nuevas = {nombre: calcular() for nombre, calcular in self.secciones.items()}
+
+        with self._lock:
+            cambios = {
+                nombre: datos for nombre, datos in nuevas.items()
+                if self._ultimas.get(nombre) != datos
+            }
+            if not cambios:
+                return None
+            self._ultimas.update(cambios)
+            self._version += 1
+            return {
+                "version": self._version,
+                "timestamp": datetime.now().isoformat(),
+                "cambios": cambios
+            }
+
+
+estadisticas_vivas = EstadisticasVivas()
@@ -1,15 +1,119 @@
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import time
+
+from db import execute_query, execute_many
+
+# ------------------------------------------------------------
+# Configuración de la validación de imágenes
+# ------------------------------------------------------------
+MAX_VALIDACIONES_SIMULTANEAS = 16
+TTL_VALIDACION = 3600       # segundos que se recuerda un resultado
+MAX_MEMO_VALIDACION = 20000
+
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=50, pool_maxsize=MAX_VALIDACIONES_SIMULTANEAS))
+_session.mount("https://", HTTPAdapter(pool_connections=50, pool_maxsize=MAX_VALIDACIONES_SIMULTANEAS))
+
+_memo = {}                  # {url: (valida, expira)}
+_memo_lock = threading.Lock()
+
+
+def _comprobar_imagen(url):
+    """True si la URL responde 200 con Content-Type de imagen."""
+    headers = {"User-Agent": "Mozilla/5.0"}
+    try:
+        r = _session.head(url, headers=headers, timeout=3, allow_redirects=True)
+        if r.status_code in (403, 405, 501):
+            # Algunos CDN no aceptan HEAD: pedir solo las cabeceras del GET
+            with _session.get(url, headers=headers, timeout=3, stream=True) as r:
+                return r.status_code == 200 and "image" in r.headers.get("Content-Type", "")
+        return r.status_code == 200 and "image" in r.headers.get("Content-Type", "")
+    except Exception:
+        return False
+
+
+def validar_imagenes(urls):
+    """
+    Valida un lote de URLs de imagen en paralelo (sesión con pool).
+    Los resultados se recuerdan TTL_VALIDACION segundos.
+
+    Retorna {url: True/False}.
+    """
+    ahora = time.monotonic()
+    resultado = {}
+    pendientes = []
+
+    with _memo_lock:
+        for url in set(u for u in urls if u):
+            memo = _memo.get(url)
+            if memo and memo[1] > ahora:
+                resultado[url] = memo[0]
+            else:
+                pendientes.append(url)
+
+    if pendientes:
+        hilos = min(MAX_VALIDACIONES_SIMULTANEAS, len(pendientes))
+        with ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="validar_img") as pool:
+            validas = list(pool.map(_comprobar_imagen, pendientes))
+
+        expira = time.monotonic() + TTL_VALIDACION
+        with _memo_lock:
+            if len(_memo) + len(pendientes) > MAX_MEMO_VALIDACION:
+                _memo.clear()
+            for url, valida in zip(pendientes, validas):
+                _memo[url] = (valida, expira)
+                resultado[url] = valida
+
+    return resultado
+
 
 def validar_imagen(url: str) -> str:
     """Verifica si una imagen existe. Si no, devuelve un placeholder."""
     if not url:
         return ""
-    
-    try:
-        r = requests.head(url, timeout=3)
-        if r.status_code == 200 and "image" in r.headers.get("Content-Type", ""):
-            return url
-    except:
-        pass
+
+    if validar_imagenes([url]).get(url):
+        return url
 
     return ""   # forzar fallback
+
+
+def guardar_validez_imagenes(mapa):
+    """
+    Escribe el resultado de validar_imagenes en las noticias pendientes
+    (imagen_valida IS NULL), que es lo que idx_imagen_valida permite ubicar
+    sin recorrer la tabla.
+    """
+    if not mapa:
+        return 0
+
+    ok = execute_many(
+        "UPDATE noticias SET imagen_valida = %s WHERE imagen_valida IS NULL AND url_imagen = %s",
+        [(1 if valida else 0, url) for url, valida in mapa.items()]
+    )
+    return len(mapa) if ok is not None else 0
+
+
+def validar_imagenes_pendientes(limite=500):
+    """
+    Valida las imágenes de noticias aún sin revisar (imagen_valida IS NULL)
+    y guarda el resultado. Pensado para correr después de cada scraping,
+    nunca dentro de un request web.
+    """
+    rows = execute_query("""
+        SELECT DISTINCT url_imagen
+        FROM noticias
+        WHERE imagen_valida IS NULL AND url_imagen <> ''
+        LIMIT %s;
+    """, (limite,), fetch=True) or []
+
+    mapa = validar_imagenes([r["url_imagen"] for r in rows])
+    guardadas = guardar_validez_imagenes(mapa)
+
+    rotas = sum(1 for v in mapa.values() if not v)
+    logging.info(f"[IMAGENES] {guardadas} imágenes validadas, {rotas} rotas")
+    return guardadas
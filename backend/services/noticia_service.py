@@ -1,29 +1,111 @@
-from db import execute_query
+from db import execute_query, obtener_fuente_id
+from datetime import datetime
+import base64
 
-def obtener_noticias_filtradas(fuente, categoria, page, per_page):
-    offset = (page - 1) * per_page
+# ============================================================
+# 🔖 Cursor de paginación (keyset)
+# ============================================================
+# El cursor es la posición (fecha_efectiva, id) de la última noticia
+# entregada, codificada en base64 para que el cliente la trate como opaca.
+# Con el índice sobre fecha_efectiva, la página 100 cuesta lo mismo que la 1.
 
-    sql = """
-        SELECT 
-            n.id, n.titulo, n.url_imagen, n.url_noticia,
-            n.fecha_publicacion, n.categoria, f.nombre AS fuente
+FORMATO_CURSOR = "%Y-%m-%dT%H:%M:%S"
+
+
+class CursorInvalido(ValueError):
+    pass
+
+
+def codificar_cursor(fecha_efectiva, noticia_id):
+    texto = f"{fecha_efectiva.strftime(FORMATO_CURSOR)}|{noticia_id}"
+    return base64.urlsafe_b64encode(texto.encode()).decode().rstrip("=")
+
+
+def decodificar_cursor(cursor):
+    """Devuelve (fecha_efectiva, id) o lanza CursorInvalido."""
+    try:
+        relleno = "=" * (-len(cursor) % 4)
+        texto = base64.urlsafe_b64decode(cursor + relleno).decode()
+        fecha, noticia_id = texto.split("|")
+        return datetime.strptime(fecha, FORMATO_CURSOR), int(noticia_id)
+    except Exception:
+        raise CursorInvalido(f"Cursor inválido: {cursor!r}")
+
+
+# ============================================================
+# 📰 Listado de noticias paginado
+# ============================================================
+def obtener_pagina_noticias(fuente="", categoria="", per_page=12, cursor=None, page=1,
+                            columnas="n.titulo, n.url_imagen, n.url_noticia, "
+                                     "n.fecha_publicacion, n.categoria"):
+    """
+    Devuelve (noticias, next_cursor) ordenadas de la más reciente a la más antigua.
+
+    - cursor: continúa después de esa posición (keyset, sin OFFSET).
+    - page: respaldo para clientes antiguos cuando no hay cursor (usa OFFSET).
+    - next_cursor es None cuando no quedan más noticias.
+    """
+    condiciones = []
+    params = []
+
+    if fuente:
+        fuente_id = obtener_fuente_id(fuente, crear=False)
+        if not fuente_id:
+            return [], None
+        condiciones.append("n.fuente_id = %s")
+        params.append(fuente_id)
+
+    if categoria:
+        condiciones.append("n.categoria = %s")
+        params.append(categoria)
+
+    offset = 0
+    if cursor:
+        fecha, noticia_id = decodificar_cursor(cursor)
+        condiciones.append("(n.fecha_efectiva, n.id) < (%s, %s)")
+        params += [fecha, noticia_id]
+    elif page > 1:
+        offset = (page - 1) * per_page
+
+    where = ("WHERE " + " AND ".join(condiciones)) if condiciones else ""
+
+    # Se pide una fila de más para saber si hay página siguiente
+    sql = f"""
+        SELECT {columnas}, n.id, n.fecha_efectiva, f.nombre AS fuente
         FROM noticias n
         JOIN fuentes f ON n.fuente_id = f.id
-        WHERE (%s = '' OR f.nombre = %s)
-          AND (%s = '' OR n.categoria = %s)
-        ORDER BY fecha_publicacion DESC
+        {where}
+        ORDER BY n.fecha_efectiva DESC, n.id DESC
         LIMIT %s OFFSET %s;
     """
-    params = (fuente, fuente, categoria, categoria, per_page, offset)
-    rows = execute_query(sql, params, fetch=True)
+    params += [per_page + 1, offset]
+    rows = execute_query(sql, tuple(params), fetch=True) or []
+
+    hay_mas = len(rows) > per_page
+    rows = rows[:per_page]
+
+    next_cursor = None
+    if hay_mas and rows:
+        ultima = rows[-1]
+        next_cursor = codificar_cursor(ultima["fecha_efectiva"], ultima["id"])
+
+    for r in rows:
+        r.pop("fecha_efectiva", None)
+
+    return rows, next_cursor
+
+
+def obtener_noticias_filtradas(fuente, categoria, page, per_page, cursor=None):
+    rows, next_cursor = obtener_pagina_noticias(fuente, categoria, per_page, cursor, page)
 
     return {
         "data": rows,
         "page": page,
         "per_page": per_page,
-        "count": len(rows)
+        "count": len(rows),
+        "next_cursor": next_cursor
     }
-from db import execute_query
+
 
 def obtener_portada():
     sql = """
@@ -0,0 +1,174 @@
+# ============================================================
+# 📈 resumen_service.py — Conteos precalculados de noticias
+# ============================================================
+#
+# Lee la tabla resumen_noticias (dia, fuente_id, categoria, total),
+# que db.py mantiene al día con cada escritura en noticias.
+# Reconstruir con: python mantenimiento.py reconstruir-resumen
+# ============================================================
+
+from db import execute_query, al_cambiar_noticias
+import threading
+import time
+
+
+# ============================================================
+# 1️⃣ TOTALES GENERALES
+# ============================================================
+def totales_generales():
+    """
+    Retorna {"total_noticias", "total_fuentes", "total_categorias"}.
+    """
+
+    sql = """
+        SELECT
+            COALESCE(SUM(total), 0) AS total_noticias,
+            COUNT(DISTINCT fuente_id) AS total_fuentes,
+            COUNT(DISTINCT categoria) AS total_categorias
+        FROM resumen_noticias
+        WHERE total > 0;
+    """
+
+    result = execute_query(sql, fetch=True)
+    if not result:
+        return {"total_noticias": 0, "total_fuentes": 0, "total_categorias": 0}
+
+    return {clave: int(valor or 0) for clave, valor in result[0].items()}
+
+
+# ============================================================
+# 2️⃣ NOTICIAS POR CATEGORÍA
+# ============================================================
+def conteo_por_categoria(limit=None, dias=None):
+    """
+    Retorna [{"categoria", "total"}] de mayor a menor.
+    dias: si se indica, solo cuenta los últimos N días.
+    """
+
+    filtro = "WHERE dia >= CURDATE() - INTERVAL %s DAY" if dias else ""
+    params = (dias,) if dias else ()
+
+    sql = f"""
+        SELECT categoria, CAST(SUM(total) AS SIGNED) AS total
+        FROM resumen_noticias
+        {filtro}
+        GROUP BY categoria
+        HAVING total > 0
+        ORDER BY total DESC
+    """
+    if limit:
+        sql += " LIMIT %s"
+        params += (limit,)
+
+    return execute_query(sql, params, fetch=True) or []
+
+
+# ============================================================
+# 3️⃣ NOTICIAS POR FUENTE
+# ============================================================
+def conteo_por_fuente(limit=None):
+    """
+    Retorna [{"fuente", "total"}] de mayor a menor.
+    """
+
+    sql = """
+        SELECT f.nombre AS fuente, CAST(SUM(r.total) AS SIGNED) AS total
+        FROM resumen_noticias r
+        JOIN fuentes f ON r.fuente_id = f.id
+        GROUP BY f.nombre
+        HAVING total > 0
+        ORDER BY total DESC
+    """
+    params = ()
+    if limit:
+        sql += " LIMIT %s"
+        params = (limit,)
+
+    return execute_query(sql, params, fetch=True) or []
+
+
+# ============================================================
+# 4️⃣ NOTICIAS POR DÍA
+# ============================================================
+def conteo_por_dia(dias=30):
+    """
+    Retorna [{"fecha": date, "total"}] de los últimos N días, en orden.
+    """
+
+    sql = """
+        SELECT dia AS fecha, CAST(SUM(total) AS SIGNED) AS total
+        FROM resumen_noticias
+        WHERE dia >= CURDATE() - INTERVAL %s DAY
+        GROUP BY dia
+        HAVING total > 0
+        ORDER BY dia ASC;
+    """
+
+    return execute_query(sql, (dias,), fetch=True) or []
+
+
+def total_hoy():
+    """
+    Retorna la cantidad de noticias de hoy.
+    """
+
+    sql = """
+        SELECT COALESCE(SUM(total), 0) AS total
+        FROM resumen_noticias
+        WHERE dia = CURDATE();
+    """
+
+    result = execute_query(sql, fetch=True)
+    return int(result[0]["total"]) if result else 0
+
+
+# ============================================================
+# 5️⃣ TOTAL POR CATEGORÍA (PAGINACIÓN DE LA HOME)
+# ============================================================
+TTL_TOTALES = 120      # segundos; por si escribe otro proceso (scraper suelto)
+
+_totales = {}          # {categoria: (expira, total)}; "" = todas
+_generacion = 0
+_lock_totales = threading.Lock()
+
+
+@al_cambiar_noticias
+def _invalidar_totales(*_):
+    global _generacion
+    with _lock_totales:
+        _totales.clear()
+        _generacion += 1
+
+
+def total_noticias(categoria=""):
+    """
+    Retorna el total de noticias de una categoría ("" = todas).
+
+    Se lee de resumen_noticias y se guarda en memoria hasta la próxima
+    escritura en noticias: la home nunca cuenta filas de noticias.
+    """
+
+    ahora = time.monotonic()
+    with _lock_totales:
+        guardado = _totales.get(categoria)
+        generacion = _generacion
+    if guardado and guardado[0] > ahora:
+        return guardado[1]
+
+    if categoria:
+        sql = "SELECT COALESCE(SUM(total), 0) AS total FROM resumen_noticias WHERE categoria = %s;"
+        params = (categoria,)
+    else:
+        sql = "SELECT COALESCE(SUM(total), 0) AS total FROM resumen_noticias;"
+        params = ()
+
+    result = execute_query(sql, params, fetch=True)
+    if not result:
+        return 0
+
+    total = int(result[0]["total"])
+    with _lock_totales:
+        # Si hubo una escritura mientras se consultaba, no guardar el valor viejo
+        if generacion == _generacion:
+            _totales[categoria] = (ahora + TTL_TOTALES, total)
+    return total
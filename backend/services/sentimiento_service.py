@@ -1,57 +1,190 @@
 # backend/services/sentimiento_service.py
+# ============================================================
+# 🙂 Motor de sentimiento por léxico
+# ============================================================
+#
+# Un solo léxico y una sola expresión compilada para todo el portal.
+# Como el puntaje original, cada palabra del léxico suma una vez si
+# aparece (+1 positiva, -1 negativa), sin importar cuántas veces.
+# Se compara palabra completa contra las formas listadas ("peligro" no
+# cuenta "peligroso"); las tildes las resuelve el patrón.
+# ============================================================
 
 from db import execute_query
+import re
+
+# Palabra → formas que cuentan como ella (palabra completa)
+POSITIVAS = {
+    "bueno": ["bueno", "buena", "buenos", "buenas"],
+    "excelente": ["excelente", "excelentes"],
+    "positivo": ["positivo", "positiva", "positivos", "positivas"],
+    "éxito": ["éxito", "éxitos"],
+    "logro": ["logro", "logros"],
+    "logra": ["logra", "logran"],
+    "avance": ["avance", "avances"],
+    "mejora": ["mejora", "mejoras", "mejoran"],
+    "ganó": ["ganó", "ganaron"],
+    "crece": ["crece", "crecen"],
+    "crecimiento": ["crecimiento"],
+    "récord": ["récord", "récords"],
+    "beneficio": ["beneficio", "beneficios"],
+    "ganancia": ["ganancia", "ganancias"],
+    "progreso": ["progreso", "progresos"],
+    "victoria": ["victoria", "victorias"],
+    "potencial": ["potencial"],
+}
+NEGATIVAS = {
+    "malo": ["malo", "mala", "malos", "malas"],
+    "crisis": ["crisis"],
+    "negativo": ["negativo", "negativa", "negativos", "negativas"],
+    "caída": ["caída", "caídas"],
+    "peligro": ["peligro", "peligros"],
+    "tragedia": ["tragedia", "tragedias"],
+    "problema": ["problema", "problemas"],
+    "muere": ["muere", "mueren"],
+    "pérdida": ["pérdida", "pérdidas"],
+    "accidente": ["accidente", "accidentes"],
+    "corrupción": ["corrupción"],
+    "protesta": ["protesta", "protestas"],
+    "denuncia": ["denuncia", "denuncias"],
+    "fracaso": ["fracaso", "fracasos"],
+    "riesgo": ["riesgo", "riesgos"],
+    "amenaza": ["amenaza", "amenazas"],
+    "desastre": ["desastre", "desastres"],
+}
+
+
+# ============================================================
+# 🔤 Léxico compilado
+# ============================================================
+SIN_TILDES = str.maketrans("áàäâéèëêíìïîóòöôúùüû", "aaaaeeeeiiiioooouuuu")
+
+# Cada vocal del léxico acepta sus variantes con tilde: el texto no se
+# normaliza (quitar tildes del texto cuesta más que esto)
+VOCALES = {
+    "a": "[aáàäâ]", "e": "[eéèëê]", "i": "[iíìïî]",
+    "o": "[oóòöô]", "u": "[uúùüû]",
+}
+
+
+def patron_palabra(palabra):
+    """Patrón de una palabra: corrupción → c[oóòöô]rr[uúùüû]pc[iíìïî][oóòöô]n"""
+    base = palabra.lower().translate(SIN_TILDES)
+    return "".join(VOCALES.get(c, re.escape(c)) for c in base)
+
+
+def compilar_lexico(grupos):
+    """
+    Compila {nombre_grupo: [formas]} en una sola alternancia con grupos
+    con nombre y palabra completa (\\b...\\b), para texto en minúsculas.
+    """
+    partes = []
+    for nombre, formas in grupos.items():
+        terminos = sorted({patron_palabra(f) for f in formas}, key=len, reverse=True)
+        partes.append(f"(?P<{nombre}>{'|'.join(terminos)})")
+    return re.compile(r"\b(?:" + "|".join(partes) + r")\b")
+
+
+# Un grupo por palabra: pos0, pos1, ..., neg0, neg1, ...
+RE_SENTIMIENTO = compilar_lexico({
+    **{f"pos{i}": formas for i, formas in enumerate(POSITIVAS.values())},
+    **{f"neg{i}": formas for i, formas in enumerate(NEGATIVAS.values())},
+})
+
+# Primera letra del texto o de cada oración: solo esas se pasan a
+# minúsculas, así "Victoria" a mitad de frase (nombre propio) no cuenta
+RE_INICIO_ORACION = re.compile(r"(^|[.!?¡¿:;]\s*)(\w)")
+
+
+def _minusculas_de_oracion(texto):
+    return RE_INICIO_ORACION.sub(lambda m: m.group(1) + m.group(2).lower(), texto)
+
+
+# ============================================================
+# 1️⃣ PUNTAJE DE UN TEXTO
+# ============================================================
+def puntuar(texto):
+    """Palabras positivas distintas menos negativas distintas del texto."""
+    encontradas = {m.lastgroup for m in RE_SENTIMIENTO.finditer(_minusculas_de_oracion(texto or ""))}
+    return sum(1 if g.startswith("pos") else -1 for g in encontradas)
 
-# Palabras clave simples para detección aproximada
-POSITIVAS = ["bueno", "excelente", "positivo", "éxito", "logro", "avance", "mejora"]
-NEGATIVAS = ["malo", "crisis", "negativo", "caída", "peligro", "tragedia", "problema"]
 
 def analizar_sentimiento_texto(texto):
     """
     Analiza un texto muy simple basado en conteo de palabras clave.
     Retorna "pos", "neg" o "neu".
     """
+    score = puntuar(texto)
+    if score > 0:
+        return "pos"
+    elif score < 0:
+        return "neg"
+    return "neu"
 
-    texto = texto.lower()
 
-    score_pos = sum(1 for w in POSITIVAS if w in texto)
-    score_neg = sum(1 for w in NEGATIVAS if w in texto)
+# Valor guardado en noticias.sentimiento (migraciones/009)
+VALORES = {"pos": 1, "neu": 0, "neg": -1}
+ETIQUETAS = {v: k for k, v in VALORES.items()}
 
-    if score_pos > score_neg:
-        return "pos"
-    elif score_neg > score_pos:
-        return "neg"
-    else:
-        return "neu"
 
+def valor_sentimiento(texto):
+    """1 positivo, 0 neutro, -1 negativo."""
+    return VALORES[analizar_sentimiento_texto(texto)]
 
-def obtener_sentimientos():
+
+# ============================================================
+# 2️⃣ LOTES DE NOTICIAS
+# ============================================================
+def contar_sentimientos(noticias):
     """
-    Recorre TODAS las noticias y devuelve:
-    { "pos": X, "neg": Y, "neu": Z }
+    Clasifica un lote de noticias ({titulo, descripcion}) y devuelve
+    { "pos": X, "neg": Y, "neu": Z }.
     """
+    conteo = {"pos": 0, "neg": 0, "neu": 0}
+    for n in noticias:
+        conteo[analizar_sentimiento_texto(
+            f"{n.get('titulo') or ''} {n.get('descripcion') or ''}"
+        )] += 1
+    return conteo
 
-    noticias = execute_query("""
-        SELECT titulo, descripcion
-        FROM noticias
-        ORDER BY id DESC
-        LIMIT 200;
-    """, fetch=True)
 
-    pos = neg = neu = 0
+def sentimiento_noticias(limite=None, dias=None):
+    """
+    Conteo del sentimiento ya guardado en cada noticia.
+    - limite: solo las `limite` noticias más recientes
+    - dias:   solo las de los últimos `dias` días
+    Sin ninguno de los dos, todo el archivo.
+    """
+    filtro = "WHERE sentimiento IS NOT NULL"
+    params = []
+    if dias:
+        filtro += " AND fecha_efectiva >= NOW() - INTERVAL %s DAY"
+        params.append(int(dias))
 
-    if not noticias:
-        return {"pos": 0, "neg": 0, "neu": 0}
+    if limite:
+        sql = f"""
+            SELECT sentimiento, COUNT(*) AS total
+            FROM (
+                SELECT sentimiento FROM noticias
+                {filtro}
+                ORDER BY fecha_efectiva DESC
+                LIMIT %s
+            ) recientes
+            GROUP BY sentimiento;
+        """
+        params.append(limite)
+    else:
+        sql = f"SELECT sentimiento, COUNT(*) AS total FROM noticias {filtro} GROUP BY sentimiento;"
 
-    for n in noticias:
-        texto = f"{n.get('titulo', '')} {n.get('descripcion', '')}"
-        sentimiento = analizar_sentimiento_texto(texto)
+    conteo = {"pos": 0, "neg": 0, "neu": 0}
+    for r in execute_query(sql, tuple(params), fetch=True) or []:
+        conteo[ETIQUETAS[r["sentimiento"]]] = int(r["total"])
+    return conteo
 
-        if sentimiento == "pos":
-            pos += 1
-        elif sentimiento == "neg":
-            neg += 1
-        else:
-            neu += 1
 
-    return {"pos": pos, "neg": neg, "neu": neu}
+def obtener_sentimientos():
+    """
+    Sentimiento de las últimas 200 noticias:
+    { "pos": X, "neg": Y, "neu": Z }
+    """
+    return sentimiento_noticias(200)
@@ -0,0 +1,151 @@
+# ============================================================
+# 🔤 terminos_service.py — Limpieza de texto y frecuencia de términos
+# ============================================================
+#
+# - limpiar_texto / contar_terminos: tokenización ligera (sin matplotlib),
+#   usable desde el scraper.
+# - indexar_terminos: guarda los términos de cada noticia al escribirla
+#   (tabla noticia_terminos, ver migraciones/008_noticia_terminos.sql).
+# - frecuencias: nube de palabras como SUM sobre los conteos guardados.
+# ============================================================
+
+from db import execute_query
+from backend.services.busqueda_service import filtro_texto
+from collections import Counter
+import re
+
+MIN_LARGO = 4          # palabras de 3 letras o menos no aportan
+MAX_LARGO = 64         # noticia_terminos.termino
+
+# ------------------------------
+# 🧹 Expresiones precompiladas
+# ------------------------------
+RE_URLS = re.compile(r"http\S+|www\S+")
+RE_BASURA = re.compile(r"\b(pe|com|net|org|html|amp|video|portada|noticias|rpp|youtube|img)\b")
+RE_NO_LETRAS = re.compile(r"[^a-záéíóúñü\s]")
+
+# ---- Stopwords PRO LATAM ----
+STOPWORDS = frozenset("""
+    de la los las un una unos unas que por para con sin del al en y o u
+    es son fue ser se ya más muy pero como sobre entre esto esta estas estos
+    así aún solo siempre nunca cada hacia haber siendo estaba están mismo misma
+    donde cuando porque entonces luego antes después durante tras dentro fuera
+    peru lima rpp mundo última ultimo ultimas ultimos
+    portada video imagen fotos foto ver vivo directo
+    cuenta verified share shares account comentario comentarios public publico
+    internacional nacional regional diario peruana peruano politica política
+    deportes futbol fútbol club seleccion peru
+""".split())
+
+
+# ============================================================
+# 1️⃣ TOKENIZACIÓN
+# ============================================================
+def _terminos(texto):
+    t = texto.lower()
+    t = RE_URLS.sub(" ", t)
+    t = RE_BASURA.sub(" ", t)
+    t = RE_NO_LETRAS.sub(" ", t)
+    return [
+        p for p in t.split()
+        if len(p) >= MIN_LARGO and p not in STOPWORDS
+    ]
+
+
+def limpiar_texto(texto: str):
+    if not texto:
+        return ""
+    return " ".join(_terminos(texto))
+
+
+def contar_terminos(texto):
+    """Counter {termino: veces} de un texto."""
+    if not texto:
+        return Counter()
+    return Counter(p[:MAX_LARGO] for p in _terminos(texto))
+
+
+# ============================================================
+# 2️⃣ INDEXADO AL ESCRIBIR
+# ============================================================
+def indexar_terminos(cursor, noticias):
+    """
+    Reemplaza los términos de las noticias indicadas.
+    Se llama desde db.py dentro de la transacción de escritura.
+
+    noticias: [{"id", "titulo", "descripcion"}, ...]
+    """
+    if not noticias:
+        return
+
+    ids = [n["id"] for n in noticias]
+    marcadores = ", ".join(["%s"] * len(ids))
+    cursor.execute(f"DELETE FROM noticia_terminos WHERE noticia_id IN ({marcadores})", ids)
+
+    filas = [
+        (n["id"], termino, min(cantidad, 65535))
+        for n in noticias
+        for termino, cantidad in contar_terminos(
+            f"{n.get('titulo') or ''} {n.get('descripcion') or ''}"
+        ).items()
+    ]
+    if filas:
+        cursor.executemany(
+            "INSERT INTO noticia_terminos (noticia_id, termino, cantidad) VALUES (%s, %s, %s)",
+            filas
+        )
+
+
+# ============================================================
+# 3️⃣ FRECUENCIAS PARA LA NUBE DE PALABRAS
+# ============================================================
+def frecuencias(categoria="", fuente="", dias="", query="", max_noticias=500, limite=80):
+    """
+    Retorna [(termino, total)] de las max_noticias más recientes que
+    cumplen los filtros, sin volver a tokenizar texto.
+    """
+    filtros = []
+    params = []
+
+    if categoria:
+        filtros.append("n.categoria = %s")
+        params.append(categoria)
+
+    if fuente:
+        filtros.append("n.fuente_id = (SELECT id FROM fuentes WHERE nombre = %s)")
+        params.append(fuente)
+
+    if dias:
+        try:
+            num = int(dias)
+            if 0 < num <= 365:
+                filtros.append(f"n.fecha_efectiva >= NOW() - INTERVAL {num} DAY")
+        except (TypeError, ValueError):
+            pass
+
+    if query:
+        condicion, params_texto = filtro_texto(query)
+        if condicion:
+            filtros.append(condicion)
+            params.extend(params_texto)
+
+    where = ("WHERE " + " AND ".join(filtros)) if filtros else ""
+
+    sql = f"""
+        SELECT t.termino, CAST(SUM(t.cantidad) AS SIGNED) AS total
+        FROM (
+            SELECT n.id
+            FROM noticias n
+            {where}
+            ORDER BY n.fecha_efectiva DESC
+            LIMIT %s
+        ) recientes
+        JOIN noticia_terminos t ON t.noticia_id = recientes.id
+        GROUP BY t.termino
+        ORDER BY total DESC
+        LIMIT %s;
+    """
+    params += [max_noticias, limite]
+
+    rows = execute_query(sql, tuple(params), fetch=True) or []
+    return [(r["termino"], int(r["total"])) for r in rows]
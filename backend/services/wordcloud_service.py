@@ -1,108 +1,214 @@
 # ============================================================
-# WordCloud Service — PRO 2025 (PNG HD + Limpieza Inteligente)
+# WordCloud Service — PRO 2025 (PNG/WebP HD + Limpieza Inteligente)
+# ============================================================
+#
+# El bitmap de WordCloud se codifica directo con Pillow (to_image):
+# sin figuras de matplotlib ni estado global de pyplot, seguro entre hilos.
+# Comparar rutas con: python benchmark_wordcloud.py
 # ============================================================
 
-import matplotlib
-matplotlib.use('Agg')
-
-import matplotlib.pyplot as plt
 from wordcloud import WordCloud
 from io import BytesIO
-from db import execute_query
-import re
+from collections import OrderedDict
+import hashlib
+import logging
+import threading
+import time
+from backend.services.terminos_service import limpiar_texto, frecuencias as frecuencias_terminos
+from backend.services.resumen_service import conteo_por_categoria
+
+# ------------------------------
+# ⚙️ Salida
+# ------------------------------
+ANCHO = 1400
+ALTO = 700
+ANCHO_MIN, ANCHO_MAX = 200, 2000
+FORMATO = "png"
+
+# formato → (formato Pillow, mimetype, opciones de guardado)
+FORMATOS = {
+    "png": ("PNG", "image/png", {"compress_level": 6}),
+    "webp": ("WEBP", "image/webp", {"quality": 85, "method": 4}),
+}
 
 
 # ============================================================
-# 🔹 Limpieza Inteligente de Texto (NLP Light)
+# 🔹 Renderizar (bitmap → PNG / WebP)
 # ============================================================
 
-def limpiar_texto(texto: str):
-    if not texto:
-        return ""
-
-    t = texto.lower()
-
-    # ---- Eliminar URLs ----
-    t = re.sub(r"http\S+", " ", t)
-    t = re.sub(r"www\S+", " ", t)
-
-    # ---- Basura de noticias / medios ----
-    t = re.sub(r"\b(pe|com|net|org|html|amp|video|portada|noticias|rpp|youtube|img)\b", " ", t)
-
-    # ---- Quitar símbolos y números ----
-    t = re.sub(r"[^a-záéíóúñü\s]", " ", t)
+def renderizar(frecuencias=None, texto=None, ancho=ANCHO, alto=ALTO, formato=FORMATO):
+    """
+    Genera la nube desde frecuencias ({termino: total}) o texto ya limpio
+    y devuelve los bytes de la imagen en el formato pedido.
+    """
 
-    # ---- Stopwords PRO LATAM ----
-    stopwords = set("""
-        de la los las un una unos unas que por para con sin del al en y o u
-        es son fue ser se ya más muy pero como sobre entre esto esta estas estos
-        así aún solo siempre nunca cada hacia haber siendo estaba están mismo misma
-        donde cuando porque entonces luego antes después durante tras dentro fuera
-        peru lima rpp mundo última ultimo ultimas ultimos
-        portada video imagen fotos foto ver vivo directo
-        cuenta verified share shares account comentario comentarios public publico
-        internacional nacional regional diario peruana peruano politica política
-        deportes futbol fútbol club seleccion peru
-        """.split())
+    formato_pil, _, opciones = FORMATOS[formato]
 
-    palabras = [
-        p for p in t.split()
-        if len(p) > 3 and p not in stopwords
-    ]
+    wc = WordCloud(
+        width=ancho,
+        height=alto,
+        background_color="white",
+        prefer_horizontal=0.9,
+        colormap="viridis",
+        max_words=100,
+        collocations=False
+    )
+    if frecuencias:
+        wc.generate_from_frequencies(frecuencias)
+    else:
+        wc.generate(texto)
 
-    return " ".join(palabras)
+    salida = BytesIO()
+    wc.to_image().save(salida, format=formato_pil, **opciones)
+    return salida.getvalue()
 
 
 # ============================================================
-# 🔹 Generar WordCloud (PNG HD)
+# 🔹 Generar WordCloud (HD)
 # ============================================================
 
-def generar_wordcloud(texto: str = None):
+def generar_wordcloud(texto: str = None, frecuencias=None, ancho=ANCHO, alto=ALTO, formato=FORMATO):
     """
     Si viene texto directo → se limpia y genera nube.
-    Si no viene texto → se extrae desde BD los últimos 400 títulos/descripciones.
+    Si vienen frecuencias ({termino: total}) → se usan tal cual.
+    Si no viene nada → términos precalculados de las últimas 400 noticias.
+
+    Retorna BytesIO con la imagen, o None si no hay palabras.
     """
 
+    texto_final = None
     if texto and texto.strip():
         texto_final = limpiar_texto(texto)
-    else:
-        rows = execute_query("""
-            SELECT titulo, descripcion
-            FROM noticias
-            ORDER BY COALESCE(fecha_publicacion, fecha_registro) DESC
-            LIMIT 400;
-        """, fetch=True)
-
-        if not rows:
+        if not texto_final.strip():
+            return None
+        frecuencias = None
+    elif not frecuencias:
+        frecuencias = dict(frecuencias_terminos(max_noticias=400, limite=100))
+        if not frecuencias:
             return None
 
-        texto_bruto = " ".join(
-            (r.get("titulo") or "") + " " + (r.get("descripcion") or "")
-            for r in rows
-        )
+    return BytesIO(renderizar(frecuencias, texto_final, ancho, alto, formato))
 
-        texto_final = limpiar_texto(texto_bruto)
 
-        if not texto_final.strip():
-            return None
+# ============================================================
+# 🔹 Caché de imágenes renderizadas (LRU en memoria)
+# ============================================================
 
-    wc = WordCloud(
-        width=1400,
-        height=700,
-        background_color="white",
-        prefer_horizontal=0.9,
-        colormap="viridis",
-        max_words=100,
-        collocations=False
-    ).generate(texto_final)
-
-    img = BytesIO()
-    plt.figure(figsize=(14, 7), dpi=120)
-    plt.imshow(wc, interpolation="bilinear")
-    plt.axis("off")
-    plt.tight_layout(pad=0)
-    plt.savefig(img, format="png", bbox_inches="tight", pad_inches=0)
-    plt.close()
-
-    img.seek(0)
-    return img
+TTL_WORDCLOUD = 15 * 60     # segundos; el ciclo del scraper (10 min) las regenera antes
+MAX_WORDCLOUDS = 64         # imágenes en memoria
+
+# Vistas que se renderizan tras cada ciclo: la inicial del Panel IA (7 días) y sin filtros
+VISTAS_PREDETERMINADAS = [
+    ("", "", 7, ""),
+    ("", "", "", ""),
+]
+CATEGORIAS_PRERENDER = 5    # además, las N categorías más activas de la semana
+
+
+def clave_wordcloud(categoria="", fuente="", dias="", q="", formato=FORMATO, ancho=ANCHO):
+    """Tupla normalizada (categoria, fuente, dias, q, formato, ancho) para la caché."""
+    try:
+        dias = int(dias)
+        dias = dias if 0 < dias <= 365 else ""
+    except (TypeError, ValueError):
+        dias = ""
+    try:
+        ancho = min(max(int(ancho), ANCHO_MIN), ANCHO_MAX)
+    except (TypeError, ValueError):
+        ancho = ANCHO
+    formato = (formato or "").lower()
+    return (
+        (categoria or "").strip(),
+        (fuente or "").strip(),
+        dias,
+        " ".join((q or "").lower().split()),
+        formato if formato in FORMATOS else FORMATO,
+        ancho
+    )
+
+
+class CacheWordclouds:
+    """
+    Imágenes ya renderizadas por filtros y salida, con expiración y desalojo LRU.
+
+    - obtener(clave) renderiza solo si no hay imagen vigente; si varios
+      requests piden la misma clave a la vez, renderiza uno solo.
+    - prerenderizar() regenera las vistas predeterminadas (tras cada ciclo).
+    """
+
+    def __init__(self, ttl=TTL_WORDCLOUD, maximo=MAX_WORDCLOUDS):
+        self.ttl = ttl
+        self.maximo = maximo
+        self._imagenes = OrderedDict()   # {clave: (expira, imagen, etag)}
+        self._bloqueos = {}              # {clave: Lock} render en curso
+        self._lock = threading.Lock()
+        self._lock_prerender = threading.Lock()
+
+    def _vigente(self, clave):
+        with self._lock:
+            entrada = self._imagenes.get(clave)
+            if entrada and entrada[0] > time.monotonic():
+                self._imagenes.move_to_end(clave)
+                return entrada[1], entrada[2]
+        return None
+
+    def _renderizar(self, clave):
+        categoria, fuente, dias, q, formato, ancho = clave
+        conteo = frecuencias_terminos(
+            categoria=categoria, fuente=fuente, dias=dias, query=q, limite=100
+        )
+        imagen = renderizar(dict(conteo), ancho=ancho, alto=ancho // 2, formato=formato) if conteo else b""
+
+        etag = hashlib.md5(imagen).hexdigest()
+        with self._lock:
+            self._imagenes[clave] = (time.monotonic() + self.ttl, imagen, etag)
+            self._imagenes.move_to_end(clave)
+            while len(self._imagenes) > self.maximo:
+                self._imagenes.popitem(last=False)
+        return imagen, etag
+
+    def obtener(self, clave):
+        """Devuelve (bytes, etag); bytes vacío si no hay términos."""
+        vigente = self._vigente(clave)
+        if vigente:
+            return vigente
+
+        with self._lock:
+            bloqueo = self._bloqueos.setdefault(clave, threading.Lock())
+
+        with bloqueo:
+            # Otro hilo pudo haberla renderizado mientras esperábamos
+            vigente = self._vigente(clave)
+            if vigente:
+                return vigente
+            try:
+                return self._renderizar(clave)
+            finally:
+                with self._lock:
+                    self._bloqueos.pop(clave, None)
+
+    def prerenderizar(self):
+        """Regenera las vistas predeterminadas; no hace nada si ya hay otra en curso."""
+        if not self._lock_prerender.acquire(blocking=False):
+            return
+        try:
+            claves = [clave_wordcloud(*v) for v in VISTAS_PREDETERMINADAS]
+            claves += [
+                clave_wordcloud(c["categoria"], "", 7, "")
+                for c in conteo_por_categoria(limit=CATEGORIAS_PRERENDER, dias=7)
+            ]
+            for clave in claves:
+                self._renderizar(clave)
+            logging.info(f"[WORDCLOUD] {len(claves)} nubes pre-renderizadas")
+        except Exception as e:
+            logging.error(f"[WORDCLOUD] Error pre-renderizando: {e}")
+        finally:
+            self._lock_prerender.release()
+
+    def prerenderizar_en_segundo_plano(self):
+        threading.Thread(
+            target=self.prerenderizar, daemon=True, name="PrerenderWordcloud"
+        ).start()
+
+
+cache_wordclouds = CacheWordclouds()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# ============================================================
+# ⏱️ benchmark_wordcloud.py — matplotlib vs to_image (latencia y RSS)
+# ============================================================
+#
+# Uso:
+#   python benchmark_wordcloud.py [--repeticiones 5]
+#
+# Cada ruta corre en un proceso nuevo para medir su pico de memoria
+# (ru_maxrss) sin que la otra lo contamine. Usa las frecuencias reales
+# de la BD; si no hay términos indexados, usa frecuencias sintéticas.
+# ============================================================
+
+import argparse
+import multiprocessing
+import random
+import resource
+import statistics
+import sys
+import time
+
+
+def _rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KB, macOS bytes
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _render_matplotlib(frecuencias):
+    """Ruta anterior: WordCloud → figura pyplot → savefig."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from wordcloud import WordCloud
+    from io import BytesIO
+
+    wc = WordCloud(
+        width=1400, height=700, background_color="white", prefer_horizontal=0.9,
+        colormap="viridis", max_words=100, collocations=False
+    ).generate_from_frequencies(frecuencias)
+
+    img = BytesIO()
+    plt.figure(figsize=(14, 7), dpi=120)
+    plt.imshow(wc, interpolation="bilinear")
+    plt.axis("off")
+    plt.tight_layout(pad=0)
+    plt.savefig(img, format="png", bbox_inches="tight", pad_inches=0)
+    plt.close()
+    return img.getvalue()
+
+
+def _medir(ruta, frecuencias, repeticiones, cola):
+    from backend.services.wordcloud_service import renderizar
+
+    rutas = {
+        "matplotlib (png)": _render_matplotlib,
+        "to_image (png)": lambda f: renderizar(f, formato="png"),
+        "to_image (webp)": lambda f: renderizar(f, formato="webp"),
+    }
+    funcion = rutas[ruta]
+
+    rss_inicial = _rss_mb()
+    tiempos = []
+    tamano = 0
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        tamano = len(funcion(frecuencias))
+        tiempos.append(time.perf_counter() - inicio)
+
+    cola.put({
+        "ruta": ruta,
+        "mediana_ms": statistics.median(tiempos) * 1000,
+        "max_ms": max(tiempos) * 1000,
+        "rss_pico_mb": _rss_mb(),
+        "rss_render_mb": _rss_mb() - rss_inicial,
+        "kb": tamano / 1024,
+    })
+
+
+def _frecuencias():
+    from backend.services.terminos_service import frecuencias
+
+    reales = dict(frecuencias(max_noticias=400, limite=100))
+    if reales:
+        return reales, "BD"
+
+    rnd = random.Random(42)
+    letras = "abcdefghijklmnopqrstuvwxyzáéíóúñ"
+    sinteticas = {
+        "".join(rnd.choice(letras) for _ in range(rnd.randint(4, 12))): rnd.randint(1, 200)
+        for _ in range(100)
+    }
+    return sinteticas, "sintéticas"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de render de wordclouds")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    frecuencias, origen = _frecuencias()
+    print(f"📊 {len(frecuencias)} términos ({origen}), {args.repeticiones} repeticiones por ruta\n")
+
+    contexto = multiprocessing.get_context("spawn")
+    print(f"{'Ruta':<20} {'mediana':>10} {'máx':>10} {'RSS pico':>10} {'RSS render':>11} {'tamaño':>9}")
+    print("-" * 75)
+
+    for ruta in ("matplotlib (png)", "to_image (png)", "to_image (webp)"):
+        cola = contexto.Queue()
+        proceso = contexto.Process(target=_medir, args=(ruta, frecuencias, args.repeticiones, cola))
+        proceso.start()
+        r = cola.get()
+        proceso.join()
+
+        print(f"{r['ruta']:<20} {r['mediana_ms']:>8.0f}ms {r['max_ms']:>8.0f}ms "
+              f"{r['rss_pico_mb']:>8.1f}MB {r['rss_render_mb']:>9.1f}MB {r['kb']:>7.0f}KB")
+
+
+if __name__ == "__main__":
+    main()
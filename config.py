@@ -0,0 +1,37 @@
+# ============================================================
+# ⚙️ config.py — Configuración por variables de entorno
+# ============================================================
+#
+# SOCKETIO_ASYNC_MODE     threading (por defecto), eventlet o gevent.
+#                         eventlet/gevent sostienen miles de websockets
+#                         en un proceso; hay que instalarlos aparte.
+# SOCKETIO_MESSAGE_QUEUE  URL de la cola compartida entre procesos, p. ej.
+#                         redis://localhost:6379/0 o amqp://guest@localhost//
+#                         Sin cola, los eventos solo llegan a los clientes
+#                         del proceso que emite (un solo worker web).
+#
+# Este módulo no importa nada del proyecto: app.py lo lee antes que
+# cualquier otro import para aplicar el monkey patching a tiempo.
+# ============================================================
+
+import os
+
+MODOS_ASYNC = ("threading", "eventlet", "gevent")
+
+SOCKETIO_ASYNC_MODE = os.environ.get("SOCKETIO_ASYNC_MODE", "threading").strip().lower()
+if SOCKETIO_ASYNC_MODE not in MODOS_ASYNC:
+    raise ValueError(
+        f"SOCKETIO_ASYNC_MODE='{SOCKETIO_ASYNC_MODE}' no válido; usar uno de {', '.join(MODOS_ASYNC)}"
+    )
+
+SOCKETIO_MESSAGE_QUEUE = os.environ.get("SOCKETIO_MESSAGE_QUEUE", "").strip() or None
+
+
+def parchear_async():
+    """Monkey patching de eventlet/gevent; debe correr antes de importar lo demás."""
+    if SOCKETIO_ASYNC_MODE == "eventlet":
+        import eventlet
+        eventlet.monkey_patch()
+    elif SOCKETIO_ASYNC_MODE == "gevent":
+        from gevent import monkey
+        monkey.patch_all()
@@ -0,0 +1,24 @@
+# ============================================================
+# 🧪 conftest.py — Pruebas sin servidor MySQL
+# ============================================================
+#
+# db.py abre el pool MySQL al importarse. Aquí se importa una vez con un
+# pool falso: toda conexión falla como si no hubiera servidor, así que
+# las pruebas reemplazan connection_pool o las funciones que necesiten.
+# ============================================================
+
+from unittest import mock
+
+
+class PoolSinServidor:
+    """Sustituye a MySQLConnectionPool: toda conexión falla como sin servidor."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def get_connection(self):
+        raise ConnectionError("sin servidor MySQL en las pruebas")
+
+
+with mock.patch("mysql.connector.pooling.MySQLConnectionPool", PoolSinServidor):
+    import db  # noqa: F401
@@ -4,6 +4,9 @@
 import mysql.connector
 from mysql.connector import pooling
 import logging
+import threading
+import time
+from collections import Counter
 from datetime import datetime
 
 # ------------------------------------------------------------
@@ -41,7 +44,7 @@ except Exception as e:
 # ------------------------------------------------------------
 # 🔹 Función general para ejecutar queries
 # ------------------------------------------------------------
-def execute_query(query, params=None, fetch=False, commit=False):
+def execute_query(query, params=None, fetch=False, commit=False, lastrowid=False):
     """
     Ejecuta una consulta SQL usando el pool de conexiones.
 
@@ -50,9 +53,10 @@ def execute_query(query, params=None, fetch=False, commit=False):
         params (tuple): Parámetros opcionales para el query.
         fetch (bool): Si True, devuelve los resultados.
         commit (bool): Si True, confirma la transacción.
+        lastrowid (bool): Si True, devuelve el id generado por el INSERT.
 
     Retorna:
-        list[dict] o None
+        list[dict], int o None
     """
     conn = None
     cursor = None
@@ -69,6 +73,9 @@ def execute_query(query, params=None, fetch=False, commit=False):
             result = cursor.fetchall()
             return result or []   # Evita devolver None
 
+        if lastrowid:
+            return cursor.lastrowid
+
     except Exception as e:
         logging.error(f"[DB ERROR] {e} | Query: {query}")
         if conn:
@@ -81,66 +88,630 @@ def execute_query(query, params=None, fetch=False, commit=False):
             conn.close()
 
 # ------------------------------------------------------------
-# 🔹 Función específica para guardar noticias
+# 🔹 Ejecutar una consulta con muchos juegos de parámetros
 # ------------------------------------------------------------
-def guardar_noticia(fuente, titulo, categoria, subtitulo, descripcion, url_noticia, url_imagen, fecha_publicacion=None):
+def execute_many(query, seq_params, commit=True):
     """
-    Inserta o actualiza una noticia en la base de datos.
+    Ejecuta la misma consulta para cada tupla de seq_params en una sola
+    conexión y una sola transacción (los INSERT se envían como multi-row).
 
-    - Si la fuente no existe, la crea automáticamente.
-    - Si la noticia ya existe (mismo URL), actualiza los campos.
+    Retorna el rowcount total, o None si hubo error.
     """
+    conn = None
+    cursor = None
     try:
-        if not titulo or not url_noticia:
-            logging.warning(f"[SKIP] Noticia sin título o URL ({fuente})")
-            return
+        conn = connection_pool.get_connection()
+        cursor = conn.cursor()
+
+        cursor.executemany(query, list(seq_params))
+
+        if commit:
+            conn.commit()
+
+        return cursor.rowcount
+
+    except Exception as e:
+        logging.error(f"[DB ERROR] {e} | Query (many): {query}")
+        if conn:
+            conn.rollback()
+        return None
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+# ------------------------------------------------------------
+# 🔹 Registro de fuentes en memoria (nombre → id)
+# ------------------------------------------------------------
+TTL_FUENTES = 300   # segundos; red de seguridad ante cambios de otro proceso
 
-        # Asegurar fecha válida
-        if not fecha_publicacion:
-            fecha_publicacion = datetime.now()
 
-        # Buscar fuente o crearla si no existe
-        fuente_id_query = "SELECT id FROM fuentes WHERE nombre = %s"
-        fuente_id_result = execute_query(fuente_id_query, (fuente,), fetch=True)
+class RegistroFuentes:
+    """
+    Caché de proceso de la tabla fuentes (son pocas y casi no cambian).
+
+    - Se carga una vez con una sola consulta.
+    - Resuelve nombre → id en memoria.
+    - Crea las fuentes faltantes de forma atómica (INSERT ... ON DUPLICATE KEY,
+      requiere la clave única de migraciones/010_fuentes_nombre_unico.sql).
+    - invalidar() fuerza la recarga; hay que llamarlo al editar fuentes.
+    """
+
+    def __init__(self, ttl=TTL_FUENTES):
+        self.ttl = ttl
+        self._por_nombre = {}
+        self._lista = []
+        self._cargado_en = None
+        self._lock = threading.Lock()
+
+    def _vigente(self):
+        return self._cargado_en is not None and (time.monotonic() - self._cargado_en) < self.ttl
+
+    def _cargar(self):
+        rows = execute_query("SELECT id, nombre FROM fuentes ORDER BY nombre;", fetch=True) or []
+        self._lista = [{"id": r["id"], "nombre": r["nombre"]} for r in rows]
+        self._por_nombre = {r["nombre"]: r["id"] for r in rows}
+        self._cargado_en = time.monotonic()
+
+    def listar(self):
+        """Lista [{id, nombre}] ordenada por nombre."""
+        with self._lock:
+            if not self._vigente():
+                self._cargar()
+            return [dict(f) for f in self._lista]
 
-        if not fuente_id_result:
-            insert_fuente = "INSERT INTO fuentes (nombre, url, fecha_registro) VALUES (%s, '', NOW())"
-            execute_query(insert_fuente, (fuente,), commit=True)
-            fuente_id_result = execute_query(fuente_id_query, (fuente,), fetch=True)
+    def obtener_id(self, nombre, crear=True):
+        """Id de la fuente; si no existe y crear=True, la crea."""
+        with self._lock:
+            if not self._vigente():
+                self._cargar()
 
-        fuente_id = fuente_id_result[0]["id"]
+            fuente_id = self._por_nombre.get(nombre)
+            if fuente_id or not crear:
+                return fuente_id
 
-        # Insertar o actualizar noticia
-        sql = """
-            INSERT INTO noticias (
-                fuente_id, titulo, categoria, subtitulo, descripcion,
-                url_noticia, url_imagen, fecha_publicacion, fecha_registro
+            # LAST_INSERT_ID(id) devuelve el id existente si otro proceso ganó la carrera
+            fuente_id = execute_query(
+                """
+                INSERT INTO fuentes (nombre, url, fecha_registro) VALUES (%s, '', NOW())
+                ON DUPLICATE KEY UPDATE id = LAST_INSERT_ID(id)
+                """,
+                (nombre,), commit=True, lastrowid=True
             )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW())
-            ON DUPLICATE KEY UPDATE
-                subtitulo = VALUES(subtitulo),
-                descripcion = VALUES(descripcion),
-                url_imagen = VALUES(url_imagen),
-                fecha_publicacion = VALUES(fecha_publicacion),
-                fecha_registro = NOW()
-        """
-
-        execute_query(
-            sql,
+            if not fuente_id:
+                raise RuntimeError(f"No se pudo registrar la fuente '{nombre}'")
+
+            logging.info(f"[FUENTES] Registrada fuente '{nombre}' (id={fuente_id})")
+            self._cargar()
+            return fuente_id
+
+    def invalidar(self):
+        with self._lock:
+            self._cargado_en = None
+
+
+registro_fuentes = RegistroFuentes()
+
+
+def obtener_fuente_id(nombre, crear=True):
+    return registro_fuentes.obtener_id(nombre, crear)
+
+
+def listar_fuentes():
+    return registro_fuentes.listar()
+
+
+def invalidar_fuentes():
+    registro_fuentes.invalidar()
+
+# ------------------------------------------------------------
+# 🔹 Suscriptores a cambios en noticias
+# ------------------------------------------------------------
+_suscriptores_noticias = []
+
+
+def al_cambiar_noticias(callback):
+    """
+    Registra callback(noticias) que se llama después de cada escritura
+    confirmada en noticias (lotes del scraper y cambios del admin).
+    Puede usarse como decorador.
+
+    noticias: [{id, fuente, titulo, categoria, url_noticia, nueva}] de un
+    lote del scraper (nueva=False si ya existía); vacía en los demás casos.
+    """
+    _suscriptores_noticias.append(callback)
+    return callback
+
+
+def notificar_cambio_noticias(noticias=None):
+    """Avisa a los suscriptores; un error en uno no afecta a los demás."""
+    for callback in list(_suscriptores_noticias):
+        try:
+            callback(noticias or [])
+        except Exception as e:
+            logging.error(f"[DB] Error en suscriptor {getattr(callback, '__name__', callback)}: {e}")
+
+# ------------------------------------------------------------
+# 🔹 Datos derivados de cada noticia
+# ------------------------------------------------------------
+# Toda escritura en noticias mantiene, en la misma transacción:
+#   - resumen_noticias: conteos por (día, fuente, categoría)
+#     (ver migraciones/004_resumen_noticias.sql). Se toman las claves de
+#     las filas afectadas antes y después y se suma la diferencia.
+#   - índices por noticia (términos, sentimiento, riesgo) de las filas
+#     nuevas o cuyo texto cambió; ver _indexar.
+
+SQL_FILAS_NOTICIAS = """
+    SELECT id, url_noticia, titulo, subtitulo, descripcion, url_imagen,
+           fecha_publicacion, fecha_efectiva,
+           DATE(fecha_efectiva) AS dia, fuente_id, categoria
+    FROM noticias
+    WHERE {filtro}
+"""
+
+SQL_SUMAR_RESUMEN = """
+    INSERT INTO resumen_noticias (dia, fuente_id, categoria, total)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE total = total + VALUES(total)
+"""
+
+
+def _filas_noticias(cursor, filtro, params):
+    """Filas [{id, url_noticia, titulo, ..., fecha_efectiva, dia, fuente_id, categoria}] del filtro."""
+    cursor.execute(SQL_FILAS_NOTICIAS.format(filtro=filtro), params)
+    columnas = [c[0] for c in cursor.description]
+    return [dict(zip(columnas, r)) for r in cursor.fetchall()]
+
+
+def _claves_resumen(filas):
+    """Counter {(dia, fuente_id, categoria): noticias}."""
+    return Counter(
+        (f["dia"], f["fuente_id"], f["categoria"])
+        for f in filas if f["dia"] is not None
+    )
+
+
+def _aplicar_resumen(cursor, antes, despues):
+    """Suma en resumen_noticias la diferencia entre dos juegos de filas."""
+    deltas = _claves_resumen(despues)
+    deltas.subtract(_claves_resumen(antes))
+    filas = [(dia, fuente_id, categoria, n) for (dia, fuente_id, categoria), n in deltas.items() if n]
+    if filas:
+        cursor.executemany(SQL_SUMAR_RESUMEN, filas)
+
+
+def _texto_cambiado(antes, despues):
+    """Filas de despues que son nuevas o cuyo titulo/descripcion cambió."""
+    previas = {f["id"]: (f["titulo"], f["descripcion"]) for f in antes}
+    return [
+        f for f in despues
+        if previas.get(f["id"]) != (f["titulo"], f["descripcion"])
+    ]
+
+
+SQL_PUNTAJES = """
+    UPDATE noticias
+    SET sentimiento = %s, riesgo_nivel = %s, riesgo_conteo = %s
+    WHERE id = %s
+"""
+
+
+def _indexar(cursor, filas):
+    """
+    Recalcula los índices y puntajes por noticia de las filas indicadas.
+    Deja riesgo_nivel / riesgo_conteo en cada fila para _publicar_alertas.
+    """
+    if not filas:
+        return
+    # Import diferido: los servicios importan db
+    from backend.services.terminos_service import indexar_terminos
+    from backend.services.sentimiento_service import valor_sentimiento
+    from backend.services.alertas_service import evaluar_riesgo
+
+    indexar_terminos(cursor, filas)
+
+    puntajes = []
+    for f in filas:
+        texto = f"{f.get('titulo') or ''} {f.get('descripcion') or ''}"
+        nivel, conteo = evaluar_riesgo(texto)
+        f["riesgo_nivel"], f["riesgo_conteo"] = nivel, conteo
+        puntajes.append((valor_sentimiento(texto), nivel, min(conteo, 255), f["id"]))
+    cursor.executemany(SQL_PUNTAJES, puntajes)
+
+
+def _mantener_derivados(cursor, antes, despues):
+    """Retorna (filas reindexadas, ids eliminados) para publicar tras el commit."""
+    _aplicar_resumen(cursor, antes, despues)
+    cambiadas = _texto_cambiado(antes, despues)
+    _indexar(cursor, cambiadas)
+    quedan = {f["id"] for f in despues}
+    return cambiadas, [f["id"] for f in antes if f["id"] not in quedan]
+
+
+def _publicar_alertas(cambiadas, eliminadas=()):
+    """Pasa al monitor de alertas las noticias ya confirmadas."""
+    if not cambiadas and not eliminadas:
+        return
+    try:
+        from backend.services.alertas_service import monitor_alertas
+        monitor_alertas.actualizar(cambiadas, eliminadas)
+    except Exception as e:
+        logging.error(f"[ALERTAS] No se pudo actualizar el monitor: {e}")
+
+
+def escribir_noticia(query, params, filtro, params_filtro):
+    """
+    Ejecuta una escritura sobre noticias (INSERT / UPDATE / DELETE) y
+    mantiene los datos derivados en la misma transacción.
+
+    filtro / params_filtro: condición WHERE que identifica las filas
+    afectadas antes y después de la escritura (p. ej. "id = %s").
+
+    Retorna True si se confirmó la transacción.
+    """
+    conn = None
+    cursor = None
+    try:
+        conn = connection_pool.get_connection()
+        cursor = conn.cursor()
+
+        antes = _filas_noticias(cursor, filtro + " FOR UPDATE", params_filtro)
+        cursor.execute(query, params or ())
+        despues = _filas_noticias(cursor, filtro, params_filtro)
+        derivados = _mantener_derivados(cursor, antes, despues)
+
+        conn.commit()
+        _publicar_alertas(*derivados)
+        return True
+
+    except Exception as e:
+        logging.error(f"[DB ERROR] {e} | Query: {query}")
+        if conn:
+            conn.rollback()
+        return False
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+
+def reconstruir_resumen():
+    """
+    Recalcula resumen_noticias desde cero (backfill o tras cambios hechos
+    fuera de la aplicación). Retorna la cantidad de filas generadas.
+    """
+    conn = None
+    cursor = None
+    try:
+        conn = connection_pool.get_connection()
+        cursor = conn.cursor()
+
+        # DELETE (no TRUNCATE) para que el reemplazo sea atómico
+        cursor.execute("DELETE FROM resumen_noticias")
+        cursor.execute("""
+            INSERT INTO resumen_noticias (dia, fuente_id, categoria, total)
+            SELECT DATE(fecha_efectiva), fuente_id, categoria, COUNT(*)
+            FROM noticias
+            WHERE fecha_efectiva IS NOT NULL
+            GROUP BY DATE(fecha_efectiva), fuente_id, categoria
+        """)
+        filas = cursor.rowcount
+        conn.commit()
+
+        logging.info(f"[RESUMEN] Reconstruido: {filas} filas")
+        return filas
+
+    except Exception as e:
+        logging.error(f"[ERROR] No se pudo reconstruir resumen_noticias: {e}")
+        if conn:
+            conn.rollback()
+        return None
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+
+def reindexar_noticias(desde_id=0, limite=500):
+    """
+    Recalcula los índices por noticia de hasta `limite` noticias con
+    id > desde_id (backfill por tramos). Retorna el último id procesado
+    (desde_id si ya no quedan), o None si hubo error.
+    """
+    conn = None
+    cursor = None
+    try:
+        conn = connection_pool.get_connection()
+        cursor = conn.cursor()
+
+        filas = _filas_noticias(cursor, "id > %s ORDER BY id LIMIT %s", (desde_id, limite))
+        if not filas:
+            return desde_id
+
+        _indexar(cursor, filas)
+        conn.commit()
+        _publicar_alertas(filas)
+        return filas[-1]["id"]
+
+    except Exception as e:
+        logging.error(f"[ERROR] No se pudieron reindexar noticias desde id={desde_id}: {e}")
+        if conn:
+            conn.rollback()
+        return None
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+# ------------------------------------------------------------
+# 🔹 Guardado de noticias por lotes
+# ------------------------------------------------------------
+TAMANO_LOTE = 50        # noticias por flush
+INTERVALO_LOTE = 5      # segundos máximos que una noticia espera en el buffer
+
+SQL_UPSERT_NOTICIA = """
+    INSERT INTO noticias (
+        fuente_id, titulo, categoria, subtitulo, descripcion,
+        url_noticia, url_imagen, fecha_publicacion, fecha_registro
+    )
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        imagen_valida = IF(url_imagen <=> VALUES(url_imagen), imagen_valida, NULL),
+        subtitulo = VALUES(subtitulo),
+        descripcion = VALUES(descripcion),
+        url_imagen = VALUES(url_imagen),
+        fecha_publicacion = COALESCE(VALUES(fecha_publicacion), fecha_publicacion)
+"""
+# Sin fecha de publicación se inserta NULL: fecha_efectiva cae en fecha_registro,
+# que no cambia al volver a ver la noticia, así no sube en la portada cada ciclo.
+
+
+def _sin_cambios(previa, fila):
+    """True si el upsert de fila (ver guardar_noticias_lote) no cambiaría la noticia guardada."""
+    if previa is None:
+        return False
+    _, _, _, subtitulo, descripcion, _, url_imagen, fecha, _ = fila
+    return (
+        (previa["subtitulo"], previa["descripcion"], previa["url_imagen"]) == (subtitulo, descripcion, url_imagen)
+        and (fecha is None or fecha == previa["fecha_publicacion"])
+    )
+
+
+def guardar_noticias_lote(noticias):
+    """
+    Inserta o actualiza un lote de noticias en una sola transacción.
+
+    noticias: lista de tuplas con el mismo orden de guardar_noticia:
+        (fuente, titulo, categoria, subtitulo, descripcion,
+         url_noticia, url_imagen, fecha_publicacion)
+
+    - Las fuentes se resuelven en memoria con el registro de fuentes.
+    - Las noticias se escriben con un único executemany (multi-row upsert).
+    - Las que ya están guardadas sin cambios no se reescriben ni se notifican.
+    - resumen_noticias y los índices por noticia se ajustan en la misma transacción.
+
+    Retorna la cantidad de noticias procesadas (escritas o sin cambios); 0 si falló.
+    """
+    # Deduplicar por URL dentro del lote (gana la última aparición)
+    por_url = {}
+    for n in noticias:
+        fuente, titulo, categoria, subtitulo, descripcion, url_noticia, url_imagen, fecha = n
+        if not titulo or not url_noticia:
+            logging.warning(f"[SKIP] Noticia sin título o URL ({fuente})")
+            continue
+        por_url[url_noticia] = n
+
+    if not por_url:
+        return 0
+
+    ahora = datetime.now()
+    conn = None
+    cursor = None
+    try:
+        conn = connection_pool.get_connection()
+        cursor = conn.cursor()
+
+        fuentes = {nombre: obtener_fuente_id(nombre) for nombre in {n[0] for n in por_url.values()}}
+
+        filas = [
             (
-                fuente_id,
+                fuentes[fuente],
                 titulo[:255],
                 categoria or "General",
                 subtitulo or "",
                 descripcion or "",
                 url_noticia,
                 url_imagen or "",
-                fecha_publicacion
-            ),
-            commit=True
-        )
+                fecha,
+                ahora
+            )
+            for fuente, titulo, categoria, subtitulo, descripcion, url_noticia, url_imagen, fecha
+            in por_url.values()
+        ]
 
-        logging.info(f"[OK] Guardada noticia de {fuente}: {titulo[:80]}")
+        marcadores = ", ".join(["%s"] * len(por_url))
+        previas = {
+            f["url_noticia"]: f
+            for f in _filas_noticias(cursor, f"url_noticia IN ({marcadores}) FOR UPDATE", tuple(por_url))
+        }
+        filas = [f for f in filas if not _sin_cambios(previas.get(f[5]), f)]
+
+        antes, despues, derivados = [], [], ([], [])
+        if filas:
+            urls = tuple(f[5] for f in filas)
+            filtro = f"url_noticia IN ({', '.join(['%s'] * len(urls))})"
+            antes = [previas[u] for u in urls if u in previas]
+            cursor.executemany(SQL_UPSERT_NOTICIA, filas)
+            despues = _filas_noticias(cursor, filtro, urls)
+            derivados = _mantener_derivados(cursor, antes, despues)
+        conn.commit()
+
+        logging.info(f"[OK] Lote guardado: {len(filas)} de {len(por_url)} noticias con cambios")
 
     except Exception as e:
-        logging.error(f"[ERROR] No se pudo guardar noticia ({fuente}): {e}")
+        logging.error(f"[ERROR] No se pudo guardar lote de {len(por_url)} noticias: {e}")
+        if conn:
+            conn.rollback()
+        return 0
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+    if filas:
+        # nueva=True solo para inserciones reales (no las actualizadas por ON DUPLICATE KEY)
+        ids = {f["url_noticia"]: f["id"] for f in despues}
+        _publicar_alertas(*derivados)
+        notificar_cambio_noticias([
+            {
+                "id": ids.get(n[5]), "fuente": n[0], "titulo": n[1],
+                "categoria": n[2] or "General", "url_noticia": n[5],
+                "nueva": n[5] not in previas
+            }
+            for n in (por_url[f[5]] for f in filas)
+        ])
+    return len(por_url)
+
+
+class GuardadoPorLotes:
+    """
+    save_func con buffer para los scrapers.
+
+    Tiene la misma firma que guardar_noticia, pero acumula las noticias y
+    las escribe con guardar_noticias_lote cuando el buffer llega a
+    TAMANO_LOTE o cuando pasan INTERVALO_LOTE segundos.
+
+    Uso:
+        with GuardadoPorLotes() as guardar:
+            scraper.run({}, guardar)
+
+    al_escribir(urls, callback) difiere una acción (contar lo guardado,
+    guardar los validadores de un feed) hasta que esas noticias se hayan
+    escrito: tras el siguiente flush se llama callback(escritas) con las
+    URLs que no estaban en un lote fallido. Ver cuando_se_escriban.
+    """
+
+    def __init__(self, tamano_lote=TAMANO_LOTE, intervalo=INTERVALO_LOTE):
+        self.tamano_lote = tamano_lote
+        self.intervalo = intervalo
+        self.total_guardadas = 0
+
+        self._buffer = []
+        self._confirmaciones = []   # [(urls, callback)] pendientes del próximo flush
+        self._fallidas = set()      # URLs de lotes que no se pudieron escribir
+        self._lock = threading.Lock()
+        self._lock_escritura = threading.Lock()   # una sola conexión del pool a la vez
+        self._lock_confirmaciones = threading.Lock()   # callbacks de a uno
+        self._detener = threading.Event()
+        self._hilo = None
+
+    def __call__(self, fuente, titulo, categoria, subtitulo, descripcion,
+                 url_noticia, url_imagen, fecha_publicacion=None):
+        with self._lock:
+            self._buffer.append((
+                fuente, titulo, categoria, subtitulo, descripcion,
+                url_noticia, url_imagen, fecha_publicacion
+            ))
+            lleno = len(self._buffer) >= self.tamano_lote
+
+        if lleno:
+            self.flush()
+
+    def al_escribir(self, urls, callback):
+        """callback(escritas) tras el próximo flush, con las urls que llegaron a la BD."""
+        with self._lock:
+            self._confirmaciones.append((list(urls), callback))
+
+    def flush(self):
+        """Escribe lo que haya en el buffer y luego corre los callbacks de al_escribir."""
+        with self._lock_escritura:
+            with self._lock:
+                lote, self._buffer = self._buffer, []
+                confirmaciones, self._confirmaciones = self._confirmaciones, []
+            if lote:
+                guardadas = guardar_noticias_lote(lote)
+                self.total_guardadas += guardadas
+                if not guardadas:
+                    self._fallidas.update(n[5] for n in lote if n[1] and n[5])
+            fallidas = set(self._fallidas)
+
+        # Fuera del lock de escritura: los callbacks pueden volver a tocar la BD
+        with self._lock_confirmaciones:
+            for urls, callback in confirmaciones:
+                try:
+                    callback([u for u in urls if u not in fallidas])
+                except Exception as e:
+                    logging.error(f"[ERROR] Confirmación tras flush: {e}")
+
+    def _flush_periodico(self):
+        while not self._detener.wait(self.intervalo):
+            try:
+                self.flush()
+            except Exception as e:
+                logging.error(f"[ERROR] Flush periódico: {e}")
+
+    def iniciar(self):
+        self._detener.clear()
+        self._hilo = threading.Thread(
+            target=self._flush_periodico, daemon=True, name="GuardadoPorLotes"
+        )
+        self._hilo.start()
+        return self
+
+    def cerrar(self):
+        self._detener.set()
+        if self._hilo:
+            self._hilo.join()
+            self._hilo = None
+        self.flush()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.cerrar()
+        return False
+
+
+def cuando_se_escriban(save_func, urls, callback):
+    """
+    callback(escritas) cuando las noticias de urls estén en la BD.
+
+    Con GuardadoPorLotes, tras el flush que las escribe y solo con las de
+    lotes que no fallaron; con un save_func que escribe en el acto, enseguida.
+    """
+    diferir = getattr(save_func, "al_escribir", None)
+    if diferir is None:
+        callback(list(urls))
+    else:
+        diferir(urls, callback)
+
+
+def volcar_pendientes(save_func):
+    """Fuerza el flush de save_func si acumula (GuardadoPorLotes)."""
+    flush = getattr(save_func, "flush", None)
+    if flush is not None:
+        flush()
+
+# ------------------------------------------------------------
+# 🔹 Función específica para guardar noticias
+# ------------------------------------------------------------
+def guardar_noticia(fuente, titulo, categoria, subtitulo, descripcion, url_noticia, url_imagen, fecha_publicacion=None):
+    """
+    Inserta o actualiza una noticia en la base de datos.
+
+    - Si la fuente no existe, la crea automáticamente.
+    - Si la noticia ya existe (mismo URL), actualiza los campos.
+
+    Para volúmenes grandes usar GuardadoPorLotes.
+    """
+    if guardar_noticias_lote([(
+        fuente, titulo, categoria, subtitulo, descripcion,
+        url_noticia, url_imagen, fecha_publicacion
+    )]):
+        logging.info(f"[OK] Guardada noticia de {fuente}: {titulo[:80]}")
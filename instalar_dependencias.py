@@ -27,6 +27,9 @@ dependencias = [
 dependencias_opcionales = [
     ("flask-socketio", "Flask-SocketIO", "Notificaciones en tiempo real"),
     ("python-socketio", "python-socketio", "Soporte WebSocket"),
+    ("aiohttp", "aiohttp", "Scraper asíncrono (scraper_async.py)"),
+    ("redis", "redis", "Cola SocketIO entre procesos (SOCKETIO_MESSAGE_QUEUE)"),
+    ("eventlet", "eventlet", "Miles de websockets (SOCKETIO_ASYNC_MODE=eventlet)"),
 ]
 
 print("🔍 Verificando dependencias instaladas...\n")
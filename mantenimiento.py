@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# ============================================================
+# 🛠️ mantenimiento.py — Tareas de mantenimiento de la BD
+# ============================================================
+#
+# Uso:
+#   python mantenimiento.py validar-imagenes [--limite 500]
+#   python mantenimiento.py reconstruir-resumen
+#   python mantenimiento.py verificar-indices
+#   python mantenimiento.py indexar-noticias [--limite 500]
+# ============================================================
+
+import argparse
+
+# (descripción, consulta, parámetros, índice esperado) para verificar-indices.
+# Son las formas de consulta que usan el listado, los filtros y el cursor.
+CONSULTAS_INDICES = [
+    (
+        "Portada / listado general",
+        "SELECT id FROM noticias ORDER BY fecha_efectiva DESC, id DESC LIMIT 13",
+        (), "idx_fecha_efectiva"
+    ),
+    (
+        "Listado por categoría",
+        "SELECT id FROM noticias WHERE categoria = %s "
+        "ORDER BY fecha_efectiva DESC, id DESC LIMIT 13",
+        ("Política",), "idx_categoria_fecha"
+    ),
+    (
+        "Listado por fuente",
+        "SELECT id FROM noticias WHERE fuente_id = %s "
+        "ORDER BY fecha_efectiva DESC, id DESC LIMIT 13",
+        (1,), "idx_fuente_fecha"
+    ),
+    (
+        "Cursor dentro de una categoría",
+        "SELECT id FROM noticias WHERE categoria = %s "
+        "AND (fecha_efectiva, id) < (NOW(), %s) "
+        "ORDER BY fecha_efectiva DESC, id DESC LIMIT 13",
+        ("Política", 1000), "idx_categoria_fecha"
+    ),
+    (
+        "Ventana de días (wordcloud)",
+        "SELECT id FROM noticias WHERE fecha_efectiva >= NOW() - INTERVAL 7 DAY "
+        "ORDER BY fecha_efectiva DESC LIMIT 500",
+        (), "idx_fecha_efectiva"
+    ),
+    (
+        "Sentimiento por rango de días",
+        "SELECT sentimiento, COUNT(*) FROM noticias "
+        "WHERE sentimiento IS NOT NULL AND fecha_efectiva >= NOW() - INTERVAL 7 DAY "
+        "GROUP BY sentimiento",
+        (), "idx_fecha_sentimiento"
+    ),
+    (
+        "Alertas de riesgo",
+        "SELECT id FROM noticias WHERE riesgo_nivel > 0 "
+        "AND fecha_efectiva >= NOW() - INTERVAL 7 DAY "
+        "ORDER BY riesgo_nivel DESC, riesgo_conteo DESC, fecha_efectiva DESC LIMIT 30",
+        (), "idx_riesgo"
+    ),
+]
+
+
+def cmd_validar_imagenes(args):
+    from backend.services.helpers import validar_imagenes_pendientes
+
+    total = 0
+    while True:
+        procesadas = validar_imagenes_pendientes(args.limite)
+        total += procesadas
+        if procesadas < args.limite:
+            break
+    print(f"✅ {total} imágenes validadas")
+
+
+def cmd_reconstruir_resumen(args):
+    from db import reconstruir_resumen, notificar_cambio_noticias
+
+    filas = reconstruir_resumen()
+    if filas is None:
+        raise SystemExit("❌ No se pudo reconstruir resumen_noticias (ver logs/db_*.log)")
+    notificar_cambio_noticias()
+    print(f"✅ resumen_noticias reconstruido: {filas} filas")
+
+
+def cmd_indexar_noticias(args):
+    from db import reindexar_noticias
+
+    ultimo_id = 0
+    tramos = 0
+    while True:
+        siguiente = reindexar_noticias(ultimo_id, args.limite)
+        if siguiente is None:
+            raise SystemExit(f"❌ Error reindexando desde id {ultimo_id} (ver logs/db_*.log)")
+        if siguiente == ultimo_id:
+            break
+        ultimo_id = siguiente
+        tramos += 1
+        print(f"  … hasta id {ultimo_id}")
+    print(f"✅ Noticias reindexadas en {tramos} tramos")
+
+
+def cmd_verificar_indices(args):
+    from db import execute_query
+
+    fallos = 0
+    for descripcion, sql, params, esperado in CONSULTAS_INDICES:
+        plan = execute_query("EXPLAIN " + sql, params, fetch=True)
+        if not plan:
+            raise SystemExit("❌ No se pudo ejecutar EXPLAIN (ver logs/db_*.log)")
+
+        fila = plan[0]
+        extra = fila.get("Extra") or ""
+        ok = fila.get("key") == esperado and "filesort" not in extra
+        fallos += not ok
+
+        print(f"{'✅' if ok else '❌'} {descripcion}: key={fila.get('key')} "
+              f"(esperado {esperado}) rows={fila.get('rows')} {extra}")
+
+    if fallos:
+        # Con tablas casi vacías el optimizador puede preferir un scan completo
+        raise SystemExit(f"❌ {fallos} consultas sin el índice esperado")
+    print("✅ Todas las consultas usan su índice")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mantenimiento del Portal de Noticias")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("validar-imagenes", help="Valida las imágenes pendientes y guarda imagen_valida")
+    p.add_argument("--limite", type=int, default=500, help="URLs por lote")
+    p.set_defaults(func=cmd_validar_imagenes)
+
+    p = sub.add_parser("reconstruir-resumen", help="Recalcula resumen_noticias desde la tabla noticias")
+    p.set_defaults(func=cmd_reconstruir_resumen)
+
+    p = sub.add_parser("indexar-noticias", help="Recalcula términos, sentimiento y riesgo de todas las noticias")
+    p.add_argument("--limite", type=int, default=500, help="Noticias por tramo")
+    p.set_defaults(func=cmd_indexar_noticias)
+
+    p = sub.add_parser("verificar-indices", help="Comprueba con EXPLAIN que las consultas del listado usan índices")
+    p.set_defaults(func=cmd_verificar_indices)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
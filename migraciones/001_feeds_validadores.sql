@@ -0,0 +1,13 @@
+-- ============================================================
+-- 001 — Validadores HTTP (ETag / Last-Modified) de los feeds RSS
+-- Uso: mysql -u root portal_noticias < migraciones/001_feeds_validadores.sql
+-- ============================================================
+USE portal_noticias;
+
+CREATE TABLE IF NOT EXISTS feeds_validadores (
+    url VARCHAR(500) NOT NULL PRIMARY KEY,
+    etag VARCHAR(255) DEFAULT NULL,
+    last_modified VARCHAR(64) DEFAULT NULL,
+    fecha_actualizacion DATETIME DEFAULT CURRENT_TIMESTAMP
+        ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB;
@@ -0,0 +1,13 @@
+-- ============================================================
+-- 002 — Caché persistente URL de noticia → URL de imagen
+-- Uso: mysql -u root portal_noticias < migraciones/002_cache_imagenes.sql
+-- ============================================================
+USE portal_noticias;
+
+-- url_imagen = '' guarda un resultado negativo (página sin imagen o caída)
+CREATE TABLE IF NOT EXISTS cache_imagenes (
+    url_noticia VARCHAR(500) NOT NULL PRIMARY KEY,
+    url_imagen VARCHAR(500) NOT NULL DEFAULT '',
+    fecha_resolucion DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_cache_imagenes_fecha (fecha_resolucion)
+) ENGINE=InnoDB;
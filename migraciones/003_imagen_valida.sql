@@ -0,0 +1,10 @@
+-- ============================================================
+-- 003 — Resultado de validar la imagen de cada noticia
+-- Uso: mysql -u root portal_noticias < migraciones/003_imagen_valida.sql
+-- ============================================================
+USE portal_noticias;
+
+-- NULL = pendiente, 1 = imagen accesible, 0 = rota / no es imagen
+ALTER TABLE noticias
+    ADD COLUMN imagen_valida TINYINT(1) DEFAULT NULL,
+    ADD INDEX idx_imagen_valida (imagen_valida);
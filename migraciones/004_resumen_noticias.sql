@@ -0,0 +1,24 @@
+-- ============================================================
+-- 004 — Conteos precalculados por (día, fuente, categoría)
+-- Uso: mysql -u root portal_noticias < migraciones/004_resumen_noticias.sql
+-- Reconstruir luego con: python mantenimiento.py reconstruir-resumen
+-- ============================================================
+USE portal_noticias;
+
+-- dia = DATE(COALESCE(fecha_publicacion, fecha_registro))
+CREATE TABLE IF NOT EXISTS resumen_noticias (
+    dia DATE NOT NULL,
+    fuente_id INT NOT NULL,
+    categoria VARCHAR(100) NOT NULL,
+    total INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (dia, fuente_id, categoria),
+    INDEX idx_resumen_categoria (categoria, dia),
+    INDEX idx_resumen_fuente (fuente_id, dia)
+) ENGINE=InnoDB;
+
+-- Carga inicial
+DELETE FROM resumen_noticias;
+INSERT INTO resumen_noticias (dia, fuente_id, categoria, total)
+SELECT DATE(COALESCE(fecha_publicacion, fecha_registro)), fuente_id, categoria, COUNT(*)
+FROM noticias
+GROUP BY DATE(COALESCE(fecha_publicacion, fecha_registro)), fuente_id, categoria;
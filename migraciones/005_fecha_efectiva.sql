@@ -0,0 +1,13 @@
+-- ============================================================
+-- 005 — Fecha efectiva persistida para ordenar y paginar noticias
+-- Uso: mysql -u root portal_noticias < migraciones/005_fecha_efectiva.sql
+-- ============================================================
+USE portal_noticias;
+
+-- Misma expresión que usaban las consultas: COALESCE(fecha_publicacion, fecha_registro).
+-- STORED: se calcula al escribir y se puede indexar.
+-- El índice secundario incluye la PK (id), así que sirve para el cursor (fecha_efectiva, id).
+ALTER TABLE noticias
+    ADD COLUMN fecha_efectiva DATETIME
+        AS (COALESCE(fecha_publicacion, fecha_registro)) STORED,
+    ADD INDEX idx_fecha_efectiva (fecha_efectiva);
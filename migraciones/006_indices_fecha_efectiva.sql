@@ -0,0 +1,13 @@
+-- ============================================================
+-- 006 — Índices compuestos sobre fecha_efectiva
+-- Uso: mysql -u root portal_noticias < migraciones/006_indices_fecha_efectiva.sql
+-- Verificar luego con: python mantenimiento.py verificar-indices
+-- ============================================================
+USE portal_noticias;
+
+-- Requiere 005 (columna fecha_efectiva + idx_fecha_efectiva).
+-- Cada índice secundario incluye la PK, así que también cubren el
+-- desempate por id del cursor de paginación.
+ALTER TABLE noticias
+    ADD INDEX idx_categoria_fecha (categoria, fecha_efectiva),
+    ADD INDEX idx_fuente_fecha (fuente_id, fecha_efectiva);
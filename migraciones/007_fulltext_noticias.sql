@@ -0,0 +1,11 @@
+-- ============================================================
+-- 007 — Búsqueda de texto completo en titulo / descripcion
+-- Uso: mysql -u root portal_noticias < migraciones/007_fulltext_noticias.sql
+-- ============================================================
+USE portal_noticias;
+
+-- El índice usa la collation actual de las columnas: con una *_ci
+-- (utf8mb4_unicode_ci en db.py) "educación" encuentra "educacion".
+-- InnoDB ignora palabras de menos de innodb_ft_min_token_size (3 por defecto)
+ALTER TABLE noticias
+    ADD FULLTEXT INDEX ft_noticias_texto (titulo, descripcion);
@@ -0,0 +1,16 @@
+-- ============================================================
+-- 008 — Frecuencia de términos por noticia (nube de palabras)
+-- Uso: mysql -u root portal_noticias < migraciones/008_noticia_terminos.sql
+-- Llenar luego con: python mantenimiento.py indexar-noticias
+-- ============================================================
+USE portal_noticias;
+
+-- Términos de titulo + descripcion ya limpios (ver terminos_service.limpiar_texto)
+CREATE TABLE IF NOT EXISTS noticia_terminos (
+    noticia_id INT NOT NULL,
+    termino VARCHAR(64) NOT NULL,
+    cantidad SMALLINT UNSIGNED NOT NULL,
+    PRIMARY KEY (noticia_id, termino),
+    FOREIGN KEY (noticia_id) REFERENCES noticias(id)
+        ON DELETE CASCADE
+) ENGINE=InnoDB;
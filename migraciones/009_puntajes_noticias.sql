@@ -0,0 +1,16 @@
+-- ============================================================
+-- 009 — Sentimiento y riesgo calculados al guardar cada noticia
+-- Uso: mysql -u root portal_noticias < migraciones/009_puntajes_noticias.sql
+-- Llenar luego con: python mantenimiento.py indexar-noticias
+-- ============================================================
+USE portal_noticias;
+
+-- sentimiento:   1 positivo, 0 neutro, -1 negativo, NULL pendiente
+-- riesgo_nivel:  0 sin riesgo, 1 bajo, 2 medio, 3 alto
+-- riesgo_conteo: palabras de riesgo distintas encontradas
+ALTER TABLE noticias
+    ADD COLUMN sentimiento TINYINT DEFAULT NULL,
+    ADD COLUMN riesgo_nivel TINYINT UNSIGNED NOT NULL DEFAULT 0,
+    ADD COLUMN riesgo_conteo TINYINT UNSIGNED NOT NULL DEFAULT 0,
+    ADD INDEX idx_fecha_sentimiento (fecha_efectiva, sentimiento),
+    ADD INDEX idx_riesgo (riesgo_nivel, riesgo_conteo, fecha_efectiva);
@@ -0,0 +1,48 @@
+-- ============================================================
+-- 010 — Nombre de fuente único
+-- Uso: mysql -u root portal_noticias < migraciones/010_fuentes_nombre_unico.sql
+-- db.RegistroFuentes crea las fuentes con INSERT ... ON DUPLICATE KEY
+-- UPDATE id = LAST_INSERT_ID(id): sin esta clave cada carrera entre
+-- procesos duplicaba la fuente en lugar de devolver la existente.
+-- ============================================================
+USE portal_noticias;
+
+-- Duplicados existentes: se conserva el id más bajo de cada nombre
+DROP TEMPORARY TABLE IF EXISTS _fuentes_duplicadas;
+CREATE TEMPORARY TABLE _fuentes_duplicadas (
+    id INT NOT NULL PRIMARY KEY,
+    id_conservado INT NOT NULL
+) ENGINE=InnoDB;
+
+INSERT INTO _fuentes_duplicadas (id, id_conservado)
+SELECT f.id, m.id_conservado
+FROM fuentes f
+JOIN (
+    SELECT nombre, MIN(id) AS id_conservado
+    FROM fuentes
+    GROUP BY nombre
+    HAVING COUNT(*) > 1
+) m ON f.nombre = m.nombre
+WHERE f.id <> m.id_conservado;
+
+UPDATE noticias n
+JOIN _fuentes_duplicadas d ON n.fuente_id = d.id
+SET n.fuente_id = d.id_conservado;
+
+-- Los conteos precalculados se suman a la fuente conservada
+INSERT INTO resumen_noticias (dia, fuente_id, categoria, total)
+SELECT r.dia, d.id_conservado, r.categoria, r.total
+FROM resumen_noticias r
+JOIN _fuentes_duplicadas d ON r.fuente_id = d.id
+ON DUPLICATE KEY UPDATE total = resumen_noticias.total + VALUES(total);
+
+DELETE r FROM resumen_noticias r
+JOIN _fuentes_duplicadas d ON r.fuente_id = d.id;
+
+DELETE f FROM fuentes f
+JOIN _fuentes_duplicadas d ON f.id = d.id;
+
+DROP TEMPORARY TABLE _fuentes_duplicadas;
+
+ALTER TABLE fuentes
+    ADD UNIQUE KEY uk_fuentes_nombre (nombre);
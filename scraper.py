@@ -12,8 +12,12 @@ from scraper_modular import (
     CnnScraperRSS
 )
 from facebook_scraper_modular import run_facebook_scraper
-from db import guardar_noticia
+from scraper_concurrente import MotorConcurrente, nuevo_resultado
+from db import GuardadoPorLotes, cuando_se_escriban, volcar_pendientes
+from scraper_cache import cache_imagenes
+from backend.services.helpers import validar_imagenes_pendientes
 
+import asyncio
 import logging
 import schedule
 import time
@@ -35,7 +39,16 @@ logging.basicConfig(
 # ============================================================
 # 🚀 FUNCIÓN PRINCIPAL
 # ============================================================
-def main():
+def main(concurrente=True, asincrono=False):
+    """
+    Ejecuta un ciclo completo de scraping.
+
+    - concurrente=True: todos los feeds y artículos en paralelo (MotorConcurrente).
+    - asincrono=True: igual, pero en un event loop con aiohttp (scraper_async).
+    - concurrente=False: modo secuencial clásico, fuente por fuente.
+
+    Retorna el resumen por fuente del ciclo.
+    """
     print("🚀 Iniciando scraping general de fuentes...")
     logging.info("=== INICIO DE SCRAPING GENERAL ===")
 
@@ -50,43 +63,109 @@ def main():
         CnnScraperRSS()
     ]
 
-    total_fuentes = len(scrapers)
-    total_procesadas = 0
-    errores = 0
+    # --- Las noticias se escriben por lotes (una transacción por flush) ---
+    with GuardadoPorLotes() as guardar:
+        if asincrono:
+            from scraper_async import ejecutar_async
+            resumen = asyncio.run(ejecutar_async(scrapers, guardar))
+            # Facebook usa Selenium (bloqueante): va aparte
+            extra = MotorConcurrente(guardar).ejecutar([], tareas_extra={"Facebook": run_facebook_scraper})
+            resumen["fuentes"] += extra["fuentes"]
+            resumen["total_guardadas"] += extra["total_guardadas"]
+            resumen["duracion"] = round(resumen["duracion"] + extra["duracion"], 2)
+        elif concurrente:
+            motor = MotorConcurrente(guardar)
+            resumen = motor.ejecutar(scrapers, tareas_extra={"Facebook": run_facebook_scraper})
+        else:
+            resumen = _ejecutar_secuencial(scrapers, guardar)
 
-    # --- Ejecutar cada scraper ---
-    for scraper in scrapers:
-        try:
-            logging.info(f"[SCRAPER] Iniciando: {scraper.name}")
-            print(f"🔹 Procesando: {scraper.name}")
-            scraper.run({}, guardar_noticia)
-            total_procesadas += 1
-        except Exception as e:
-            errores += 1
-            logging.error(f"[ERROR] {scraper.name}: {e}\n{traceback.format_exc()}")
-            print(f"❌ Error en {scraper.name}: {e}")
+    # --- Mantenimiento de la caché de imágenes ---
+    try:
+        cache_imagenes.depurar()
+    except Exception as e:
+        logging.error(f"[CACHE] Error depurando caché de imágenes: {e}")
 
-    # --- Integración con Facebook ---
+    # --- Validar imágenes nuevas (fuera del request web) ---
     try:
-        print("📘 Iniciando extracción de publicaciones de Facebook...")
-        logging.info("[FACEBOOK] Iniciando extracción de publicaciones...")
-        run_facebook_scraper(guardar_noticia)
-        logging.info("[FACEBOOK] Extracción completada correctamente.")
-        print("✅ Facebook scraping completado.")
+        validar_imagenes_pendientes()
     except Exception as e:
-        errores += 1
-        logging.error(f"[ERROR] Facebook scraper: {e}\n{traceback.format_exc()}")
-        print(f"❌ Error en Facebook scraper: {e}")
-
-    # --- Resumen ---
-    resumen = (
-        f"✅ Scraping finalizado. {total_procesadas}/{total_fuentes} fuentes procesadas, "
-        f"{errores} errores."
+        logging.error(f"[IMAGENES] Error validando imágenes: {e}")
+
+    # --- Resumen por fuente ---
+    for r in resumen["fuentes"]:
+        linea = (
+            f"[{r['estado'].upper()}] {r['fuente']}: {r['guardadas']}/{r['noticias']} noticias, "
+            f"{r['feeds_ok']}/{r['feeds']} feeds, {r['duracion']}s"
+        )
+        if r["errores"]:
+            linea += f" | errores: {'; '.join(r['errores'])}"
+            logging.warning(linea)
+        else:
+            logging.info(linea)
+
+    con_error = [r["fuente"] for r in resumen["fuentes"] if r["estado"] != "ok"]
+    texto = (
+        f"✅ Scraping finalizado en {resumen['duracion']}s. "
+        f"{resumen['total_guardadas']} noticias guardadas de {len(resumen['fuentes'])} fuentes"
+        + (f", con problemas: {', '.join(con_error)}." if con_error else ".")
     )
-    print(resumen)
-    logging.info(resumen)
+    print(texto)
+    logging.info(texto)
     logging.info("=== FIN DE SCRAPING ===\n")
 
+    return resumen
+
+
+def _ejecutar_secuencial(scrapers, guardar):
+    """Modo clásico: un scraper tras otro. Devuelve el mismo formato de resumen."""
+    inicio = time.monotonic()
+    fuentes = []
+
+    tareas = [(s.name, lambda save, s=s: s.run({}, save)) for s in scrapers]
+    tareas.append(("Facebook", run_facebook_scraper))
+
+    for nombre, tarea in tareas:
+        t0 = time.monotonic()
+        resultado = nuevo_resultado(nombre)
+        resultado["feeds"] = resultado["feeds_ok"] = 1
+
+        def escritas(urls, resultado=resultado):
+            resultado["guardadas"] += len(urls)
+
+        def contar(*args, escritas=escritas, resultado=resultado):
+            resultado["noticias"] += 1
+            guardar(*args)
+            # Cuenta cuando el lote se escribió, no al entregarlo
+            cuando_se_escriban(guardar, [args[5]], escritas)
+
+        # run() aplaza la confirmación de los feeds igual que guardar
+        contar.al_escribir = getattr(guardar, "al_escribir", None)
+
+        try:
+            logging.info(f"[SCRAPER] Iniciando: {nombre}")
+            print(f"🔹 Procesando: {nombre}")
+            tarea(contar)
+        except Exception as e:
+            resultado["estado"] = "error"
+            resultado["feeds_ok"] = 0
+            resultado["errores"].append(str(e))
+            logging.error(f"[ERROR] {nombre}: {e}\n{traceback.format_exc()}")
+            print(f"❌ Error en {nombre}: {e}")
+
+        resultado["duracion"] = round(time.monotonic() - t0, 2)
+        fuentes.append(resultado)
+
+    volcar_pendientes(guardar)
+    for resultado in fuentes:
+        resultado["omitidas"] = resultado["noticias"] - resultado["guardadas"]
+
+    return {
+        "duracion": round(time.monotonic() - inicio, 2),
+        "total_noticias": sum(r["noticias"] for r in fuentes),
+        "total_guardadas": sum(r["guardadas"] for r in fuentes),
+        "fuentes": fuentes
+    }
+
 # ============================================================
 # ⏱️ PROGRAMADOR AUTOMÁTICO
 # ============================================================
@@ -106,4 +185,10 @@ def ejecutar_scraping_periodico():
 # 🧪 MAIN
 # ============================================================
 if __name__ == "__main__":
+    # Con SOCKETIO_MESSAGE_QUEUE, los clientes de la web reciben las
+    # noticias nuevas y las estadísticas de este proceso
+    from backend.services.emisor_service import iniciar_emisor_externo, publicar_estadisticas
+
+    iniciar_emisor_externo()
     main()
+    publicar_estadisticas()
@@ -0,0 +1,217 @@
+# ============================================================
+# ⚡ scraper_async.py — Transporte HTTP asíncrono (aiohttp)
+# ============================================================
+#
+# Backend opcional para ScraperBase.run_async / fetch_async:
+#   - Una sola ClientSession con keep-alive y pool de conexiones.
+#   - Límite de conexiones total y por host (LIMITE_POR_HOST).
+#   - Reintentos cortos: un host lento no frena al resto del ciclo.
+#
+# Requiere: pip install aiohttp
+# ============================================================
+
+import asyncio
+import codecs
+import logging
+import threading
+import time
+
+try:
+    import aiohttp
+    AIOHTTP_DISPONIBLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_DISPONIBLE = False
+
+from scraper_modular import LIMITE_POR_HOST, MAX_BYTES_IMAGEN, _BuscadorImagen
+from scraper_concurrente import nuevo_resultado, PLAZO_CICLO
+from scraper_cache import cache_imagenes
+from db import volcar_pendientes
+
+# ------------------------------
+# ⚙️ Configuración
+# ------------------------------
+MAX_CONEXIONES = 64
+TIMEOUT_PETICION = 15     # segundos por petición
+REINTENTOS = 2            # reintentos ante 5xx o error de red
+ESPERA_REINTENTO = 0.5    # segundos, se duplica en cada reintento
+
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+# Los conteos de cada fuente se anotan desde los hilos que escriben
+_lock_resultados = threading.Lock()
+
+
+class TransporteAsync:
+    """
+    Sesión aiohttp compartida por todos los scrapers de un ciclo.
+
+    Uso:
+        transporte = await TransporteAsync().abrir()
+        status, headers, contenido = await transporte.get(url)
+        await transporte.cerrar()
+    """
+
+    def __init__(self, max_conexiones=MAX_CONEXIONES, limite_por_host=LIMITE_POR_HOST,
+                 timeout=TIMEOUT_PETICION):
+        if not AIOHTTP_DISPONIBLE:
+            raise RuntimeError("aiohttp no está instalado: pip install aiohttp")
+
+        self.max_conexiones = max_conexiones
+        self.limite_por_host = limite_por_host
+        self.timeout = timeout
+        self.sesion = None
+
+    async def abrir(self):
+        conector = aiohttp.TCPConnector(
+            limit=self.max_conexiones,
+            limit_per_host=self.limite_por_host,
+            keepalive_timeout=30,
+            ttl_dns_cache=300
+        )
+        self.sesion = aiohttp.ClientSession(
+            connector=conector,
+            headers=HEADERS,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        return self
+
+    async def cerrar(self):
+        if self.sesion:
+            await self.sesion.close()
+            self.sesion = None
+
+    async def __aenter__(self):
+        return await self.abrir()
+
+    async def __aexit__(self, *exc):
+        await self.cerrar()
+        return False
+
+    async def get(self, url, headers=None):
+        """GET completo. Devuelve (status, headers, contenido_bytes)."""
+        espera = ESPERA_REINTENTO
+        for intento in range(REINTENTOS + 1):
+            try:
+                async with self.sesion.get(url, headers=headers) as r:
+                    if r.status >= 500 and intento < REINTENTOS:
+                        raise aiohttp.ClientResponseError(
+                            r.request_info, r.history, status=r.status
+                        )
+                    return r.status, r.headers, await r.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if intento == REINTENTOS:
+                    raise
+                await asyncio.sleep(espera)
+                espera *= 2
+
+
+# ------------------------------
+# 🖼️ Imagen principal (streaming)
+# ------------------------------
+async def extraer_imagen_async(url, transporte):
+    """Equivalente async de scraper_modular.extraer_imagen_de_html."""
+    try:
+        buscador = _BuscadorImagen()
+        leidos = 0
+
+        async with transporte.sesion.get(url) as r:
+            decoder = codecs.getincrementaldecoder(r.charset or "utf-8")(errors="replace")
+
+            async for chunk in r.content.iter_chunked(8192):
+                buscador.feed(decoder.decode(chunk))
+                leidos += len(chunk)
+                if buscador.terminado() or leidos >= MAX_BYTES_IMAGEN:
+                    break
+
+        return buscador.meta() or buscador.primera_img
+    except Exception:
+        return ""
+
+
+# ============================================================
+# 🚀 Ciclo completo async
+# ============================================================
+async def procesar_feed_async(scraper, categoria, url, transporte, save_func, resultado):
+    """Descarga, enriquece y guarda un feed; anota el resultado de su fuente."""
+    try:
+        noticias = await scraper.noticias_de_feed_async(categoria, url, transporte)
+    except Exception as e:
+        logging.error(f"[{scraper.name}] Error procesando categoría {categoria}: {e}")
+        resultado["errores"].append(f"{categoria}: {e}")
+        return
+
+    resultado["noticias"] += len(noticias)
+    noticias = await asyncio.gather(
+        *(scraper.completar_imagen_async(n, transporte) for n in noticias)
+    )
+
+    def escritas(urls):
+        # Corre tras el flush que escribe el feed, fuera del event loop
+        with _lock_resultados:
+            resultado["guardadas"] += len(urls)
+            resultado["feeds_ok"] += int(len(urls) == len(noticias))
+
+    def guardar_todas():
+        # save_func y la confirmación tocan la BD: fuera del event loop
+        for n in noticias:
+            scraper.guardar(categoria, n, save_func)
+        cache_imagenes.volcar()
+        scraper.confirmar_al_guardar(url, noticias, save_func, al_escribir=escritas)
+
+    await asyncio.to_thread(guardar_todas)
+
+
+async def ejecutar_async(scrapers, save_func, plazo=PLAZO_CICLO):
+    """
+    Ejecuta todos los feeds de todos los scrapers en un solo event loop.
+    Devuelve el mismo resumen que MotorConcurrente.ejecutar.
+    """
+    inicio = time.monotonic()
+    resultados = []
+    tareas = {}   # tarea -> resultado de su fuente
+
+    async with TransporteAsync() as transporte:
+        for scraper in scrapers:
+            resultado = nuevo_resultado(scraper.name)
+            resultados.append(resultado)
+
+            for categoria, url in scraper.obtener_feeds({}).items():
+                resultado["feeds"] += 1
+                tarea = asyncio.ensure_future(
+                    procesar_feed_async(scraper, categoria, url, transporte, save_func, resultado)
+                )
+                tareas[tarea] = resultado
+
+        if tareas:
+            _, pendientes = await asyncio.wait(tareas, timeout=plazo)
+            for tarea in pendientes:
+                tarea.cancel()
+                tareas[tarea]["plazo_agotado"] = True
+                tareas[tarea]["errores"].append("plazo del ciclo agotado")
+            await asyncio.gather(*pendientes, return_exceptions=True)
+
+    # Escribe lo que quede en el buffer para contar solo lo que llegó a la BD
+    try:
+        await asyncio.to_thread(volcar_pendientes, save_func)
+    except Exception as e:
+        logging.error(f"[ASYNC] Error en el flush final del ciclo: {e}")
+
+    duracion = round(time.monotonic() - inicio, 2)
+
+    for resultado in resultados:
+        resultado["duracion"] = duracion
+        resultado["omitidas"] = resultado["noticias"] - resultado["guardadas"]
+        if resultado["plazo_agotado"]:
+            resultado["estado"] = "plazo_agotado"
+        elif resultado["feeds_ok"] == 0:
+            resultado["estado"] = "error"
+        elif resultado["feeds_ok"] < resultado["feeds"]:
+            resultado["estado"] = "parcial"
+
+    return {
+        "duracion": duracion,
+        "total_noticias": sum(r["noticias"] for r in resultados),
+        "total_guardadas": sum(r["guardadas"] for r in resultados),
+        "fuentes": resultados
+    }
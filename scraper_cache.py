@@ -0,0 +1,264 @@
+# ============================================================
+# 🗃️ scraper_cache.py — Estado persistente del scraper
+# ============================================================
+#
+# - ValidadoresFeed: ETag / Last-Modified de cada feed RSS para
+#   pedir los feeds de forma condicional (304 Not Modified).
+# - imagenes_conocidas: noticias ya guardadas y su imagen, para no
+#   volver a descargar su HTML.
+# - CacheImagenes: URL de noticia → URL de imagen (también negativos),
+#   persistente, con TTL y tamaño máximo.
+#
+# Cada consulta toma su propio permiso de acceso_bd solo mientras dura:
+# el pool de db.py es de 5 conexiones y get_connection falla (no espera)
+# cuando se agota. Nunca se espera un permiso teniendo otro o un lock,
+# así el semáforo no puede trabarse. Los guardados van aparte, de a una
+# conexión (ver MotorConcurrente._guardar y GuardadoPorLotes).
+# ============================================================
+
+from db import execute_query, execute_many
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import logging
+import threading
+
+MAX_CONEXIONES_SCRAPER = 3
+acceso_bd = threading.BoundedSemaphore(MAX_CONEXIONES_SCRAPER)
+
+
+def _consultar(query, params=None, **kwargs):
+    with acceso_bd:
+        return execute_query(query, params, **kwargs)
+
+
+# ============================================================
+# 📡 Validadores HTTP de feeds
+# ============================================================
+class ValidadoresFeed:
+    """
+    Guarda los validadores HTTP de cada feed en la tabla feeds_validadores
+    (ver migraciones/001_feeds_validadores.sql).
+
+    Se cargan todos con una consulta la primera vez y se actualizan
+    uno a uno cuando un feed cambia.
+    """
+
+    def __init__(self):
+        self._datos = None          # {url: (etag, last_modified)}
+        self._lock = threading.Lock()
+
+    def _cargar(self):
+        # La consulta va fuera del lock: no se espera un permiso de acceso_bd con él tomado
+        with self._lock:
+            if self._datos is not None:
+                return
+        rows = _consultar(
+            "SELECT url, etag, last_modified FROM feeds_validadores;",
+            fetch=True
+        ) or []
+        datos = {r["url"]: (r["etag"], r["last_modified"]) for r in rows}
+        with self._lock:
+            if self._datos is None:
+                self._datos = datos
+
+    def cabeceras(self, url):
+        """Cabeceras condicionales para pedir el feed."""
+        self._cargar()
+        with self._lock:
+            etag, last_modified = self._datos.get(url, (None, None))
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def actualizar(self, url, etag, last_modified):
+        """Persiste los validadores de un feed ya procesado."""
+        if not etag and not last_modified:
+            return
+
+        self._cargar()
+        with self._lock:
+            if self._datos.get(url) == (etag, last_modified):
+                return
+            self._datos[url] = (etag, last_modified)
+
+        _consultar(
+            """
+            INSERT INTO feeds_validadores (url, etag, last_modified)
+            VALUES (%s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                etag = VALUES(etag),
+                last_modified = VALUES(last_modified)
+            """,
+            (url, etag, last_modified), commit=True
+        )
+        logging.info(f"[FEEDS] Validadores actualizados: {url}")
+
+
+validadores_feed = ValidadoresFeed()
+
+
+# ============================================================
+# 🔎 Noticias ya guardadas
+# ============================================================
+def imagenes_conocidas(urls):
+    """
+    Devuelve {url_noticia: url_imagen} de las URLs que ya están en la BD,
+    con una sola consulta por lote.
+    """
+    urls = [u for u in set(urls) if u]
+    if not urls:
+        return {}
+
+    marcadores = ", ".join(["%s"] * len(urls))
+    rows = _consultar(
+        f"SELECT url_noticia, url_imagen FROM noticias WHERE url_noticia IN ({marcadores});",
+        tuple(urls), fetch=True
+    ) or []
+    return {r["url_noticia"]: r["url_imagen"] or "" for r in rows}
+
+
+# ============================================================
+# 🖼️ Caché de imágenes por URL de noticia
+# ============================================================
+TTL_IMAGEN = timedelta(days=7)          # imagen encontrada
+TTL_IMAGEN_VACIA = timedelta(hours=6)   # página sin imagen o caída
+MAX_CACHE_IMAGENES = 50000              # filas en cache_imagenes
+MAX_CACHE_MEMORIA = 5000                # entradas en memoria (LRU)
+TAMANO_LOTE_CACHE = 200                 # escrituras pendientes antes de volcar
+
+SQL_CACHE_IMAGEN = """
+    INSERT INTO cache_imagenes (url_noticia, url_imagen, fecha_resolucion)
+    VALUES (%s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        url_imagen = VALUES(url_imagen),
+        fecha_resolucion = VALUES(fecha_resolucion)
+"""
+
+
+class CacheImagenes:
+    """
+    Caché URL de noticia → URL de imagen en la tabla cache_imagenes
+    (ver migraciones/002_cache_imagenes.sql), con una capa LRU en memoria.
+
+    Guarda también los resultados negativos (url_imagen = '') con un TTL
+    más corto para no volver a descargar páginas sin imagen cada ciclo.
+
+    guardar() solo anota en memoria; las filas se escriben con un único
+    execute_many en volcar(), que el scraper llama al terminar cada feed
+    (y guardar() mismo al juntar TAMANO_LOTE_CACHE pendientes).
+    """
+
+    def __init__(self):
+        self._memoria = OrderedDict()   # {url: (url_imagen, fecha_resolucion)}
+        self._pendientes = {}           # {url: (url_imagen, fecha_resolucion)} sin escribir
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _vigente(url_imagen, fecha):
+        ttl = TTL_IMAGEN if url_imagen else TTL_IMAGEN_VACIA
+        return fecha is not None and datetime.now() - fecha < ttl
+
+    def _recordar(self, url, url_imagen, fecha):
+        self._memoria[url] = (url_imagen, fecha)
+        self._memoria.move_to_end(url)
+        while len(self._memoria) > MAX_CACHE_MEMORIA:
+            self._memoria.popitem(last=False)
+
+    def obtener_lote(self, urls):
+        """Devuelve {url: url_imagen} de las URLs con entrada vigente."""
+        encontrados = {}
+        faltantes = []
+
+        with self._lock:
+            for url in set(u for u in urls if u):
+                entrada = self._memoria.get(url)
+                if entrada and self._vigente(*entrada):
+                    self._memoria.move_to_end(url)
+                    encontrados[url] = entrada[0]
+                else:
+                    faltantes.append(url)
+
+        if not faltantes:
+            return encontrados
+
+        marcadores = ", ".join(["%s"] * len(faltantes))
+        rows = _consultar(
+            f"""
+            SELECT url_noticia, url_imagen, fecha_resolucion
+            FROM cache_imagenes
+            WHERE url_noticia IN ({marcadores});
+            """,
+            tuple(faltantes), fetch=True
+        ) or []
+
+        with self._lock:
+            for r in rows:
+                if self._vigente(r["url_imagen"], r["fecha_resolucion"]):
+                    self._recordar(r["url_noticia"], r["url_imagen"], r["fecha_resolucion"])
+                    encontrados[r["url_noticia"]] = r["url_imagen"]
+
+        return encontrados
+
+    def guardar(self, url, url_imagen):
+        if not url:
+            return
+        url_imagen = (url_imagen or "")[:500]
+        ahora = datetime.now().replace(microsecond=0)
+
+        with self._lock:
+            self._recordar(url, url_imagen, ahora)
+            self._pendientes[url] = (url_imagen, ahora)
+            lleno = len(self._pendientes) >= TAMANO_LOTE_CACHE
+
+        if lleno:
+            self.volcar()
+
+    def volcar(self):
+        """Escribe las entradas pendientes en una sola transacción. Retorna cuántas."""
+        with self._lock:
+            pendientes, self._pendientes = self._pendientes, {}
+        if not pendientes:
+            return 0
+
+        filas = [(url, img, fecha) for url, (img, fecha) in pendientes.items()]
+        with acceso_bd:
+            escritas = execute_many(SQL_CACHE_IMAGEN, filas)
+
+        if escritas is None:
+            # Se reintentan en el próximo volcado (lo más nuevo gana).
+            with self._lock:
+                for url, entrada in pendientes.items():
+                    if len(self._pendientes) >= MAX_CACHE_MEMORIA:
+                        break
+                    self._pendientes.setdefault(url, entrada)
+            logging.warning(f"[CACHE] No se pudieron escribir {len(filas)} imágenes; se reintentará")
+            return 0
+        return len(filas)
+
+    def depurar(self):
+        """Elimina entradas vencidas y recorta la tabla a MAX_CACHE_IMAGENES."""
+        ahora = datetime.now()
+        _consultar(
+            """
+            DELETE FROM cache_imagenes
+            WHERE (url_imagen <> '' AND fecha_resolucion < %s)
+               OR (url_imagen = '' AND fecha_resolucion < %s);
+            """,
+            (ahora - TTL_IMAGEN, ahora - TTL_IMAGEN_VACIA), commit=True
+        )
+
+        total = _consultar("SELECT COUNT(*) AS total FROM cache_imagenes;", fetch=True)
+        exceso = (total[0]["total"] if total else 0) - MAX_CACHE_IMAGENES
+        if exceso > 0:
+            _consultar(
+                "DELETE FROM cache_imagenes ORDER BY fecha_resolucion ASC LIMIT %s;",
+                (exceso,), commit=True
+            )
+            logging.info(f"[CACHE] {exceso} imágenes antiguas eliminadas de la caché")
+
+
+cache_imagenes = CacheImagenes()
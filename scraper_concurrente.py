@@ -0,0 +1,250 @@
+# ============================================================
+# ⚡ scraper_concurrente.py — Motor concurrente de scraping
+# ============================================================
+#
+# Ejecuta todos los feeds de todos los scrapers en paralelo:
+#   - Un pool de hilos para feeds/listados (un trabajo por categoría).
+#   - Un pool de hilos para páginas de artículo (extracción de imagen).
+#   - El límite por host lo aplica scraper_modular.http_get.
+#   - Un plazo global por ciclo: lo que no empezó a tiempo se descarta.
+#   - La BD se toca con a lo sumo scraper_cache.MAX_CONEXIONES_SCRAPER
+#     conexiones para consultas más una para guardar, por debajo del pool.
+# ============================================================
+
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FuturesTimeout
+import logging
+import threading
+import time
+
+from scraper_cache import cache_imagenes
+from db import cuando_se_escriban, volcar_pendientes
+
+# ------------------------------
+# ⚙️ Configuración
+# ------------------------------
+MAX_FEEDS_SIMULTANEOS = 8
+MAX_ARTICULOS_SIMULTANEOS = 16
+PLAZO_CICLO = 9 * 60   # segundos; menor al intervalo de 10 min de app.py
+
+
+def nuevo_resultado(fuente):
+    return {
+        "fuente": fuente,
+        "estado": "ok",
+        "feeds": 0,
+        "feeds_ok": 0,
+        "noticias": 0,
+        "guardadas": 0,
+        "omitidas": 0,
+        "errores": [],
+        "plazo_agotado": False,
+        "duracion": 0.0
+    }
+
+
+class MotorConcurrente:
+    """
+    Ejecuta un ciclo completo de scraping con concurrencia acotada.
+
+    Uso:
+        motor = MotorConcurrente(guardar_noticia)
+        resumen = motor.ejecutar(scrapers, tareas_extra={"Facebook": run_facebook_scraper})
+    """
+
+    def __init__(self, save_func,
+                 max_feeds=MAX_FEEDS_SIMULTANEOS,
+                 max_articulos=MAX_ARTICULOS_SIMULTANEOS,
+                 plazo=PLAZO_CICLO):
+        self.save_func = save_func
+        self.max_feeds = max_feeds
+        self.max_articulos = max_articulos
+        self.plazo = plazo
+
+        self._inicio = None
+        self._fin = None
+        self._lock_resultados = threading.Lock()
+        self._lock_guardado = threading.Lock()
+        self._pool_articulos = None
+
+    # ------------------------------
+    # ⏱️ Plazo del ciclo
+    # ------------------------------
+    def restante(self):
+        return max(0.0, self._fin - time.monotonic())
+
+    def expirado(self):
+        return time.monotonic() >= self._fin
+
+    # ------------------------------
+    # 💾 Guardado serializado
+    # ------------------------------
+    def _guardar(self, *args):
+        # El pool MySQL es pequeño: el scraper guarda de a una conexión.
+        # Sin permiso de acceso_bd: save_func puede confirmar feeds, que
+        # toman el suyo al consultar.
+        with self._lock_guardado:
+            self.save_func(*args)
+
+    def _anotar(self, resultado, **cambios):
+        with self._lock_resultados:
+            for clave, valor in cambios.items():
+                if clave == "error":
+                    resultado["errores"].append(valor)
+                elif clave == "plazo_agotado":
+                    resultado["plazo_agotado"] = valor
+                else:
+                    resultado[clave] += valor
+
+    def _marcar_fin(self, resultado):
+        with self._lock_resultados:
+            transcurrido = round(time.monotonic() - self._inicio, 2)
+            resultado["duracion"] = max(resultado["duracion"], transcurrido)
+
+    # ------------------------------
+    # 🧵 Trabajos
+    # ------------------------------
+    def _enriquecer(self, scraper, noticia):
+        if noticia.get("imagen_resuelta"):
+            return noticia
+        if self.expirado():
+            return None
+        return scraper.completar_imagen(noticia)
+
+    def _procesar_feed(self, scraper, categoria, url, resultado):
+        if self.expirado():
+            self._anotar(resultado, error=f"{categoria}: plazo agotado antes de iniciar", plazo_agotado=True)
+            return
+
+        try:
+            noticias = scraper.noticias_de_feed(categoria, url)
+        except Exception as e:
+            logging.error(f"[{scraper.name}] Error procesando categoría {categoria}: {e}")
+            self._anotar(resultado, error=f"{categoria}: {e}")
+            return
+
+        self._anotar(resultado, noticias=len(noticias))
+
+        futuros = [
+            self._pool_articulos.submit(self._enriquecer, scraper, n)
+            for n in noticias
+        ]
+
+        enviadas = []   # noticias entregadas a save_func
+        try:
+            for futuro in as_completed(futuros, timeout=self.restante()):
+                noticia = futuro.result()
+                if noticia is None:
+                    continue
+                scraper.guardar(categoria, noticia, self._guardar)
+                enviadas.append(noticia)
+        except FuturesTimeout:
+            for futuro in futuros:
+                futuro.cancel()
+            self._anotar(resultado, error=f"{categoria}: plazo agotado", plazo_agotado=True)
+        except Exception as e:
+            logging.error(f"[{scraper.name}] Error guardando categoría {categoria}: {e}")
+            self._anotar(resultado, error=f"{categoria}: {e}")
+        finally:
+            cache_imagenes.volcar()
+
+        # "guardadas" se cuenta cuando el lote se escribió, no al entregarlo:
+        # con GuardadoPorLotes el flush puede fallar después.
+        if len(enviadas) == len(noticias):
+            scraper.confirmar_al_guardar(
+                url, enviadas, self.save_func,
+                al_escribir=lambda urls: self._anotar(
+                    resultado, guardadas=len(urls), feeds_ok=int(len(urls) == len(enviadas))
+                )
+            )
+        else:
+            cuando_se_escriban(
+                self.save_func, [n.get("url") for n in enviadas],
+                lambda urls: self._anotar(resultado, guardadas=len(urls))
+            )
+        self._marcar_fin(resultado)
+
+    def _procesar_extra(self, nombre, tarea, resultado):
+        if self.expirado():
+            self._anotar(resultado, error="plazo agotado antes de iniciar", plazo_agotado=True)
+            return
+        try:
+            tarea(self._guardar)
+            self._anotar(resultado, feeds_ok=1)
+        except Exception as e:
+            logging.error(f"[{nombre}] Error: {e}")
+            self._anotar(resultado, error=str(e))
+        self._marcar_fin(resultado)
+
+    # ------------------------------
+    # 🚀 Ciclo completo
+    # ------------------------------
+    def ejecutar(self, scrapers, tareas_extra=None):
+        """
+        Ejecuta todos los scrapers y devuelve el resumen del ciclo:
+        {"duracion", "total_noticias", "total_guardadas", "fuentes": [resultado, ...]}
+        """
+        self._inicio = time.monotonic()
+        self._fin = self._inicio + self.plazo
+
+        pool_feeds = ThreadPoolExecutor(max_workers=self.max_feeds, thread_name_prefix="feed")
+        self._pool_articulos = ThreadPoolExecutor(
+            max_workers=self.max_articulos, thread_name_prefix="articulo"
+        )
+
+        resultados = []
+        trabajos = {}   # futuro -> resultado de su fuente
+        pendientes = set()
+
+        try:
+            for scraper in scrapers:
+                resultado = nuevo_resultado(scraper.name)
+                resultados.append(resultado)
+
+                for categoria, url in scraper.obtener_feeds({}).items():
+                    resultado["feeds"] += 1
+                    futuro = pool_feeds.submit(
+                        self._procesar_feed, scraper, categoria, url, resultado
+                    )
+                    trabajos[futuro] = resultado
+
+            for nombre, tarea in (tareas_extra or {}).items():
+                resultado = nuevo_resultado(nombre)
+                resultado["feeds"] = 1
+                resultados.append(resultado)
+                trabajos[pool_feeds.submit(self._procesar_extra, nombre, tarea, resultado)] = resultado
+
+            _, pendientes = wait(trabajos, timeout=self.restante())
+
+            for futuro in pendientes:
+                futuro.cancel()
+                self._anotar(trabajos[futuro], error="plazo del ciclo agotado", plazo_agotado=True)
+
+        finally:
+            pool_feeds.shutdown(wait=False, cancel_futures=True)
+            self._pool_articulos.shutdown(wait=False, cancel_futures=True)
+
+        # Escribe lo que quede en el buffer para contar solo lo que llegó a la BD
+        try:
+            volcar_pendientes(self.save_func)
+        except Exception as e:
+            logging.error(f"[MOTOR] Error en el flush final del ciclo: {e}")
+
+        duracion = time.monotonic() - self._inicio
+
+        for resultado in resultados:
+            resultado["omitidas"] = resultado["noticias"] - resultado["guardadas"]
+            if resultado["plazo_agotado"]:
+                resultado["duracion"] = round(duracion, 2)
+                resultado["estado"] = "plazo_agotado"
+            elif resultado["feeds_ok"] == 0:
+                resultado["estado"] = "error"
+            elif resultado["feeds_ok"] < resultado["feeds"]:
+                resultado["estado"] = "parcial"
+
+        return {
+            "duracion": round(duracion, 2),
+            "total_noticias": sum(r["noticias"] for r in resultados),
+            "total_guardadas": sum(r["guardadas"] for r in resultados),
+            "fuentes": resultados
+        }
@@ -6,11 +6,18 @@ import requests
 from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter, Retry
 import feedparser
+import asyncio
 import logging
 import re
 import os
+import codecs
+import threading
+from html.parser import HTMLParser
 from datetime import datetime
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
+
+from scraper_cache import validadores_feed, imagenes_conocidas, cache_imagenes
+from db import cuando_se_escriban, volcar_pendientes
 
 # ------------------------------
 # 🧩 Configuración general
@@ -23,11 +30,38 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(message)s"
 )
 
+# Máximo de peticiones simultáneas contra un mismo host
+LIMITE_POR_HOST = 4
+
 # Configuración global de sesión HTTP
 session = requests.Session()
 retries = Retry(total=5, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
-session.mount("http://", HTTPAdapter(max_retries=retries))
-session.mount("https://", HTTPAdapter(max_retries=retries))
+session.mount("http://", HTTPAdapter(max_retries=retries, pool_connections=20, pool_maxsize=LIMITE_POR_HOST))
+session.mount("https://", HTTPAdapter(max_retries=retries, pool_connections=20, pool_maxsize=LIMITE_POR_HOST))
+
+# ------------------------------
+# 🚦 Límite de concurrencia por host
+# ------------------------------
+_semaforos_host = {}
+_semaforos_lock = threading.Lock()
+
+
+def _semaforo_host(url):
+    """Devuelve el semáforo compartido del host de la URL."""
+    host = urlparse(url).netloc.lower()
+    with _semaforos_lock:
+        semaforo = _semaforos_host.get(host)
+        if semaforo is None:
+            semaforo = threading.BoundedSemaphore(LIMITE_POR_HOST)
+            _semaforos_host[host] = semaforo
+    return semaforo
+
+
+def http_get(url, **kwargs):
+    """GET con la sesión global respetando LIMITE_POR_HOST."""
+    kwargs.setdefault("headers", {"User-Agent": "Mozilla/5.0"})
+    with _semaforo_host(url):
+        return session.get(url, **kwargs)
 
 # ------------------------------
 # 🧹 Funciones auxiliares
@@ -55,27 +89,71 @@ def extraer_fecha(entry):
 # ------------------------------
 # 🖼️ EXTRACCIÓN DE IMÁGENES DESDE HTML
 # ------------------------------
-def extraer_imagen_de_html(url):
-    """Extrae imagen principal desde <meta og:image> o el primer <img> grande."""
-    try:
-        r = session.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=12)
-        soup = BeautifulSoup(r.text, "html.parser")
+# Tope de lectura cuando no hay metadatos y hay que buscar un <img> en el body
+MAX_BYTES_IMAGEN = 512 * 1024
 
-        # Buscar metadatos OG
-        og = soup.find("meta", property="og:image")
-        if og and og.get("content"):
-            return og["content"]
+# Metadatos de imagen, en orden de preferencia
+METAS_IMAGEN = ("og:image", "og:image:url", "og:image:secure_url", "twitter:image", "twitter:image:src")
 
-        og2 = soup.find("meta", attrs={"name": "og:image"})
-        if og2 and og2.get("content"):
-            return og2["content"]
 
-        # Buscar primer IMG grande
-        img = soup.find("img")
-        if img and img.get("src"):
-            return img["src"]
+class _BuscadorImagen(HTMLParser):
+    """Parser incremental: junta metadatos de imagen y el primer <img>."""
 
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.metas = {}
+        self.primera_img = ""
+        self.fin_head = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "meta":
+            clave = (attrs.get("property") or attrs.get("name") or "").lower()
+            if clave in METAS_IMAGEN and attrs.get("content") and clave not in self.metas:
+                self.metas[clave] = attrs["content"]
+        elif tag == "img":
+            if not self.primera_img and attrs.get("src"):
+                self.primera_img = attrs["src"]
+        elif tag == "body":
+            self.fin_head = True
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.fin_head = True
+
+    def meta(self):
+        for clave in METAS_IMAGEN:
+            if clave in self.metas:
+                return self.metas[clave]
         return ""
+
+    def terminado(self):
+        if "og:image" in self.metas:
+            return True
+        return self.fin_head and bool(self.metas or self.primera_img)
+
+
+def extraer_imagen_de_html(url):
+    """
+    Extrae imagen principal desde <meta og:image>/<meta twitter:image> o el
+    primer <img>. Lee la página por partes y corta la conexión apenas tiene
+    la respuesta (normalmente al llegar a </head>).
+    """
+    try:
+        buscador = _BuscadorImagen()
+        leidos = 0
+
+        with _semaforo_host(url):
+            with session.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=12, stream=True) as r:
+                decoder = codecs.getincrementaldecoder(r.encoding or "utf-8")(errors="replace")
+
+                for chunk in r.iter_content(chunk_size=8192):
+                    buscador.feed(decoder.decode(chunk))
+                    leidos += len(chunk)
+                    if buscador.terminado() or leidos >= MAX_BYTES_IMAGEN:
+                        break
+
+        return buscador.meta() or buscador.primera_img
     except Exception:
         return ""
 
@@ -83,6 +161,9 @@ def extraer_imagen_de_html(url):
 # 🧱 Clase base para scrapers
 # ============================================================
 class ScraperBase:
+    # {categoría: url} que recorre el scraper en cada ciclo
+    feeds = {}
+
     def __init__(self, name, base_url):
         self.name = name
         self.base_url = base_url
@@ -90,8 +171,7 @@ class ScraperBase:
     def fetch(self, url):
         """Descarga el HTML de una página y devuelve BeautifulSoup."""
         try:
-            headers = {"User-Agent": "Mozilla/5.0"}
-            r = session.get(url, headers=headers, timeout=15)
+            r = http_get(url, timeout=15)
             r.raise_for_status()
             return BeautifulSoup(r.text, "html.parser")
         except Exception as e:
@@ -101,35 +181,257 @@ class ScraperBase:
     def parse(self, soup, categoria):
         raise NotImplementedError
 
-    def run(self, categorias, save_func):
-        """Ejecución genérica si el medio usa HTML."""
-        for nombre, url in categorias.items():
-            try:
-                soup = self.fetch(url)
-                if not soup:
-                    continue
+    def obtener_feeds(self, categorias):
+        """Devuelve el mapa {categoría: url} a procesar."""
+        return categorias or self.feeds
 
-                noticias = self.parse(soup, nombre)
+    def extraer_noticias(self, categoria, url):
+        """
+        Descarga una categoría y devuelve sus noticias sin enriquecer:
+        [{"titulo", "subtitulo", "descripcion", "url", "img", "fecha"}]
+        """
+        soup = self.fetch(url)
+        if not soup:
+            return []
 
-                for n in noticias:
-                    titulo = limpiar_texto(n.get("titulo"))
-                    subtitulo = limpiar_texto(n.get("subtitulo"))
-                    descripcion = limpiar_texto(n.get("descripcion"))
-                    url_noticia = n.get("url", "")
-                    if not url_noticia.startswith("http"):
-                        continue
+        noticias = []
+        for n in self.parse(soup, categoria):
+            url_noticia = n.get("url", "")
+            if not url_noticia.startswith("http"):
+                continue
 
-                    img = n.get("img") or extraer_imagen_de_html(url_noticia)
+            noticias.append({
+                "titulo": limpiar_texto(n.get("titulo")),
+                "subtitulo": limpiar_texto(n.get("subtitulo")),
+                "descripcion": limpiar_texto(n.get("descripcion")),
+                "url": url_noticia,
+                "img": n.get("img", ""),
+                "fecha": n.get("fecha")
+            })
+        return noticias
+
+    def noticias_de_feed(self, categoria, url):
+        """
+        extraer_noticias + resuelve sin red las imágenes que ya se conocen:
+        - noticias ya guardadas en la BD (reutilizan su imagen),
+        - URLs presentes en la caché de imágenes (incluye "sin imagen").
+        Ambas consultas son de una sola vuelta por feed.
+        """
+        return self.resolver_imagenes_conocidas(self.extraer_noticias(categoria, url))
+
+    def resolver_imagenes_conocidas(self, noticias):
+        if not noticias:
+            return noticias
+
+        conocidas = imagenes_conocidas(n.get("url") for n in noticias)
+        for n in noticias:
+            if n.get("url") in conocidas:
+                n["imagen_resuelta"] = True
+                if not n.get("img"):
+                    n["img"] = conocidas[n["url"]]
+
+        pendientes = [n for n in noticias if not n.get("img") and not n.get("imagen_resuelta")]
+        if pendientes:
+            en_cache = cache_imagenes.obtener_lote(n.get("url") for n in pendientes)
+            for n in pendientes:
+                if n.get("url") in en_cache:
+                    n["imagen_resuelta"] = True
+                    n["img"] = en_cache[n["url"]]
+
+        return noticias
+
+    def completar_imagen(self, noticia):
+        """Resuelve la imagen de la noticia desde su HTML si el listado no la trae."""
+        if noticia.get("imagen_resuelta"):
+            return noticia
+        if not noticia.get("img") and noticia.get("url"):
+            noticia["img"] = extraer_imagen_de_html(noticia["url"])
+            cache_imagenes.guardar(noticia["url"], noticia["img"])
+        noticia["imagen_resuelta"] = True
+        return noticia
+
+    def confirmar_feed(self, url):
+        """Se llama cuando todas las noticias de un feed se procesaron."""
+        pass
+
+    def confirmar_al_guardar(self, url, noticias, save_func, al_escribir=None):
+        """
+        confirmar_feed una vez que todas las noticias estén en la BD: si
+        save_func acumula en memoria (GuardadoPorLotes), tras el flush que las
+        escribe. al_escribir(escritas), si se da, recibe las URLs escritas.
+        """
+        def escritas(urls):
+            if al_escribir:
+                al_escribir(urls)
+            if len(urls) == len(noticias):
+                self.confirmar_feed(url)
+
+        cuando_se_escriban(save_func, [n.get("url") for n in noticias], escritas)
+
+    def guardar(self, categoria, noticia, save_func):
+        save_func(
+            self.name,
+            noticia.get("titulo", ""),
+            categoria,
+            noticia.get("subtitulo", ""),
+            noticia.get("descripcion", ""),
+            noticia.get("url", ""),
+            noticia.get("img", ""),
+            noticia.get("fecha")
+        )
 
-                    save_func(
-                        self.name, titulo, nombre, subtitulo, descripcion,
-                        url_noticia, img, n.get("fecha")
-                    )
+    def run(self, categorias, save_func):
+        """Ejecución secuencial: categoría por categoría, noticia por noticia."""
+        for nombre, url in self.obtener_feeds(categorias).items():
+            try:
+                noticias = self.noticias_de_feed(nombre, url)
+                for n in noticias:
+                    self.guardar(nombre, self.completar_imagen(n), save_func)
+                cache_imagenes.volcar()
+                self.confirmar_al_guardar(url, noticias, save_func)
 
             except Exception as e:
                 logging.error(f"[{self.name}] Error procesando categoría {nombre}: {e}")
                 continue
 
+    # ------------------------------
+    # ⚡ Interfaz asíncrona (ver scraper_async.py)
+    # ------------------------------
+    async def fetch_async(self, url, transporte):
+        """Versión async de fetch usando el TransporteAsync compartido."""
+        try:
+            status, _, contenido = await transporte.get(url)
+            if status >= 400:
+                raise ValueError(f"HTTP {status}")
+            return BeautifulSoup(contenido, "html.parser")
+        except Exception as e:
+            logging.error(f"[{self.name}] Error al obtener {url}: {e}")
+            return None
+
+    async def extraer_noticias_async(self, categoria, url, transporte):
+        """
+        Por defecto ejecuta extraer_noticias en un hilo, así los scrapers
+        existentes funcionan sin cambios. Los scrapers nuevos pueden
+        sobrescribirlo con fetch_async.
+        """
+        return await asyncio.to_thread(self.extraer_noticias, categoria, url)
+
+    async def noticias_de_feed_async(self, categoria, url, transporte):
+        noticias = await self.extraer_noticias_async(categoria, url, transporte)
+        return await asyncio.to_thread(self.resolver_imagenes_conocidas, noticias)
+
+    async def completar_imagen_async(self, noticia, transporte):
+        from scraper_async import extraer_imagen_async
+
+        if noticia.get("imagen_resuelta"):
+            return noticia
+        if not noticia.get("img") and noticia.get("url"):
+            noticia["img"] = await extraer_imagen_async(noticia["url"], transporte)
+            await asyncio.to_thread(cache_imagenes.guardar, noticia["url"], noticia["img"])
+        noticia["imagen_resuelta"] = True
+        return noticia
+
+    async def run_async(self, categorias, save_func, transporte=None):
+        """
+        Igual que run, pero con todos los feeds y artículos en paralelo.
+        Devuelve el resultado de la fuente (ver scraper_concurrente).
+        """
+        from scraper_async import TransporteAsync, procesar_feed_async
+        from scraper_concurrente import nuevo_resultado
+
+        resultado = nuevo_resultado(self.name)
+        feeds = self.obtener_feeds(categorias)
+        resultado["feeds"] = len(feeds)
+
+        propio = transporte is None
+        if propio:
+            transporte = await TransporteAsync().abrir()
+
+        try:
+            await asyncio.gather(*(
+                procesar_feed_async(self, nombre, url, transporte, save_func, resultado)
+                for nombre, url in feeds.items()
+            ))
+        finally:
+            if propio:
+                await transporte.cerrar()
+
+        await asyncio.to_thread(volcar_pendientes, save_func)
+        resultado["omitidas"] = resultado["noticias"] - resultado["guardadas"]
+        return resultado
+
+
+# ============================================================
+# 📡 Clase base para scrapers RSS
+# ============================================================
+class ScraperRSS(ScraperBase):
+
+    def __init__(self, name, base_url):
+        super().__init__(name, base_url)
+        # Validadores recibidos en este ciclo, pendientes de confirmar
+        self._validadores_pendientes = {}
+
+    def leer_feed(self, url):
+        """
+        Descarga y parsea un feed RSS con petición condicional.
+        Devuelve None si el servidor responde 304 (sin cambios).
+        """
+        headers = {"User-Agent": "Mozilla/5.0", **validadores_feed.cabeceras(url)}
+        r = http_get(url, headers=headers, timeout=15)
+
+        if r.status_code == 304:
+            return None
+
+        r.raise_for_status()
+        return self._parsear_feed(url, r.headers, r.content)
+
+    def _parsear_feed(self, url, headers, contenido):
+        self._validadores_pendientes[url] = (
+            headers.get("ETag"),
+            headers.get("Last-Modified")
+        )
+        return feedparser.parse(contenido)
+
+    def confirmar_feed(self, url):
+        # Solo se guardan los validadores si el feed se procesó completo;
+        # si no, el próximo ciclo recibiría un 304 y perdería noticias.
+        validadores = self._validadores_pendientes.pop(url, None)
+        if validadores:
+            validadores_feed.actualizar(url, *validadores)
+
+    def _noticias_de_entradas(self, categoria, feed):
+        if feed is None:
+            logging.info(f"[{self.name}] {categoria}: sin cambios (304)")
+            return []
+
+        return [
+            {
+                "titulo": entry.get("title", ""),
+                "subtitulo": "",
+                "descripcion": entry.get("summary", ""),
+                "url": entry.get("link", ""),
+                "img": "",
+                "fecha": extraer_fecha(entry)
+            }
+            for entry in feed.entries
+        ]
+
+    def extraer_noticias(self, categoria, url):
+        return self._noticias_de_entradas(categoria, self.leer_feed(url))
+
+    async def extraer_noticias_async(self, categoria, url, transporte):
+        headers = {"User-Agent": "Mozilla/5.0", **validadores_feed.cabeceras(url)}
+        status, resp_headers, contenido = await transporte.get(url, headers=headers)
+
+        if status == 304:
+            feed = None
+        elif status >= 400:
+            raise ValueError(f"HTTP {status} en {url}")
+        else:
+            feed = self._parsear_feed(url, resp_headers, contenido)
+
+        return self._noticias_de_entradas(categoria, feed)
+
 
 # ============================================================
 # 🧠 SCRAPERS ESPECÍFICOS
@@ -138,43 +440,27 @@ class ScraperBase:
 # -------------------
 # ✔ RPP Noticias (RSS + IMG)
 # -------------------
-class RppScraper(ScraperBase):
+class RppScraper(ScraperRSS):
+    feeds = {"Últimas Noticias": "https://rpp.pe/feed/"}
+
     def __init__(self):
         super().__init__("RPP", "https://rpp.pe")
 
-    def run(self, categorias, save_func):
-        feeds = {"Últimas Noticias": "https://rpp.pe/feed/"}
-
-        for nombre, url in feeds.items():
-            feed = feedparser.parse(url)
-
-            for entry in feed.entries:
-                fecha = extraer_fecha(entry)
-                img = extraer_imagen_de_html(entry.link)
-
-                save_func(
-                    self.name,
-                    entry.title,
-                    nombre,
-                    "",
-                    getattr(entry, "summary", ""),
-                    entry.link,
-                    img,
-                    fecha
-                )
-
 # -------------------
 # ✔ América TV (HTML directo)
 # -------------------
 class AmericaScraper(ScraperBase):
+    feeds = {"Portada": "https://www.americatv.com.pe/"}
+
     def __init__(self):
         super().__init__("América TV", "https://www.americatv.com.pe/")
 
-    def run(self, categorias, save_func):
-        soup = self.fetch(self.base_url)
+    def extraer_noticias(self, categoria, url):
+        soup = self.fetch(url)
         if not soup:
-            return
+            return []
 
+        noticias = []
         for art in soup.find_all("article"):
             try:
                 h2 = art.find("h2")
@@ -189,158 +475,92 @@ class AmericaScraper(ScraperBase):
                 if img_tag and img_tag.get("src"):
                     img = img_tag["src"]
 
-                if not img:
-                    img = extraer_imagen_de_html(enlace)
-
-                save_func(self.name, titulo, "Portada", "", "", enlace, img, None)
+                noticias.append({
+                    "titulo": titulo,
+                    "subtitulo": "",
+                    "descripcion": "",
+                    "url": enlace,
+                    "img": img,
+                    "fecha": None
+                })
 
             except Exception:
                 continue
 
+        return noticias
+
 
 # -------------------
 # ✔ Diario Sin Fronteras (RSS)
 # -------------------
-class SinFronterasScraper(ScraperBase):
+class SinFronterasScraper(ScraperRSS):
+    feeds = {"Portada": "https://diariosinfronteras.com.pe/feed/"}
+
     def __init__(self):
         super().__init__("Diario Sin Fronteras", "https://diariosinfronteras.com.pe")
 
-    def run(self, categorias, save_func):
-        feed = feedparser.parse("https://diariosinfronteras.com.pe/feed/")
-
-        for entry in feed.entries:
-            fecha = extraer_fecha(entry)
-            img = extraer_imagen_de_html(entry.link)
-
-            save_func(
-                self.name,
-                entry.title,
-                "Portada",
-                "",
-                getattr(entry, "summary", ""),
-                entry.link,
-                img,
-                fecha
-            )
-
 
 # -------------------
 # ✔ Perú21 (RSS)
 # -------------------
-class Peru21ScraperRSS(ScraperBase):
+class Peru21ScraperRSS(ScraperRSS):
+    feeds = {
+        "Portada": "https://peru21.pe/feed/",
+        "Política": "https://peru21.pe/politica/feed/",
+        "Economía": "https://peru21.pe/economia/feed/",
+        "Deportes": "https://peru21.pe/deportes/feed/",
+        "Mundo": "https://peru21.pe/mundo/feed/",
+        "Espectáculos": "https://peru21.pe/espectaculos/feed/"
+    }
+
     def __init__(self):
         super().__init__("Perú21", "https://peru21.pe")
 
-    def run(self, categorias, save_func):
-        feeds = {
-            "Portada": "https://peru21.pe/feed/",
-            "Política": "https://peru21.pe/politica/feed/",
-            "Economía": "https://peru21.pe/economia/feed/",
-            "Deportes": "https://peru21.pe/deportes/feed/",
-            "Mundo": "https://peru21.pe/mundo/feed/",
-            "Espectáculos": "https://peru21.pe/espectaculos/feed/"
-        }
-
-        for nombre, url in feeds.items():
-            feed = feedparser.parse(url)
-            for entry in feed.entries:
-                fecha = extraer_fecha(entry)
-                img = extraer_imagen_de_html(entry.link)
-
-                save_func(
-                    self.name, entry.title, nombre, "",
-                    getattr(entry, "summary", ""), entry.link, img, fecha
-                )
-
 
 # -------------------
 # ✔ La República (RSS)
 # -------------------
-class LrScraperRSS(ScraperBase):
+class LrScraperRSS(ScraperRSS):
+    feeds = {
+        "Portada": "https://larepublica.pe/rss",
+        "Política": "https://larepublica.pe/rss/politica",
+        "Economía": "https://larepublica.pe/rss/economia",
+        "Sociedad": "https://larepublica.pe/rss/sociedad",
+        "Mundo": "https://larepublica.pe/rss/mundo",
+        "Deportes": "https://larepublica.pe/rss/deportes",
+        "Espectáculos": "https://larepublica.pe/rss/espectaculos"
+    }
+
     def __init__(self):
         super().__init__("La República", "https://larepublica.pe")
 
-    def run(self, categorias, save_func):
-        feeds = {
-            "Portada": "https://larepublica.pe/rss",
-            "Política": "https://larepublica.pe/rss/politica",
-            "Economía": "https://larepublica.pe/rss/economia",
-            "Sociedad": "https://larepublica.pe/rss/sociedad",
-            "Mundo": "https://larepublica.pe/rss/mundo",
-            "Deportes": "https://larepublica.pe/rss/deportes",
-            "Espectáculos": "https://larepublica.pe/rss/espectaculos"
-        }
-
-        for nombre, url in feeds.items():
-            feed = feedparser.parse(url)
-
-            for entry in feed.entries:
-                fecha = extraer_fecha(entry)
-                img = extraer_imagen_de_html(entry.link)
-
-                save_func(
-                    self.name, entry.title, nombre, "",
-                    getattr(entry, "summary", ""), entry.link, img, fecha
-                )
-
 
 # -------------------
 # ✔ Andina (RSS + fallback HTML)
 # -------------------
-class AndinaScraperRSS(ScraperBase):
+class AndinaScraperRSS(ScraperRSS):
+    feeds = {
+        "Portada": "https://andina.pe/rss.aspx",
+        "Política": "https://andina.pe/rss.aspx?sec=politica",
+        "Economía": "https://andina.pe/rss.aspx?sec=economia",
+        "Internacional": "https://andina.pe/rss.aspx?sec=internacional",
+    }
+
     def __init__(self):
         super().__init__("Andina", "https://andina.pe")
 
-    def run(self, categorias, save_func):
-        feeds = {
-            "Portada": "https://andina.pe/rss.aspx",
-            "Política": "https://andina.pe/rss.aspx?sec=politica",
-            "Economía": "https://andina.pe/rss.aspx?sec=economia",
-            "Internacional": "https://andina.pe/rss.aspx?sec=internacional",
-        }
-
-        for nombre, url in feeds.items():
-            feed = feedparser.parse(url)
-
-            for entry in feed.entries:
-                fecha = extraer_fecha(entry)
-                img = extraer_imagen_de_html(entry.link)
-
-                save_func(
-                    self.name, entry.title, nombre, "",
-                    getattr(entry, "summary", ""), entry.link, img, fecha
-                )
-
 
 # -------------------
 # ✔ CNN Español (RSS + fallback HTML)
 # -------------------
-class CnnScraperRSS(ScraperBase):
+class CnnScraperRSS(ScraperRSS):
+    feeds = {
+        "Portada": "https://cnnespanol.cnn.com/feed/",
+        "Mundo": "https://cnnespanol.cnn.com/category/mundo/feed/",
+        "Economía": "https://cnnespanol.cnn.com/category/economia/feed/",
+        "Deportes": "https://cnnespanol.cnn.com/category/deportes/feed/",
+        "Entretenimiento": "https://cnnespanol.cnn.com/category/entretenimiento/feed/"
+    }
+
     def __init__(self):
         super().__init__("CNN Español", "https://cnnespanol.cnn.com")
-
-    def run(self, categorias, save_func):
-
-        feeds = {
-            "Portada": "https://cnnespanol.cnn.com/feed/",
-            "Mundo": "https://cnnespanol.cnn.com/category/mundo/feed/",
-            "Economía": "https://cnnespanol.cnn.com/category/economia/feed/",
-            "Deportes": "https://cnnespanol.cnn.com/category/deportes/feed/",
-            "Entretenimiento": "https://cnnespanol.cnn.com/category/entretenimiento/feed/"
-        }
-
-        for nombre, url in feeds.items():
-            try:
-                r = session.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=15)
-                feed = feedparser.parse(r.text)
-            except:
-                continue
-
-            for entry in feed.entries:
-                fecha = extraer_fecha(entry)
-                img = extraer_imagen_de_html(entry.link)
-
-                save_func(
-                    self.name, entry.title, nombre, "",
-                    getattr(entry, "summary", ""), entry.link, img, fecha
-                )
@@ -36,11 +36,8 @@ document.addEventListener("DOMContentLoaded", () => {
 }
 
 
-  // 🔄 Auto-refresh cada 3 minutos (sentimiento + alertas)
-  setInterval(() => {
-    refreshSentimiento();
-    loadAlertasIA();
-  }, 180000);
+  // 📡 Estadísticas en vivo: el servidor las envía tras cada ciclo del scraper
+  suscribirEstadisticas();
 
   // 🌙 Toggle modo oscuro panel IA
   const themeBtn = document.getElementById("ia-theme-toggle");
@@ -125,7 +122,10 @@ function initSentimentChart() {
 }
 
 async function refreshSentimiento() {
-  const data = await fetchJSON("/api/stats/sentimiento");
+  pintarSentimiento(await fetchJSON("/api/stats/sentimiento"));
+}
+
+function pintarSentimiento(data) {
   if (!data || !sentimentChartInstance) return;
 
   sentimentChartInstance.data.datasets[0].data = [
@@ -141,6 +141,9 @@ async function refreshSentimiento() {
    📊 2) GRÁFICO DE CATEGORÍAS (BARRAS HORIZONTALES)
    ===================================================================== */
 
+let categoriasChartInstance = null;
+let fuentesChartInstance = null;
+
 async function initCategoriasChart() {
   const canvas = document.getElementById("categoriasChart");
   if (!canvas) return;
@@ -153,7 +156,7 @@ async function initCategoriasChart() {
 
   const ctx = canvas.getContext("2d");
 
-  new Chart(ctx, {
+  categoriasChartInstance = new Chart(ctx, {
     type: "bar",
     data: {
       labels,
@@ -196,7 +199,7 @@ async function initFuentesChart() {
 
   const ctx = canvas.getContext("2d");
 
-  new Chart(ctx, {
+  fuentesChartInstance = new Chart(ctx, {
     type: "doughnut",
     data: {
       labels,
@@ -485,8 +488,10 @@ async function loadAlertasIA() {
 
   renderLoading(container);
 
-  const rows = await fetchJSON("/api/stats/alertas");
+  renderAlertas(container, await fetchJSON("/api/stats/alertas"));
+}
 
+function renderAlertas(container, rows) {
   if (!rows) {
     container.innerHTML = `
       <p class="text-danger small mb-0">❌ Error al cargar alertas IA.</p>`;
@@ -520,6 +525,38 @@ async function loadAlertasIA() {
     .join("");
 }
 
+/* =====================================================================
+   📡 ESTADÍSTICAS EN VIVO (SocketIO)
+   ===================================================================== */
+
+function actualizarGrafico(chart, rows, campo) {
+  if (!chart || !rows) return;
+  chart.data.labels = rows.map((r) => r[campo]);
+  chart.data.datasets[0].data = rows.map((r) => Number(r.total));
+  chart.update();
+}
+
+function suscribirEstadisticas() {
+  if (typeof io === "undefined") {
+    // Sin Socket.IO: refresco cada 3 minutos (sentimiento + alertas)
+    setInterval(() => {
+      refreshSentimiento();
+      loadAlertasIA();
+    }, 180000);
+    return;
+  }
+
+  const socket = io();
+  socket.on("estadisticas", ({ cambios }) => {
+    if (cambios.sentimiento) pintarSentimiento(cambios.sentimiento);
+    if (cambios.categorias) actualizarGrafico(categoriasChartInstance, cambios.categorias, "categoria");
+    if (cambios.fuentes) actualizarGrafico(fuentesChartInstance, cambios.fuentes, "fuente");
+
+    const alertas = document.getElementById("alertas-ia-list");
+    if (cambios.alertas && alertas) renderAlertas(alertas, cambios.alertas);
+  });
+}
+
 /* ================================================================
    WORDCLOUD PRO – Filtros dinámicos + actualización
 ================================================================ */
@@ -8,8 +8,12 @@ document.addEventListener("DOMContentLoaded", () => {
   initSentimientoDoughnut();  // CAMBIADO A DONUT PREMIUM
   initNoticiasDiaChart();
   loadWordCloudMini();
+  suscribirEstadisticas();
 });
 
+// Instancias de Chart.js, para actualizarlas con las estadísticas en vivo
+const charts = {};
+
 /* ============================================================================
    🌐 Helper genérico para fetch → JSON
    ============================================================================ */
@@ -34,7 +38,7 @@ async function initCategoriasChart() {
   const rows = await fetchJSON("/api/stats/categorias");
   if (!rows) return;
 
-  new Chart(canvas.getContext("2d"), {
+  charts.categorias = new Chart(canvas.getContext("2d"), {
     type: "bar",
     data: {
       labels: rows.map(r => r.categoria),
@@ -64,7 +68,7 @@ async function initFuentesChart() {
   const rows = await fetchJSON("/api/stats/fuentes");
   if (!rows) return;
 
-  new Chart(canvas.getContext("2d"), {
+  charts.fuentes = new Chart(canvas.getContext("2d"), {
     type: "bar",
     data: {
       labels: rows.map(r => r.fuente),
@@ -94,7 +98,7 @@ async function initSentimientoDoughnut() {
   const data = await fetchJSON("/api/stats/sentimiento");
   if (!data) return;
 
-  new Chart(canvas.getContext("2d"), {
+  charts.sentimiento = new Chart(canvas.getContext("2d"), {
     type: "doughnut",
     data: {
       labels: ["Positivas", "Negativas", "Neutras"],
@@ -132,15 +136,10 @@ async function initNoticiasDiaChart() {
   const rows = await fetchJSON("/api/stats/noticias_dia");
   if (!rows) return;
 
-  const labels = rows.map(r => {
-    let [y, m, d] = r.fecha.split("-");
-    return `${d}/${m}`;
-  });
-
-  new Chart(canvas.getContext("2d"), {
+  charts.noticias_dia = new Chart(canvas.getContext("2d"), {
     type: "line",
     data: {
-      labels,
+      labels: etiquetasDia(rows),
       datasets: [{
         label: "Noticias por día",
         data: rows.map(r => r.total),
@@ -162,6 +161,13 @@ async function initNoticiasDiaChart() {
   });
 }
 
+function etiquetasDia(rows) {
+  return rows.map(r => {
+    let [y, m, d] = r.fecha.split("-");
+    return `${d}/${m}`;
+  });
+}
+
 /* ============================================================================
    5) WordCloud mini — Premium Style
    ============================================================================ */
@@ -200,3 +206,32 @@ async function loadWordCloudMini() {
     </span>
   `).join("");
 }
+
+/* ============================================================================
+   6) Estadísticas en vivo — el servidor envía solo las secciones que
+      cambiaron, una vez por ciclo del scraper (sin polling)
+   ============================================================================ */
+function suscribirEstadisticas() {
+  if (typeof io === "undefined") return;
+
+  const socket = io();
+  socket.on("estadisticas", ({ cambios }) => {
+    const actualizar = (chart, labels, data) => {
+      if (!chart) return;
+      chart.data.labels = labels;
+      chart.data.datasets[0].data = data;
+      chart.update();
+    };
+
+    if (cambios.categorias)
+      actualizar(charts.categorias, cambios.categorias.map(r => r.categoria), cambios.categorias.map(r => r.total));
+    if (cambios.fuentes)
+      actualizar(charts.fuentes, cambios.fuentes.map(r => r.fuente), cambios.fuentes.map(r => r.total));
+    if (cambios.noticias_dia)
+      actualizar(charts.noticias_dia, etiquetasDia(cambios.noticias_dia), cambios.noticias_dia.map(r => r.total));
+    if (cambios.sentimiento) {
+      const s = cambios.sentimiento;
+      actualizar(charts.sentimiento, ["Positivas", "Negativas", "Neutras"], [s.positivos, s.negativos, s.neutros]);
+    }
+  });
+}
@@ -3,8 +3,7 @@ console.log("📌 index.js cargado correctamente");
 // Estado global de los filtros
 let fuenteActual = "";
 let categoriaActual = "";
-let paginaActual = 1;
-let totalPaginas = 1;
+let cursorSiguiente = null;   // next_cursor de /api/noticias
 
 // 🌙 Toggle Modo Oscuro
 const toggle = document.getElementById("toggleDark");
@@ -22,23 +21,25 @@ if (toggle) {
     });
 }
 
-// 🔄 Cargar Noticias filtradas
-function actualizarNoticias() {
-    fetch(`/api/noticias?fuente=${fuenteActual}&categoria=${categoriaActual}&page=${paginaActual}&per_page=10`)
+// 🔄 Cargar Noticias filtradas (agregar=true continúa desde el cursor)
+function actualizarNoticias(agregar = false) {
+    const cursor = agregar && cursorSiguiente ? `&cursor=${encodeURIComponent(cursorSiguiente)}` : "";
+
+    fetch(`/api/noticias?fuente=${fuenteActual}&categoria=${categoriaActual}&per_page=10${cursor}`)
         .then(r => r.json())
         .then(res => {
             const cont = document.getElementById("contenido-noticias");
             const pag = document.getElementById("pagination");
 
-            cont.innerHTML = "";
+            if (!agregar) cont.innerHTML = "";
             pag.innerHTML = "";
 
-            if (!res.data || res.data.length === 0) {
+            if (!agregar && (!res.data || res.data.length === 0)) {
                 cont.innerHTML = "<div class='col-12 text-center text-muted'><em>No se encontraron noticias.</em></div>";
                 return;
             }
 
-            res.data.forEach(n => {
+            (res.data || []).forEach(n => {
                 cont.innerHTML += `
                 <div class="col-md-6 col-lg-4 mb-4">
                     <div class="card news-card h-100">
@@ -52,25 +53,25 @@ function actualizarNoticias() {
                 </div>`;
             });
 
-            totalPaginas = res.pages;
+            cursorSiguiente = res.next_cursor;
             generarPaginacion();
         });
 }
 
-// 🔢 Generar paginación
+// ➕ Botón "Cargar más" mientras haya cursor
 function generarPaginacion() {
     const pag = document.getElementById("pagination");
-    for (let i = 1; i <= totalPaginas; i++) {
-        pag.innerHTML += `
-            <li class="page-item ${i === paginaActual ? 'active' : ''}">
-                <a href="#" class="page-link" onclick="cambiarPagina(${i})">${i}</a>
-            </li>`;
-    }
+    if (!cursorSiguiente) return;
+
+    pag.innerHTML = `
+        <li class="page-item">
+            <a href="#" class="page-link" onclick="cargarMas(event)">Cargar más</a>
+        </li>`;
 }
 
-function cambiarPagina(num) {
-    paginaActual = num;
-    actualizarNoticias();
+function cargarMas(e) {
+    e.preventDefault();
+    actualizarNoticias(true);
 }
 
 // 🎯 Selección de filtros
@@ -79,11 +80,11 @@ document.addEventListener("DOMContentLoaded", () => {
     // Filtros por fuente
     document.querySelectorAll("#fuente-filtros .btn-filter").forEach(btn => {
         btn.addEventListener("click", () => {
-            documento.querySelectorAll("#fuente-filtros .btn-filter").forEach(b => b.classList.remove("active"));
+            document.querySelectorAll("#fuente-filtros .btn-filter").forEach(b => b.classList.remove("active"));
             btn.classList.add("active");
 
             fuenteActual = btn.dataset.fuente;
-            paginaActual = 1;
+            cursorSiguiente = null;
             actualizarNoticias();
         });
     });
@@ -95,7 +96,7 @@ document.addEventListener("DOMContentLoaded", () => {
             btn.classList.add("active");
 
             categoriaActual = btn.dataset.categoria;
-            paginaActual = 1;
+            cursorSiguiente = null;
             actualizarNoticias();
         });
     });
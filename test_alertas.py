@@ -0,0 +1,144 @@
+# ============================================================
+# 🧪 test_alertas.py — Palabras de riesgo y ranking top-N en memoria
+# ============================================================
+#
+# Uso:
+#   python -m pytest -q test_alertas.py
+#
+# Sin MySQL: _filas_alertas y listar_fuentes se reemplazan por listas
+# en memoria; cada carga del ranking queda anotada.
+# ============================================================
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.services import alertas_service
+from backend.services.alertas_service import MonitorAlertas, evaluar_riesgo
+
+
+# ============================================================
+# 🔤 evaluar_riesgo
+# ============================================================
+@pytest.mark.parametrize("texto, esperado", [
+    ("Presentan robot de limpieza", (0, 0)),                    # robo ⊂ robot
+    ("Choquetazo de popularidad", (0, 0)),                      # choque ⊂ choquetazo
+    ("Hallan a dos asesinados en Comas", (1, 1)),
+    ("Denuncian corrupcion en la obra", (1, 1)),                # sin tilde en el texto
+    ("CRISIS: INCENDIO DEJA HERIDOS", (2, 2)),
+    ("Accidente y choque: heridos y una muerte", (3, 4)),
+    ("Muerte tras muertes", (1, 1)),                            # una vez por palabra
+    (None, (0, 0)),
+])
+def test_evaluar_riesgo_palabra_completa(texto, esperado):
+    assert evaluar_riesgo(texto) == esperado
+
+
+# ============================================================
+# 🏆 MonitorAlertas
+# ============================================================
+AHORA = datetime.now().replace(microsecond=0)
+
+
+def _noticia(i, nivel, conteo, horas=1):
+    return {
+        "id": i, "titulo": f"Alerta {i}", "categoria": "Policiales", "fuente_id": 1,
+        "fuente": "RPP", "fecha_efectiva": AHORA - timedelta(hours=horas),
+        "riesgo_nivel": nivel, "riesgo_conteo": conteo
+    }
+
+
+@pytest.fixture
+def bd(monkeypatch):
+    class BD:
+        filas = []      # lo que devuelve _filas_alertas (ya ordenado y limitado)
+        cargas = 0
+
+    def filas_alertas(dias, limite):
+        BD.cargas += 1
+        return sorted(BD.filas, key=MonitorAlertas._clave, reverse=True)[:limite]
+
+    monkeypatch.setattr(alertas_service, "_filas_alertas", filas_alertas)
+    monkeypatch.setattr(alertas_service, "listar_fuentes", lambda: [{"id": 1, "nombre": "RPP"}])
+    return BD
+
+
+def _ids(monitor):
+    return [a["id"] for a in monitor.obtener()]
+
+
+def test_carga_inicial_ordenada(bd):
+    bd.filas = [_noticia(1, 1, 1), _noticia(2, 3, 4), _noticia(3, 2, 2)]
+    monitor = MonitorAlertas(limite=3)
+
+    assert _ids(monitor) == [2, 3, 1]
+    assert monitor.obtener()[0]["nivel"] == "alto"
+    assert bd.cargas == 1
+
+
+def test_nueva_alerta_desplaza_a_la_mas_leve(bd):
+    bd.filas = [_noticia(1, 1, 1), _noticia(2, 3, 4), _noticia(3, 2, 2)]
+    monitor = MonitorAlertas(limite=3)
+    monitor.obtener()
+
+    monitor.actualizar([_noticia(4, 2, 3)])
+    assert _ids(monitor) == [2, 4, 3]
+
+    # Más leve que la última del ranking: no entra
+    monitor.actualizar([_noticia(5, 1, 1, horas=30)])
+    assert _ids(monitor) == [2, 4, 3]
+    assert bd.cargas == 1
+
+
+def test_subir_de_puntaje_reordena_sin_recargar(bd):
+    bd.filas = [_noticia(1, 1, 1), _noticia(2, 3, 4), _noticia(3, 2, 2)]
+    monitor = MonitorAlertas(limite=3)
+    monitor.obtener()
+
+    monitor.actualizar([_noticia(1, 3, 5)])
+
+    assert _ids(monitor) == [1, 2, 3]
+    assert monitor.obtener()[0]["conteo"] == 5
+    assert bd.cargas == 1
+
+    # El heap sigue sacando a la más leve
+    monitor.actualizar([_noticia(6, 3, 4, horas=0)])
+    assert _ids(monitor) == [1, 6, 2]
+
+
+@pytest.mark.parametrize("cambio", [
+    {"noticias": [_noticia(2, 1, 1)]},             # bajó de puntaje
+    {"noticias": [_noticia(2, 0, 0)]},             # ya no tiene riesgo
+    {"noticias": [_noticia(2, 3, 4, horas=200)]},  # salió de la ventana de días
+    {"noticias": [], "eliminadas": [2]},           # se borró
+])
+def test_salir_del_ranking_recarga_desde_la_bd(bd, cambio):
+    bd.filas = [_noticia(1, 1, 1), _noticia(2, 3, 4), _noticia(3, 2, 2), _noticia(4, 1, 1, horas=5)]
+    monitor = MonitorAlertas(limite=3)
+    assert _ids(monitor) == [2, 3, 1]
+
+    bd.filas = [f for f in bd.filas if f["id"] != 2]
+    monitor.actualizar(**cambio)
+
+    assert _ids(monitor) == [3, 1, 4]
+    assert bd.cargas == 2
+
+
+def test_actualizar_antes_de_cargar_no_hace_nada(bd):
+    bd.filas = [_noticia(1, 2, 2)]
+    monitor = MonitorAlertas(limite=3)
+
+    monitor.actualizar([_noticia(9, 3, 4)])
+
+    assert _ids(monitor) == [1]
+    assert bd.cargas == 1
+
+
+def test_ttl_vencido_recarga(bd):
+    bd.filas = [_noticia(1, 2, 2)]
+    monitor = MonitorAlertas(limite=3, ttl=0)
+
+    monitor.obtener()
+    monitor.obtener()
+
+    assert bd.cargas == 2
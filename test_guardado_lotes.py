@@ -0,0 +1,133 @@
+# ============================================================
+# 🧪 test_guardado_lotes.py — guardar_noticias_lote contra una BD falsa
+# ============================================================
+#
+# Uso:
+#   python -m pytest -q test_guardado_lotes.py
+#
+# La conexión falsa guarda las noticias en un dict y aplica el upsert
+# de SQL_UPSERT_NOTICIA: fecha_publicacion solo cambia si llega una.
+# ============================================================
+
+from datetime import datetime
+
+import pytest
+
+import db
+
+COLUMNAS = ("id", "url_noticia", "titulo", "subtitulo", "descripcion", "url_imagen",
+            "fecha_publicacion", "fecha_efectiva", "dia", "fuente_id", "categoria")
+
+
+class BDFalsa:
+    def __init__(self):
+        self.noticias = {}     # {url: fila}
+        self.upserts = []      # filas enviadas en cada executemany del upsert
+
+    def get_connection(self):
+        return ConexionFalsa(self)
+
+
+class ConexionFalsa:
+    def __init__(self, bd):
+        self.bd = bd
+
+    def cursor(self):
+        return CursorFalso(self.bd)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class CursorFalso:
+    def __init__(self, bd):
+        self.bd = bd
+        self._filas = []
+        self.description = [(c,) for c in COLUMNAS]
+
+    def execute(self, sql, params=()):
+        urls = set(params)
+        self._filas = [f for url, f in self.bd.noticias.items() if url in urls]
+
+    def fetchall(self):
+        return [tuple(f[c] for c in COLUMNAS) for f in self._filas]
+
+    def executemany(self, sql, filas):
+        if sql is not db.SQL_UPSERT_NOTICIA:
+            return
+        self.bd.upserts.append(filas)
+        for fuente_id, titulo, categoria, subtitulo, descripcion, url, url_imagen, fecha, registro in filas:
+            previa = self.bd.noticias.get(url)
+            if previa is None:
+                previa = self.bd.noticias[url] = {
+                    "id": len(self.bd.noticias) + 1, "url_noticia": url, "titulo": titulo,
+                    "fuente_id": fuente_id, "categoria": categoria,
+                    "fecha_publicacion": None, "fecha_registro": registro
+                }
+            previa.update(subtitulo=subtitulo, descripcion=descripcion, url_imagen=url_imagen)
+            previa["fecha_publicacion"] = fecha or previa["fecha_publicacion"]
+            previa["fecha_efectiva"] = previa["fecha_publicacion"] or previa["fecha_registro"]
+            previa["dia"] = previa["fecha_efectiva"].date()
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def bd(monkeypatch):
+    bd = BDFalsa()
+    derivados = []
+    monkeypatch.setattr(db, "connection_pool", bd)
+    monkeypatch.setattr(db, "obtener_fuente_id", lambda nombre: 1)
+    monkeypatch.setattr(db, "_mantener_derivados",
+                        lambda cursor, antes, despues: derivados.append((antes, despues)) or ([], []))
+    monkeypatch.setattr(db, "notificar_cambio_noticias", lambda noticias: bd.notificadas.append(noticias))
+    bd.derivados = derivados
+    bd.notificadas = []
+    return bd
+
+
+def _noticia(url, descripcion="", fecha=None):
+    return ("America TV", f"Titular {url}", "Política", "", descripcion, url, "", fecha)
+
+
+def test_sin_fecha_conserva_la_fecha_efectiva_del_primer_guardado(bd):
+    assert db.guardar_noticias_lote([_noticia("a")]) == 1
+    primera = bd.noticias["a"]["fecha_efectiva"]
+
+    assert db.guardar_noticias_lote([_noticia("a", descripcion="editada")]) == 1
+
+    assert bd.noticias["a"]["fecha_publicacion"] is None
+    assert bd.noticias["a"]["fecha_efectiva"] == primera
+
+
+def test_fecha_nula_no_pisa_una_fecha_conocida(bd):
+    fecha = datetime(2026, 10, 1, 8, 30)
+    db.guardar_noticias_lote([_noticia("a", fecha=fecha)])
+    db.guardar_noticias_lote([_noticia("a", descripcion="editada")])
+
+    assert bd.noticias["a"]["fecha_publicacion"] == fecha
+
+
+def test_noticias_sin_cambios_no_se_reescriben(bd):
+    db.guardar_noticias_lote([_noticia("a"), _noticia("b")])
+
+    # Mismo contenido otra vez: se cuentan como procesadas, sin escritura ni avisos
+    assert db.guardar_noticias_lote([_noticia("a"), _noticia("b")]) == 2
+    assert len(bd.upserts) == 1
+    assert len(bd.derivados) == 1
+    assert len(bd.notificadas) == 1
+
+    # Solo la que cambió pasa por el upsert y los datos derivados
+    db.guardar_noticias_lote([_noticia("a"), _noticia("b", descripcion="nueva versión")])
+    assert [f[5] for f in bd.upserts[-1]] == ["b"]
+    antes, despues = bd.derivados[-1]
+    assert [f["url_noticia"] for f in antes] == ["b"]
+    assert [f["url_noticia"] for f in despues] == ["b"]
+    assert [(n["url_noticia"], n["nueva"]) for n in bd.notificadas[-1]] == [("b", False)]
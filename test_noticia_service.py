@@ -0,0 +1,98 @@
+# ============================================================
+# 🧪 test_noticia_service.py — Cursor de paginación (keyset)
+# ============================================================
+#
+# Uso:
+#   python -m pytest -q test_noticia_service.py
+#
+# Sin MySQL: execute_query se reemplaza por una función que anota la
+# consulta y devuelve las filas preparadas por cada prueba.
+# ============================================================
+
+import base64
+from datetime import datetime
+
+import pytest
+
+from backend.services import noticia_service
+from backend.services.noticia_service import (
+    CursorInvalido, codificar_cursor, decodificar_cursor, obtener_pagina_noticias
+)
+
+
+class Consultas(list):
+    filas = []      # lo que devuelve execute_query
+
+
+@pytest.fixture
+def consultas(monkeypatch):
+    consultas = Consultas()
+
+    def execute_query(query, params=None, **kwargs):
+        consultas.append((query, params))
+        return consultas.filas
+
+    monkeypatch.setattr(noticia_service, "execute_query", execute_query)
+    monkeypatch.setattr(noticia_service, "obtener_fuente_id", lambda nombre, crear=True: 7)
+    return consultas
+
+
+def _fila(i, fecha):
+    return {"id": i, "titulo": f"Noticia {i}", "fecha_efectiva": fecha, "fuente": "RPP"}
+
+
+def test_cursor_ida_y_vuelta():
+    fecha = datetime(2026, 10, 18, 7, 45, 3)
+    cursor = codificar_cursor(fecha, 1234)
+
+    assert "=" not in cursor
+    assert decodificar_cursor(cursor) == (fecha, 1234)
+
+
+@pytest.mark.parametrize("cursor", [
+    "",
+    "no-es-base64!",
+    base64.urlsafe_b64encode(b"2026-10-18T07:45:03").decode(),         # sin id
+    base64.urlsafe_b64encode(b"ayer|12").decode(),                     # fecha inválida
+    base64.urlsafe_b64encode(b"2026-10-18T07:45:03|doce").decode(),    # id no numérico
+])
+def test_cursor_invalido(cursor):
+    with pytest.raises(CursorInvalido):
+        decodificar_cursor(cursor)
+
+
+def test_cursor_invalido_es_value_error():
+    assert issubclass(CursorInvalido, ValueError)
+
+
+def test_pagina_con_cursor_usa_la_posicion_como_fila(consultas):
+    fecha = datetime(2026, 10, 18, 7, 45, 3)
+
+    obtener_pagina_noticias(categoria="Política", per_page=12, cursor=codificar_cursor(fecha, 99))
+    sql, params = consultas[-1]
+
+    assert "(n.fecha_efectiva, n.id) < (%s, %s)" in sql
+    assert "OFFSET %s" in sql
+    assert params == ("Política", fecha, 99, 13, 0)
+
+
+def test_siguiente_cursor_apunta_a_la_ultima_entregada(consultas):
+    fechas = [datetime(2026, 10, 18, 12 - i) for i in range(4)]
+    consultas.filas = [_fila(10 - i, f) for i, f in enumerate(fechas)]
+
+    rows, next_cursor = obtener_pagina_noticias(fuente="RPP", per_page=3)
+
+    assert [r["id"] for r in rows] == [10, 9, 8]
+    assert all("fecha_efectiva" not in r for r in rows)
+    assert decodificar_cursor(next_cursor) == (fechas[2], 8)
+    assert consultas[-1][1] == (7, 4, 0)
+
+
+def test_ultima_pagina_sin_cursor_siguiente(consultas):
+    consultas.filas = [_fila(1, datetime(2026, 10, 18))]
+
+    rows, next_cursor = obtener_pagina_noticias(per_page=3, page=2)
+
+    assert len(rows) == 1
+    assert next_cursor is None
+    assert consultas[-1][1] == (4, 3)    # respaldo con OFFSET para clientes antiguos
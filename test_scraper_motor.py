@@ -0,0 +1,232 @@
+# ============================================================
+# 🧪 test_scraper_motor.py — Un scraper falso por cada modo de ejecución
+# ============================================================
+#
+# Uso:
+#   python -m pytest -q test_scraper_motor.py
+#
+# Sin red ni MySQL: el scraper falso entrega noticias con la imagen ya
+# resuelta, db.py se importa con el pool falso de conftest.py y las
+# consultas de scraper_cache van a una BD en memoria.
+# ============================================================
+
+import threading
+
+import pytest
+
+import db
+import scraper_cache
+from scraper_concurrente import MotorConcurrente
+from scraper_modular import ScraperBase
+
+
+@pytest.fixture(autouse=True)
+def bd_falsa(monkeypatch):
+    """Consultas de scraper_cache contra listas en memoria."""
+    consultas = []
+
+    def execute_query(query, params=None, **kwargs):
+        consultas.append((query, params))
+        return [] if kwargs.get("fetch") else 1
+
+    def execute_many(query, filas, commit=True):
+        filas = list(filas)
+        consultas.append((query, filas))
+        return len(filas)
+
+    monkeypatch.setattr(scraper_cache, "execute_query", execute_query)
+    monkeypatch.setattr(scraper_cache, "execute_many", execute_many)
+    return consultas
+
+
+class ScraperFalso(ScraperBase):
+    feeds = {"Política": "https://falso.pe/politica", "Mundo": "https://falso.pe/mundo"}
+
+    def __init__(self):
+        super().__init__("Falso", "https://falso.pe")
+        self.confirmados = []
+
+    def noticias_de_feed(self, categoria, url):
+        return [
+            {
+                "titulo": f"{categoria} {i}", "subtitulo": "", "descripcion": "",
+                "url": f"{url}/{i}", "img": "", "fecha": None, "imagen_resuelta": True
+            }
+            for i in range(3)
+        ]
+
+    def confirmar_feed(self, url):
+        self.confirmados.append(url)
+
+
+class ScraperLento(ScraperFalso):
+    """El feed de Mundo no responde hasta que la prueba lo libera."""
+
+    def __init__(self):
+        super().__init__()
+        self.liberar = threading.Event()
+
+    def noticias_de_feed(self, categoria, url):
+        if categoria == "Mundo":
+            self.liberar.wait(5)
+            return []
+        return super().noticias_de_feed(categoria, url)
+
+
+def _guardadas(llamadas):
+    return sorted((fuente, titulo, categoria, url) for fuente, titulo, categoria, _, _, url, _, _ in llamadas)
+
+
+ESPERADAS = sorted(
+    ("Falso", f"{categoria} {i}", categoria, f"{url}/{i}")
+    for categoria, url in ScraperFalso.feeds.items()
+    for i in range(3)
+)
+
+
+# ============================================================
+# ⚡ MotorConcurrente
+# ============================================================
+def test_motor_concurrente_resumen_por_fuente():
+    llamadas = []
+    falso = ScraperFalso()
+
+    resumen = MotorConcurrente(lambda *args: llamadas.append(args)).ejecutar([falso])
+
+    assert _guardadas(llamadas) == ESPERADAS
+    assert resumen["total_noticias"] == 6
+    assert resumen["total_guardadas"] == 6
+
+    fuente = resumen["fuentes"][0]
+    assert {k: fuente[k] for k in ("fuente", "estado", "feeds", "feeds_ok", "noticias",
+                                   "guardadas", "omitidas", "errores", "plazo_agotado")} == {
+        "fuente": "Falso", "estado": "ok", "feeds": 2, "feeds_ok": 2, "noticias": 6,
+        "guardadas": 6, "omitidas": 0, "errores": [], "plazo_agotado": False
+    }
+    assert sorted(falso.confirmados) == sorted(ScraperFalso.feeds.values())
+
+
+def test_motor_concurrente_no_confirma_feed_con_error_al_guardar():
+    falso = ScraperFalso()
+
+    def guardar(fuente, titulo, *resto):
+        if titulo == "Mundo 1":
+            raise RuntimeError("BD caída")
+
+    resumen = MotorConcurrente(guardar).ejecutar([falso])
+    fuente = resumen["fuentes"][0]
+
+    assert fuente["estado"] == "parcial"
+    assert fuente["feeds_ok"] == 1
+    assert any("BD caída" in e for e in fuente["errores"])
+    assert falso.confirmados == [ScraperFalso.feeds["Política"]]
+
+
+def test_motor_concurrente_cancela_al_agotar_el_plazo():
+    llamadas = []
+    lento = ScraperLento()
+
+    try:
+        resumen = MotorConcurrente(lambda *args: llamadas.append(args), plazo=0.3).ejecutar([lento])
+    finally:
+        lento.liberar.set()
+    fuente = resumen["fuentes"][0]
+
+    assert fuente["estado"] == "plazo_agotado"
+    assert fuente["plazo_agotado"] is True
+    assert "plazo del ciclo agotado" in fuente["errores"]
+    assert fuente["feeds_ok"] == 1
+    assert lento.confirmados == [ScraperFalso.feeds["Política"]]
+    assert all(categoria == "Política" for _, _, categoria, *_ in llamadas)
+
+
+# ============================================================
+# 📦 Confirmación diferida con GuardadoPorLotes
+# ============================================================
+@pytest.mark.parametrize("escribe", [True, False])
+def test_guardadas_y_validadores_segun_el_flush(monkeypatch, escribe):
+    lotes = []
+    monkeypatch.setattr(db, "guardar_noticias_lote",
+                        lambda lote: lotes.append(lote) or (len(lote) if escribe else 0))
+    falso = ScraperFalso()
+
+    with db.GuardadoPorLotes(tamano_lote=1000, intervalo=60) as guardar:
+        resumen = MotorConcurrente(guardar).ejecutar([falso])
+    fuente = resumen["fuentes"][0]
+
+    assert sum(len(l) for l in lotes) == 6
+    if escribe:
+        assert (fuente["estado"], fuente["guardadas"], fuente["omitidas"]) == ("ok", 6, 0)
+        assert sorted(falso.confirmados) == sorted(ScraperFalso.feeds.values())
+    else:
+        # Entregadas al buffer pero nunca escritas: ni guardadas ni confirmadas
+        assert (fuente["estado"], fuente["guardadas"], fuente["omitidas"]) == ("error", 0, 6)
+        assert resumen["total_guardadas"] == 0
+        assert falso.confirmados == []
+
+
+def test_flush_fallido_solo_descarta_los_feeds_de_ese_lote(monkeypatch):
+    monkeypatch.setattr(db, "guardar_noticias_lote",
+                        lambda lote: 0 if any(n[2] == "Mundo" for n in lote) else len(lote))
+    falso = ScraperFalso()
+
+    with db.GuardadoPorLotes(tamano_lote=3, intervalo=60) as guardar:
+        resumen = MotorConcurrente(guardar, max_feeds=1).ejecutar([falso])
+    fuente = resumen["fuentes"][0]
+
+    assert (fuente["estado"], fuente["feeds_ok"], fuente["guardadas"]) == ("parcial", 1, 3)
+    assert falso.confirmados == [ScraperFalso.feeds["Política"]]
+
+
+def test_confirmaciones_del_flush_consultan_sin_trabar_permisos(monkeypatch, bd_falsa):
+    monkeypatch.setattr(db, "guardar_noticias_lote", len)
+    validadores = scraper_cache.ValidadoresFeed()
+
+    class ScraperConValidadores(ScraperFalso):
+        def confirmar_feed(self, url):
+            validadores.actualizar(url, f"etag-{url}", None)
+            super().confirmar_feed(url)
+
+    falso = ScraperConValidadores()
+    # Todos los permisos menos uno ocupados: la confirmación debe usar el que queda
+    for _ in range(scraper_cache.MAX_CONEXIONES_SCRAPER - 1):
+        scraper_cache.acceso_bd.acquire()
+    try:
+        with db.GuardadoPorLotes(tamano_lote=1, intervalo=60) as guardar:
+            MotorConcurrente(guardar, plazo=5).ejecutar([falso])
+    finally:
+        for _ in range(scraper_cache.MAX_CONEXIONES_SCRAPER - 1):
+            scraper_cache.acceso_bd.release()
+
+    assert sorted(falso.confirmados) == sorted(ScraperFalso.feeds.values())
+    assert sum("feeds_validadores (url" in q for q, _ in bd_falsa) == 2
+
+
+# ============================================================
+# 🐢 Modo secuencial
+# ============================================================
+def test_ejecucion_secuencial_llama_save_func(monkeypatch):
+    scraper = pytest.importorskip("scraper", reason="scraper.py requiere selenium (Facebook)")
+    llamadas = []
+    falso = ScraperFalso()
+    monkeypatch.setattr(scraper, "run_facebook_scraper", lambda save_func: None)
+
+    resumen = scraper._ejecutar_secuencial([falso], lambda *args: llamadas.append(args))
+
+    assert _guardadas(llamadas) == ESPERADAS
+    assert resumen["fuentes"][0]["estado"] == "ok"
+    assert sorted(falso.confirmados) == sorted(ScraperFalso.feeds.values())
+
+
+def test_ejecucion_secuencial_cuenta_lo_escrito(monkeypatch):
+    scraper = pytest.importorskip("scraper", reason="scraper.py requiere selenium (Facebook)")
+    monkeypatch.setattr(scraper, "run_facebook_scraper", lambda save_func: None)
+    monkeypatch.setattr(db, "guardar_noticias_lote", lambda lote: 0)
+    falso = ScraperFalso()
+
+    with db.GuardadoPorLotes(tamano_lote=1000, intervalo=60) as guardar:
+        resumen = scraper._ejecutar_secuencial([falso], guardar)
+    fuente = resumen["fuentes"][0]
+
+    assert (fuente["noticias"], fuente["guardadas"], fuente["omitidas"]) == (6, 0, 6)
+    assert falso.confirmados == []
@@ -0,0 +1,73 @@
+# ============================================================
+# 🧪 test_sentimiento.py — Léxico compilado vs. el puntaje original
+# ============================================================
+#
+# Uso:
+#   python -m pytest -q test_sentimiento.py
+#
+# puntaje_original es el score que usaban dashboard_service y
+# /api/stats/sentimiento antes del motor compilado (subcadenas, una vez
+# por palabra). Donde el original acertaba, el resultado debe coincidir;
+# las diferencias (subcadenas, nombres propios, formas flexionadas)
+# quedan fijadas aparte.
+# ============================================================
+
+import pytest
+
+from backend.services.alertas_service import evaluar_riesgo
+from backend.services.sentimiento_service import (
+    POSITIVAS, NEGATIVAS, puntuar, analizar_sentimiento_texto, compilar_lexico
+)
+
+
+def puntaje_original(texto):
+    text = texto.lower()
+    return sum(p in text for p in POSITIVAS) - sum(n in text for n in NEGATIVAS)
+
+
+IGUAL_QUE_EL_ORIGINAL = [
+    "Gran victoria y récord de crecimiento en exportaciones",
+    "Crisis política: denuncia por corrupción en el municipio",
+    "Mueren tres personas en accidente de tránsito",
+    "Crisis tras crisis en el transporte",                  # una vez por palabra
+    "Ganancias récord para los exportadores",
+    "Se reúne el consejo regional",
+]
+
+
+@pytest.mark.parametrize("titulo", IGUAL_QUE_EL_ORIGINAL)
+def test_coincide_con_el_puntaje_original(titulo):
+    assert puntuar(titulo) == puntaje_original(titulo)
+
+
+@pytest.mark.parametrize("titulo, original, esperado", [
+    ("Advierten de un tramo peligroso en la vía", -1, 0),       # peligro ⊂ peligroso
+    ("La ministra Victoria Ruiz visita Cusco", 1, 0),          # nombre propio
+    ("Bancada progresista presenta su agenda", 0, 0),
+    ("Exportaciones en ascenso: nueva Victoria del agro", 1, 0),
+    ("Denuncian corrupcion en obra pública", -1, -1),          # sin tilde en el texto
+    ("Buenas noticias: la economía crece y mejora", 2, 3),     # "buenas" es forma de "bueno"
+])
+def test_difiere_del_original_por_palabra_completa(titulo, original, esperado):
+    assert puntaje_original(titulo) == original
+    assert puntuar(titulo) == esperado
+
+
+def test_etiquetas():
+    assert analizar_sentimiento_texto("Excelente avance en salud") == "pos"
+    assert analizar_sentimiento_texto("Tragedia en la sierra") == "neg"
+    assert analizar_sentimiento_texto("Éxito y fracaso del plan") == "neu"
+    assert analizar_sentimiento_texto(None) == "neu"
+
+
+def test_compilar_lexico_palabra_completa_y_tildes():
+    patron = compilar_lexico({"a": ["camión"], "b": ["río", "ríos"]})
+
+    assert [m.lastgroup for m in patron.finditer("el camion cruzó los ríos")] == ["a", "b"]
+    assert list(patron.finditer("camioneta riosa")) == []
+
+
+def test_riesgo_cuenta_palabras_distintas_completas():
+    assert evaluar_riesgo("Robot de limpieza gana premio") == (0, 0)
+    assert evaluar_riesgo("Robo y robos en el mercado") == (1, 1)
+    assert evaluar_riesgo("Incendio deja heridos; investigan secuestro y asalto") == (3, 4)
@@ -0,0 +1,106 @@
+# ============================================================
+# 🧪 test_wordcloud_cache.py — Caché LRU de nubes renderizadas
+# ============================================================
+#
+# Uso:
+#   python -m pytest -q test_wordcloud_cache.py
+#
+# Sin MySQL ni render real: frecuencias_terminos y renderizar se
+# reemplazan por funciones que anotan cada llamada.
+# ============================================================
+
+import threading
+
+import pytest
+
+pytest.importorskip("wordcloud")
+
+from backend.services import wordcloud_service
+from backend.services.wordcloud_service import CacheWordclouds, clave_wordcloud
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    renders = []
+
+    def frecuencias(categoria="", fuente="", dias="", query="", limite=100):
+        renders.append(categoria)
+        return [(categoria or "todas", 3)]
+
+    monkeypatch.setattr(wordcloud_service, "frecuencias_terminos", frecuencias)
+    monkeypatch.setattr(wordcloud_service, "renderizar",
+                        lambda conteo, **kwargs: repr(sorted(conteo)).encode())
+    return renders
+
+
+def _clave(categoria):
+    return clave_wordcloud(categoria=categoria)
+
+
+def test_segunda_peticion_sale_de_la_cache(renders):
+    cache = CacheWordclouds(ttl=60, maximo=3)
+
+    primera = cache.obtener(_clave("Política"))
+    segunda = cache.obtener(_clave("Política"))
+
+    assert primera == segunda
+    assert primera[1]                   # etag
+    assert renders == ["Política"]
+
+
+def test_desaloja_la_menos_usada(renders):
+    cache = CacheWordclouds(ttl=60, maximo=2)
+
+    cache.obtener(_clave("Política"))
+    cache.obtener(_clave("Mundo"))
+    cache.obtener(_clave("Política"))      # Mundo pasa a ser la menos usada
+    cache.obtener(_clave("Deportes"))      # desaloja a Mundo
+
+    cache.obtener(_clave("Política"))
+    cache.obtener(_clave("Mundo"))
+
+    assert renders == ["Política", "Mundo", "Deportes", "Mundo"]
+
+
+def test_expirada_se_vuelve_a_renderizar(renders):
+    cache = CacheWordclouds(ttl=0, maximo=3)
+
+    cache.obtener(_clave("Política"))
+    cache.obtener(_clave("Política"))
+
+    assert renders == ["Política", "Política"]
+
+
+def test_peticiones_simultaneas_renderizan_una_vez(monkeypatch, renders):
+    cache = CacheWordclouds(ttl=60, maximo=3)
+    empezo, liberar = threading.Event(), threading.Event()
+    renderizar = cache._renderizar
+
+    def lento(clave):
+        empezo.set()
+        liberar.wait(5)
+        return renderizar(clave)
+
+    monkeypatch.setattr(cache, "_renderizar", lento)
+    resultados = []
+    hilos = [threading.Thread(target=lambda: resultados.append(cache.obtener(_clave("Mundo"))))
+             for _ in range(4)]
+    for h in hilos:
+        h.start()
+    empezo.wait(5)
+    liberar.set()
+    for h in hilos:
+        h.join(5)
+
+    assert renders == ["Mundo"]
+    assert len(resultados) == 4 and len(set(resultados)) == 1
+
+
+def test_sin_terminos_devuelve_imagen_vacia(monkeypatch, renders):
+    monkeypatch.setattr(wordcloud_service, "frecuencias_terminos", lambda **kwargs: [])
+    cache = CacheWordclouds(ttl=60, maximo=3)
+
+    imagen, etag = cache.obtener(_clave("Sin datos"))
+
+    assert imagen == b""
+    assert etag